@@ -0,0 +1,10 @@
+"""
+Performance measurements for py_units and unit_tree.
+
+Run the suite of hot paths, saving the results for later comparison:
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+
+Or run a single benchmark module from the repository root, for example:
+    python -m benchmarks.memory
+"""
@@ -0,0 +1,74 @@
+"""
+Expressions simplified and evaluated per second - one at a time in this
+process, versus simplify_many / evaluate_many on a pool of processes.
+
+Run with:
+    python -m benchmarks.bulk
+"""
+import argparse
+import os
+import random
+import time
+from typing import List
+
+from unit_tree import Dimension, UnitLeaf, UnitTree, BulkPool, simplify_tree, compile_tree
+
+
+DIMENSIONS = ('kg', 'm', 's', 'A', 'K')
+
+
+def expressions(count: int, leaves: int, distinct: int, seed: int = 0) -> List[UnitTree]:
+    """count products and quotients of Dimensions and small ints, drawn
+    from distinct different expressions - so workers see repeats."""
+    generator = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        tree = UnitLeaf(Dimension(generator.choice(DIMENSIONS)))
+        for _ in range(leaves - 1):
+            if generator.random() < 0.25:
+                operand = UnitLeaf(generator.randint(1, 9))
+            else:
+                operand = UnitLeaf(Dimension(generator.choice(DIMENSIONS)))
+            tree = tree * operand if generator.random() < 0.5 else tree / operand
+        pool.append(tree)
+    return [generator.choice(pool) for _ in range(count)]
+
+
+def rate(function, count: int) -> float:
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def run(count: int, leaves: int, distinct: int, workers: int):
+    trees = expressions(count, leaves, distinct)
+    bindings = {identifier: 2.0 for identifier in DIMENSIONS}
+    name = '{0} workers'.format(workers)
+    with BulkPool(workers) as pool:
+        # Start the workers outside the timing - and before the serial runs,
+        # so they do not inherit its caches
+        pool.simplify_many(expressions(1000, leaves, 1000, seed=1), chunk_bytes=1)
+        results = [
+            ('simplify', 'serial', rate(lambda: [simplify_tree(tree) for tree in trees], count)),
+            ('simplify', name, rate(lambda: pool.simplify_many(trees), count)),
+            ('evaluate', 'serial', rate(lambda: [compile_tree(tree).evaluate(bindings) for tree in trees], count)),
+            ('evaluate', name, rate(lambda: pool.evaluate_many(trees, bindings), count)),
+        ]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000, help="expressions per batch")
+    parser.add_argument('--leaves', type=int, default=4, help="leaves per expression")
+    parser.add_argument('--distinct', type=int, default=100000, help="distinct expressions in the batch")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="processes in the pool")
+    args = parser.parse_args(argv)
+
+    print("{0:<10} {1:<12} {2:>14}".format("operation", "run", "expressions/s"))
+    for operation, name, per_second in run(args.count, args.leaves, args.distinct, args.workers):
+        print("{0:<10} {1:<12} {2:>14,.0f}".format(operation, name, per_second))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Evaluations per second of one formula, walking the UnitTree each time
+versus calling the function from UnitTree.compile().
+
+Run with:
+    python -m benchmarks.compile
+"""
+import argparse
+import timeit
+from typing import Any, Mapping
+
+from unit_tree import Tree, Node, UnitLeaf, Dimension
+
+
+def interpret(tree: Tree, bindings: Mapping[Dimension, Any]) -> Any:
+    """The uncompiled baseline: walk the tree, dispatching on each node."""
+    if isinstance(tree, Node):
+        return tree.value.value.operator(
+            interpret(tree.left, bindings), interpret(tree.right, bindings)
+        )
+    elif isinstance(tree.value, Dimension):
+        return bindings[tree.value]
+    else:
+        return tree.value
+
+
+def formula() -> Tree:
+    """Kinetic plus potential energy"""
+    kg, meters, seconds = (
+        UnitLeaf(Dimension(name)) for name in ('kg', 'meters', 'seconds')
+    )
+    speed = meters / seconds
+    gravity = 9.81 * meters / (seconds * seconds)
+    return 0.5 * kg * speed * speed + kg * gravity * meters
+
+
+def run(number: int):
+    tree = formula()
+    compiled = tree.compile()
+    bindings = dict(zip(compiled.parameters, (2.0, 3.0, 4.0)))
+    args = tuple(bindings[dimension] for dimension in compiled.parameters)
+    assert interpret(tree, bindings) == compiled(*args)
+    return {
+        'interpreted': number / timeit.timeit(lambda: interpret(tree, bindings), number=number),
+        'compiled': number / timeit.timeit(lambda: compiled(*args), number=number),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000,
+                        help="evaluations to time")
+    args = parser.parse_args(argv)
+
+    results = run(args.number)
+    for name, rate in results.items():
+        print("{0:<12} {1:>12,.0f} ops/s".format(name, rate))
+    print("{0:<12} {1:>12.1f}x".format(
+        "speedup", results['compiled'] / results['interpreted']))
+
+
+if __name__ == '__main__':
+    main()
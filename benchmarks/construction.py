@@ -0,0 +1,46 @@
+"""
+Cost per node of building UnitTree nodes - through TreeMeta.__call__ and
+Node.__init__, versus the fast internal constructors.
+
+Run with:
+    python -m benchmarks.construction
+"""
+import argparse
+import operator
+import timeit
+from typing import Callable, List, Tuple
+
+from unit_tree import UnitLeaf, UnitNode, TreeFunction, Multiply
+
+
+def cases() -> List[Tuple[str, Callable[[], object]]]:
+    leaf = UnitLeaf(2)
+    return [
+        ('UnitNode(...)', lambda: UnitNode(leaf, leaf, leaf)),
+        ('UnitNode._make(...)', lambda: UnitNode._make(leaf, leaf, leaf)),
+        # What 'leaf * leaf' did before: look up the operator, then construct
+        ('operator, checked', lambda: UnitNode(TreeFunction.lift(operator.__mul__), leaf, leaf)),
+        ('leaf * leaf', lambda: leaf * leaf),
+        ('leaf * 3', lambda: leaf * 3),
+        ('Multiply(leaf, leaf)', lambda: Multiply(leaf, leaf)),
+    ]
+
+
+def run(number: int):
+    return [
+        (name, timeit.timeit(build, number=number) / number * 1e9)
+        for name, build in cases()
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000, help="nodes to build")
+    args = parser.parse_args(argv)
+
+    for name, nanoseconds in run(args.number):
+        print("{0:<24} {1:>10,.0f} ns/node".format(name, nanoseconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Checks per second for unit_tree.meets - resolving the handler on every
+call (the uncached path), through its cached compiled predicate, with
+cached results - and for calling the predicate from compile_type directly.
+
+Run with:
+    python -m benchmarks.meets
+"""
+import argparse
+import timeit
+from numbers import Number
+from typing import Optional, Union
+
+from unit_tree import Dimension
+from unit_tree.meets import (
+    meets, cache_results, clear_caches, compile_type, _handle_as_type, _registry
+)
+
+
+def uncached_meets(instance, _type):
+    """meets, as it was before handlers were cached and compiled."""
+    handle = _handle_as_type(_type)
+    if hasattr(handle, '__meets__'):
+        return handle.__meets__(instance, _type)
+    elif handle is Union:
+        return any(uncached_meets(instance, component) for component in _type.__args__)
+    elif handle in _registry:
+        return _registry[handle](instance, _type)
+    else:
+        return isinstance(instance, _type)
+
+
+def cases():
+    return [
+        ('int', 3, int),
+        ('Union', 'x', Union[Number, list, str]),
+        ('Optional', None, Optional[int]),
+        ('Dimension', Dimension('feet'), Union[Number, Dimension]),
+    ]
+
+
+def run(number: int):
+    results = []
+    for name, instance, _type in cases():
+        rates = {}
+        rates['uncached'] = number / timeit.timeit(
+            lambda: uncached_meets(instance, _type), number=number)
+        clear_caches()
+        rates['meets'] = number / timeit.timeit(
+            lambda: meets(instance, _type), number=number)
+        cache_results()
+        try:
+            rates['results'] = number / timeit.timeit(
+                lambda: meets(instance, _type), number=number)
+        finally:
+            cache_results(False)
+        predicate = compile_type(_type)
+        rates['compiled'] = number / timeit.timeit(
+            lambda: predicate(instance), number=number)
+        results.append((name, rates))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000, help="checks to time")
+    args = parser.parse_args(argv)
+
+    columns = ('uncached', 'meets', 'results', 'compiled')
+    print("{0:<10}".format("type") + "".join(
+        "{0:>14}".format(column + "/s") for column in columns))
+    for name, rates in run(args.number):
+        print("{0:<10}".format(name) + "".join(
+            "{0:>14,.0f}".format(rates[column]) for column in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Bytes per node, of each of the tree classes - as allocated, so including
+the boxes of any int values - now, and before the classes were slotted.
+
+The before figures are measured by running this same module against the
+tree as of BEFORE - the last revision whose node classes carried a
+per-instance __dict__ - exported with git archive into a temporary
+directory, in a subprocess.
+
+Run with:
+    python -m benchmarks.memory
+    python -m benchmarks.memory --before <revision>
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from unit_tree import Leaf, Node, UnitLeaf, Dimension
+from py_units import Scalar, DimensionNode, UnitsFunctionStem, Multiply
+
+
+# Parent of the commit which slotted the node classes
+BEFORE = '738c373aefde9f5cc06776e77d88351e773293b6'
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bytes_per_node(build: Callable[[int], object], count: int) -> float:
+    """Average traced allocation for one node, over 'count' live nodes."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        nodes = [build(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Discount the list holding the nodes
+    return (after - before - count * 8) / count
+
+
+def cases() -> List[Tuple[str, Callable[[int], object]]]:
+    """(name, builder of one node) - through the public constructors, which
+    the revision before the slots has as well."""
+    leaf, feet = Leaf(0), Dimension('feet')
+    return [
+        ('Leaf', lambda i: Leaf(i)),
+        ('Node', lambda i: Node(leaf, leaf, leaf)),
+        ('UnitLeaf', lambda i: UnitLeaf(i)),
+        ('Scalar', lambda i: Scalar(i)),
+        ('DimensionNode', lambda i: DimensionNode(feet, i)),
+        ('UnitsFunctionStem', lambda i: UnitsFunctionStem(None, Multiply, None, None)),
+    ]
+
+
+def measure(count: int) -> Dict[str, float]:
+    """Bytes per node of each case, with the classes imported here."""
+    return {name: bytes_per_node(build, count) for name, build in cases()}
+
+
+def measure_revision(revision: str, count: int) -> Dict[str, float]:
+    """Bytes per node of each case, with the classes of revision - run in a
+    subprocess, from an export of the tree at revision."""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = subprocess.run(
+            ['git', 'archive', revision], cwd=ROOT, stdout=subprocess.PIPE, check=True)
+        subprocess.run(['tar', '-x', '-C', directory], input=archive.stdout, check=True)
+        environment = dict(os.environ, PYTHONPATH=directory)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--json', '--count', str(count)],
+            cwd=directory, env=environment, stdout=subprocess.PIPE, check=True,
+            universal_newlines=True)
+    return json.loads(output.stdout)
+
+
+def run(count: int, before: Optional[str] = BEFORE) -> List[Dict]:
+    after = measure(count)
+    previous = measure_revision(before, count) if before else {}
+    return [{'name': name, 'after': after[name], 'before': previous.get(name)} for name in after]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000,
+                        help="number of live nodes to measure over")
+    parser.add_argument('--before', default=BEFORE,
+                        help="git revision to compare with - '' for none")
+    parser.add_argument('--json', action='store_true',
+                        help="print bytes per node of this tree only, as JSON")
+    args = parser.parse_args(argv)
+
+    if args.json:
+        print(json.dumps(measure(args.count)))
+        return
+    print("{0:<20} {1:>10} {2:>10} {3:>8}".format("class", "before B", "after B", "saved"))
+    for result in run(args.count, args.before):
+        before, after = result['before'], result['after']
+        if before is None:
+            print("{0:<20} {1:>10} {2:>10.1f}".format(result['name'], '-', after))
+        else:
+            print("{0:<20} {1:>10.1f} {2:>10.1f} {3:>7.0%}".format(
+                result['name'], before, after, 1 - after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Unit expressions parsed per second, for both packages - every time through
+the tokenizer and parser, versus through the LRU cache - beside building the
+same tree with Python operators.
+
+Run with:
+    python -m benchmarks.parse
+"""
+import argparse
+import timeit
+
+import py_units
+import py_units.parser
+import unit_tree
+import unit_tree.parser
+from unit_parser import Parser
+from unit_tree import UnitLeaf
+
+
+EXPRESSIONS = ('kg*m/s^2', 'N·m / (s^2)', 'J/(kg*K)', '(m/s)^2')
+
+
+def by_operators():
+    """kg*m/s^2, as user code builds it today"""
+    kg, m, s = (UnitLeaf(unit_tree.Dimension(name)) for name in ('kg', 'm', 's'))
+    return kg * m / (s * s)
+
+
+def run(number: int):
+    results = []
+    for package, module in (('unit_tree', unit_tree.parser), ('py_units', py_units.parser)):
+        for text in EXPRESSIONS:
+            module.parse_unit(text)
+            results.append((
+                package, text,
+                number / timeit.timeit(lambda: Parser(text, module._builder).parse(), number=number),
+                number / timeit.timeit(lambda: module.parse_unit(text), number=number),
+            ))
+    results.append((
+        'unit_tree', 'operators', number / timeit.timeit(by_operators, number=number), None
+    ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help="parses to time")
+    args = parser.parse_args(argv)
+
+    print("{0:<10} {1:<14} {2:>14} {3:>14}".format("package", "expression", "uncached/s", "cached/s"))
+    for package, text, uncached, cached in run(args.number):
+        print("{0:<10} {1:<14} {2:>14,.0f} {3:>14}".format(
+            package, text, uncached, "" if cached is None else "{0:,.0f}".format(cached)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Operations per second of py_units Scalar arithmetic, through the fast path
+versus the general path through InvariantFunctor.bind.
+
+Run with:
+    python -m benchmarks.scalar
+"""
+import argparse
+import timeit
+
+from py_units import Scalar
+from py_units.syntax import ArithmeticSyntaxMixin
+
+
+def cases():
+    """(name, fast operation, general operation)"""
+    a, b = Scalar(3), Scalar(4)
+    return [
+        ('Scalar * Scalar', lambda: a * b, lambda: ArithmeticSyntaxMixin.__mul__(a, b)),
+        ('Scalar + int', lambda: a + 4, lambda: ArithmeticSyntaxMixin.__add__(a, 4)),
+        ('Scalar / float', lambda: a / 2.5, lambda: ArithmeticSyntaxMixin.__truediv__(a, 2.5)),
+        ('int - Scalar', lambda: 4 - a, lambda: ArithmeticSyntaxMixin.__rsub__(a, 4)),
+        ('chain of 4', lambda: a * b + 1 - a / 2,
+         lambda: ArithmeticSyntaxMixin.__sub__(
+             ArithmeticSyntaxMixin.__add__(ArithmeticSyntaxMixin.__mul__(a, b), 1),
+             ArithmeticSyntaxMixin.__truediv__(a, 2))),
+    ]
+
+
+def run(number: int):
+    results = []
+    for name, fast, general in cases():
+        results.append((
+            name,
+            number / timeit.timeit(fast, number=number),
+            number / timeit.timeit(general, number=number),
+        ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000, help="operations to time")
+    args = parser.parse_args(argv)
+
+    print("{0:<18} {1:>14} {2:>14} {3:>8}".format("case", "fast/s", "functor/s", "speedup"))
+    for name, fast, general in run(args.number):
+        print("{0:<18} {1:>14,.0f} {2:>14,.0f} {3:>7.1f}x".format(name, fast, general, fast / general))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+Time and memory against tree size, for construction, traversal, equality,
+repr and simplification in both packages - to show which operations
+degrade faster than linearly, or fail on deep trees.
+
+Run with:
+    python -m benchmarks.scaling --largest 100000 --balance 0.0
+    python -m benchmarks.scaling --output scaling.json --plot scaling.png
+
+The 'slope' column is the exponent of n between successive sizes: about
+1.0 for a linear operation, 2.0 for a quadratic one.
+"""
+import argparse
+import json
+import math
+import time
+import tracemalloc
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional
+
+import py_units
+from py_units.cache import structural_key
+from py_units.simplify import depth_first_iterator
+from unit_tree import Simplifier
+from unit_tree.support import dfs
+
+from .workloads import Workload, sizes
+
+try:
+    # Only needed for --plot
+    import matplotlib
+except ImportError:
+    matplotlib = None
+
+
+# setup(workload) builds what the operation needs, untimed;
+# operation(state) is then timed
+Operation = namedtuple('Operation', ['package', 'name', 'setup', 'operation'])
+
+
+def _build_twice(build: Callable[[Workload], Any]) -> Callable[[Workload], Any]:
+    return lambda workload: (build(workload), build(workload))
+
+
+OPERATIONS = (
+    Operation('unit_tree', 'construct', lambda workload: workload, Workload.unit_tree),
+    Operation('unit_tree', 'dfs', Workload.unit_tree, lambda tree: sum(1 for _ in dfs(tree))),
+    Operation('unit_tree', 'equal', _build_twice(Workload.unit_tree), lambda pair: pair[0] == pair[1]),
+    Operation('unit_tree', 'repr', Workload.unit_tree, repr),
+    Operation('unit_tree', 'simplify', Workload.unit_tree, lambda tree: Simplifier().simplify(tree)),
+    Operation('py_units', 'construct', lambda workload: workload, Workload.py_units),
+    Operation('py_units', 'dfs', Workload.py_units,
+              lambda root: sum(1 for _ in depth_first_iterator(root))),
+    Operation('py_units', 'equal', _build_twice(Workload.py_units),
+              lambda pair: structural_key(pair[0]) == structural_key(pair[1])),
+    Operation('py_units', 'repr', Workload.py_units, str),
+    # Simplification edits the tree in place, so each call needs a new one
+    Operation('py_units', 'simplify', Workload.py_units,
+              lambda root: py_units.simplify_tree(root, cache=None)),
+)
+
+
+def seconds_per_call(operation: Operation, workload: Workload, min_time: float) -> float:
+    """Mean over as many calls as fit in min_time - at least one - with a
+    fresh setup for each call."""
+    total, calls = 0.0, 0
+    while total < min_time or not calls:
+        state = operation.setup(workload)
+        start = time.perf_counter()
+        operation.operation(state)
+        total += time.perf_counter() - start
+        calls += 1
+    return total / calls
+
+
+def peak_bytes(operation: Operation, workload: Workload) -> int:
+    """Peak traced allocation of one call, above what setup left live."""
+    state = operation.setup(workload)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        operation.operation(state)
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+def run(workloads: List[Workload], operations=OPERATIONS, min_time: float = 0.1,
+        budget: float = 10.0, memory: bool = True) -> List[Dict]:
+    """One row per operation and workload, in order of size.
+
+    An operation which fails - a RecursionError on a deep tree, say - is
+    recorded with its error. Once an operation fails, or one call of it
+    takes longer than budget seconds, it is skipped for larger workloads.
+    """
+    rows = []
+    stopped = {}  # type: Dict[Operation, str]
+    for workload in sorted(workloads, key=lambda workload: workload.size):
+        for operation in operations:
+            row = {
+                'package': operation.package, 'operation': operation.name,
+                'size': workload.size, 'depth': workload.depth,
+                'seconds': None, 'peak_bytes': None, 'error': stopped.get(operation),
+            }
+            rows.append(row)
+            if row['error'] is not None:
+                continue
+            try:
+                row['seconds'] = seconds_per_call(operation, workload, min_time)
+                if memory:
+                    row['peak_bytes'] = peak_bytes(operation, workload)
+            except (RecursionError, MemoryError) as error:
+                row['error'] = stopped[operation] = error.__class__.__name__
+                continue
+            if row['seconds'] > budget:
+                stopped[operation] = 'skipped'
+    return rows
+
+
+def slopes(rows: List[Dict]) -> List[Optional[float]]:
+    """For each row, the exponent of n since the previous size of the same
+    operation: log(t2 / t1) / log(n2 / n1)"""
+    previous = {}
+    result = []
+    for row in rows:
+        key = (row['package'], row['operation'])
+        before = previous.get(key)
+        if before and row['seconds'] and before['size'] != row['size']:
+            result.append(
+                math.log(row['seconds'] / before['seconds'])
+                / math.log(row['size'] / before['size'])
+            )
+        else:
+            result.append(None)
+        if row['seconds']:
+            previous[key] = row
+    return result
+
+
+def report(rows: List[Dict]):
+    print("{0:<10} {1:<10} {2:>9} {3:>9} {4:>12} {5:>7} {6:>14}".format(
+        "package", "operation", "n", "depth", "us/call", "slope", "peak B"))
+    for row, slope in zip(rows, slopes(rows)):
+        print("{0:<10} {1:<10} {2:>9,} {3:>9,} {4:>12} {5:>7} {6:>14}".format(
+            row['package'], row['operation'], row['size'], row['depth'],
+            row['error'] or "{0:,.1f}".format(row['seconds'] * 1e6),
+            "" if slope is None else "{0:.2f}".format(slope),
+            "" if row['peak_bytes'] is None else "{0:,}".format(row['peak_bytes']),
+        ))
+
+
+def plot(rows: List[Dict], path: str):
+    """Log-log time against n, one line per operation.
+    Requires the optional dependency matplotlib."""
+    matplotlib.use('Agg')
+    from matplotlib import pyplot
+
+    figure, axes = pyplot.subplots()
+    lines = {}  # type: Dict[str, List[Dict]]
+    for row in rows:
+        if row['seconds'] is not None:
+            lines.setdefault("{0}.{1}".format(row['package'], row['operation']), []).append(row)
+    for label, points in sorted(lines.items()):
+        axes.loglog([row['size'] for row in points], [row['seconds'] for row in points],
+                    marker='o', label=label)
+    axes.set_xlabel("nodes")
+    axes.set_ylabel("seconds per call")
+    axes.legend(fontsize='small')
+    figure.savefig(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--smallest', type=int, default=10, help="fewest nodes")
+    parser.add_argument('--largest', type=int, default=10000, help="most nodes (up to 10**6)")
+    parser.add_argument('--per-decade', type=int, default=1, help="sizes per factor of 10")
+    parser.add_argument('--balance', type=float, default=0.5,
+                        help="0.0 for a left-deep chain ... 1.0 for a balanced tree")
+    parser.add_argument('--dimensions', type=int, default=3, help="distinct Dimensions in the leaves")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', action='append',
+                        help="run only operations whose 'package.name' contains this (repeatable)")
+    parser.add_argument('--min-time', type=float, default=0.1, help="seconds to time each point for")
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help="seconds for one call, after which larger sizes are skipped")
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help="skip the (slow) tracemalloc measurement")
+    parser.add_argument('--output', help="write the rows to this JSON file")
+    parser.add_argument('--plot', help="save a log-log plot to this file (needs matplotlib)")
+    args = parser.parse_args(argv)
+    if args.plot and matplotlib is None:
+        parser.error("--plot requires matplotlib")
+
+    workloads = [
+        Workload(size, args.balance, args.dimensions, args.seed)
+        for size in sizes(args.smallest, args.largest, args.per_decade)
+    ]
+    operations = [
+        operation for operation in OPERATIONS
+        if not args.only or any(
+            name in "{0}.{1}".format(operation.package, operation.name) for name in args.only)
+    ]
+    rows = run(workloads, operations, args.min_time, args.budget, args.memory)
+    report(rows)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'workload': {'balance': args.balance, 'dimensions': args.dimensions,
+                                    'seed': args.seed},
+                       'rows': rows}, file, indent=2)
+    if args.plot:
+        plot(rows, args.plot)
+
+
+if __name__ == '__main__':
+    main()
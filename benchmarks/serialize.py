@@ -0,0 +1,66 @@
+"""
+Bytes per node, and nodes encoded and decoded per second, of the binary
+encoding of both packages, beside pickle.
+
+Run with:
+    python -m benchmarks.serialize
+"""
+import argparse
+import pickle
+import timeit
+
+import py_units.serialize
+import unit_tree.serialize
+from benchmarks.workloads import Workload
+
+
+FORMATS = (
+    ('binary', None),
+    ('pickle', (lambda tree: pickle.dumps(tree, pickle.HIGHEST_PROTOCOL), pickle.loads)),
+)
+
+
+def run(size: int, number: int, balance: float, dimensions: int):
+    workload = Workload(size, balance, dimensions)
+    results = []
+    for package, tree, module in (
+            ('unit_tree', workload.unit_tree(), unit_tree.serialize),
+            ('py_units', workload.py_units(), py_units.serialize)):
+        for name, functions in FORMATS:
+            encode, decode = functions or (module.encode_tree, module.decode_tree)
+            try:
+                data = encode(tree)
+                decode(data)
+            except Exception as error:
+                # pickle recurses, so fails on deep trees - and may not
+                # round-trip a class at all
+                results.append((package, name, error.__class__.__name__, None, None))
+                continue
+            results.append((
+                package, name,
+                len(data) / size,
+                number * size / timeit.timeit(lambda: encode(tree), number=number),
+                number * size / timeit.timeit(lambda: decode(data), number=number),
+            ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10001, help="nodes in the tree")
+    parser.add_argument('--number', type=int, default=20, help="round trips to time")
+    parser.add_argument('--balance', type=float, default=1.0, help="0.0 left-deep ... 1.0 balanced")
+    parser.add_argument('--dimensions', type=int, default=3, help="distinct Dimensions in the leaves")
+    args = parser.parse_args(argv)
+
+    print("{0:<10} {1:<8} {2:>10} {3:>14} {4:>14}".format(
+        "package", "format", "bytes/node", "encode nodes/s", "decode nodes/s"))
+    for package, name, size, encode, decode in run(args.size, args.number, args.balance, args.dimensions):
+        if isinstance(size, str):
+            print("{0:<10} {1:<8} {2}".format(package, name, size))
+        else:
+            print("{0:<10} {1:<8} {2:>10.2f} {3:>14,.0f} {4:>14,.0f}".format(package, name, size, encode, decode))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Trees simplified per second by the unit_tree Simplifier, and how often each
+law's predicate accepted or rejected the nodes it was indexed for.
+
+Run with:
+    python -m benchmarks.simplify
+"""
+import argparse
+import timeit
+
+from unit_tree import UnitLeaf, Dimension, Simplifier
+from unit_tree.simplify import LAWS
+
+
+def formula(terms: int):
+    feet, seconds = UnitLeaf(Dimension('feet')), UnitLeaf(Dimension('seconds'))
+    tree = feet / seconds
+    for i in range(terms):
+        tree = tree + (UnitLeaf(i) * 2 + 0) * feet / (seconds * 1)
+    return tree
+
+
+def run(number: int, terms: int):
+    tree = formula(terms)
+    # Uncached, so every run does the work
+    simplifier = Simplifier(LAWS)
+    seconds = timeit.timeit(lambda: simplifier.simplify(tree), number=number)
+    return number / seconds, simplifier.statistics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200, help="trees to simplify")
+    parser.add_argument('--terms', type=int, default=50, help="terms in each tree")
+    args = parser.parse_args(argv)
+
+    rate, statistics = run(args.number, args.terms)
+    print("{0:,.0f} trees/s".format(rate))
+    for law, counts in statistics.items():
+        print("    {0:<24} {1:>10,} hits {2:>10,} misses".format(
+            law.__name__, counts.hits, counts.misses))
+
+
+if __name__ == '__main__':
+    main()
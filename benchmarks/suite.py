@@ -0,0 +1,244 @@
+"""
+Operations per second and peak traced memory for the hot paths of py_units
+and unit_tree, saved as JSON so that runs can be compared for regressions.
+
+Run with:
+    python -m benchmarks --output before.json
+    python -m benchmarks --compare before.json
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections import namedtuple
+from numbers import Number
+from typing import Callable, Dict, List, Optional, Union
+
+import py_units
+import py_units.dimension
+from py_units.arithmetic import UnitsFunctionStem, Add
+import unit_tree
+from unit_tree import UnitLeaf, UnitNode, Multiply, Tree, Simplifier
+from unit_tree.meets import meets
+from unit_tree.support import bfs, dfs
+
+from .simplify import formula
+
+
+# prepare() builds the case's data, and returns the operation to time
+Case = namedtuple('Case', ['name', 'prepare'])
+Result = namedtuple('Result', ['name', 'ops_per_sec', 'peak_bytes'])
+
+
+def _scalar_arithmetic():
+    a, b = py_units.Scalar(2), py_units.Scalar(3)
+    return lambda: a * b + 3
+
+
+def _py_units_dimension_lookup():
+    Dimension = py_units.dimension.Dimension
+    Dimension('feet')
+    return lambda: Dimension('feet')
+
+
+def _unit_tree_dimension_lookup():
+    Dimension = unit_tree.Dimension
+    Dimension('feet')
+    return lambda: Dimension('feet')
+
+
+def _construct_operator():
+    a, b = UnitLeaf(2), UnitLeaf(unit_tree.Dimension('feet'))
+    return lambda: a * b
+
+
+def _construct_checked():
+    a, b = UnitLeaf(2), UnitLeaf(unit_tree.Dimension('feet'))
+    return lambda: UnitNode(Multiply, a, b)
+
+
+def _tree_map():
+    tree = formula(20)
+    return lambda: Tree.map(tree, str)
+
+
+def _tree_fold():
+    tree = formula(20)
+    return lambda: Tree.fold(tree, lambda value, count: count + 1, 0)
+
+
+def _tree_join():
+    tree = formula(20)
+    return lambda: Tree.join(tree)
+
+
+def _bfs():
+    tree = formula(20)
+    return lambda: list(bfs(tree))
+
+
+def _dfs():
+    tree = formula(20)
+    return lambda: list(dfs(tree))
+
+
+def _meets():
+    _type = Union[Number, unit_tree.Dimension]
+    instance = unit_tree.Dimension('feet')
+    return lambda: meets(instance, _type)
+
+
+def _unit_tree_simplify():
+    tree, simplifier = formula(20), Simplifier()
+    return lambda: simplifier.simplify(tree)
+
+
+def _py_units_simplify():
+    Scalar = py_units.Scalar
+
+    def operation():
+        # py_units simplifies in place, so each operation builds its tree
+        root = Scalar(1)
+        for _ in range(20):
+            stem = UnitsFunctionStem(None, Add, root, Scalar(1))
+            root.parent = stem.right.parent = stem
+            root = stem
+        return py_units.simplify_tree(root, cache=None)
+    return operation
+
+
+CASES = (
+    Case('py_units.scalar_arithmetic', _scalar_arithmetic),
+    Case('py_units.dimension_lookup', _py_units_dimension_lookup),
+    Case('py_units.simplify', _py_units_simplify),
+    Case('unit_tree.dimension_lookup', _unit_tree_dimension_lookup),
+    Case('unit_tree.construct_operator', _construct_operator),
+    Case('unit_tree.construct_checked', _construct_checked),
+    Case('unit_tree.map', _tree_map),
+    Case('unit_tree.fold', _tree_fold),
+    Case('unit_tree.join', _tree_join),
+    Case('unit_tree.bfs', _bfs),
+    Case('unit_tree.dfs', _dfs),
+    Case('unit_tree.meets', _meets),
+    Case('unit_tree.simplify', _unit_tree_simplify),
+)
+
+
+# Calls traced for the memory peak - enough to include any garbage left over
+# from one call to the next
+MEMORY_CALLS = 10
+
+
+def peak_bytes(operation: Callable[[], object], number: int) -> int:
+    """Peak traced allocation above the starting point, over 'number' calls.
+    Measured apart from the timing, as tracing slows every allocation."""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(number):
+            operation()
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case: Case, number: Optional[int], repeat: int) -> Result:
+    operation = case.prepare()
+    timer = timeit.Timer(operation)
+    if number is None:
+        # Enough calls to take at least 0.2s - cases differ by 1000x in cost
+        number = timer.autorange()[0]
+    # Best of 'repeat' - the fastest run has the least interference
+    seconds = min(timer.repeat(number=number, repeat=repeat))
+    return Result(case.name, number / seconds, peak_bytes(operation, MEMORY_CALLS))
+
+
+def run(number: Optional[int] = None, repeat: int = 3,
+        only: Optional[List[str]] = None) -> List[Result]:
+    return [
+        measure(case, number, repeat) for case in CASES
+        if not only or any(name in case.name for name in only)
+    ]
+
+
+def to_json(results: List[Result], repeat: int) -> Dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': {
+            result.name: {'ops_per_sec': result.ops_per_sec, 'peak_bytes': result.peak_bytes}
+            for result in results
+        },
+    }
+
+
+def compare(results: List[Result], baseline: Dict, tolerance: float) -> List[str]:
+    """Names of the cases which regressed against baseline by more than
+    tolerance - fewer ops/sec, or a higher memory peak."""
+    regressions = []
+    for result in results:
+        before = baseline['results'].get(result.name)
+        if before is None:
+            continue
+        slower = result.ops_per_sec < before['ops_per_sec'] * (1 - tolerance)
+        larger = result.peak_bytes > before['peak_bytes'] * (1 + tolerance)
+        if slower or larger:
+            regressions.append(result.name)
+    return regressions
+
+
+def _change(after: float, before: float) -> str:
+    return "{0:+.1%}".format(after / before - 1) if before else "n/a"
+
+
+def report(results: List[Result], baseline: Optional[Dict] = None,
+           regressions: List[str] = ()):
+    print("{0:<30} {1:>14} {2:>12}".format("case", "ops/s", "peak B"), end='')
+    print("{0:>10} {1:>10}".format("ops", "memory") if baseline else "")
+    for result in results:
+        print("{0:<30} {1:>14,.0f} {2:>12,}".format(
+            result.name, result.ops_per_sec, result.peak_bytes), end='')
+        before = baseline and baseline['results'].get(result.name)
+        if before:
+            print("{0:>10} {1:>10}{2}".format(
+                _change(result.ops_per_sec, before['ops_per_sec']),
+                _change(result.peak_bytes, before['peak_bytes']),
+                "  REGRESSION" if result.name in regressions else ""))
+        else:
+            print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int,
+                        help="operations per timing (default: enough to take 0.2s)")
+    parser.add_argument('--repeat', type=int, default=3, help="timings per case, best is kept")
+    parser.add_argument('--only', action='append',
+                        help="run only cases whose name contains this (repeatable)")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON file from an earlier run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="fractional change allowed before a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat, args.only)
+    baseline, regressions = None, []
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+    report(results, baseline, regressions)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(to_json(results, args.repeat), file, indent=2, sort_keys=True)
+    # Non-zero exit status, so that a regression can fail a CI job
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
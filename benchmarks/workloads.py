@@ -0,0 +1,139 @@
+"""
+Random trees of controlled shape, for measuring how operations scale.
+
+A Workload describes a tree - how many nodes, how balanced, and how many
+distinct Dimensions its leaves draw on - and builds it for either package:
+
+    workload = Workload(size=1000, balance=0.0, dimensions=3, seed=1)
+    tree = workload.unit_tree()     # left-deep UnitTree of 999 nodes
+    root = workload.py_units()      # the same tree, as py_units stems
+
+balance runs from 0.0 - a left-deep chain, whose depth is the number of
+leaves - to 1.0 - a balanced tree, whose depth is log2 of it. A workload
+is deterministic: the same parameters always build the same tree.
+"""
+import random
+from collections import namedtuple
+from typing import Iterator, List, Tuple
+
+import py_units
+import py_units.dimension
+from py_units.arithmetic import UnitsFunctionStem
+import unit_tree
+from unit_tree import UnitLeaf
+
+
+# Operators, in the same order for both packages
+_UNIT_TREE_FUNCTIONS = (unit_tree.Add, unit_tree.Subtract, unit_tree.Multiply, unit_tree.Divide)
+_PY_UNITS_FUNCTIONS = (
+    py_units.arithmetic.Add, py_units.arithmetic.Subtract, py_units.Multiply, py_units.Divide
+)
+
+# Leaf as drawn from the random generator: ('dimension', index) or ('scalar', value)
+_LeafSpec = Tuple[str, int]
+
+
+class Workload(namedtuple('Workload', ['size', 'balance', 'dimensions', 'seed'])):
+    """
+    size - total number of nodes, leaves included; as every node has two
+        children, an even size builds one node fewer
+    balance - 0.0 for a left-deep chain ... 1.0 for a balanced tree
+    dimensions - number of distinct Dimensions the leaves are drawn from;
+        0 builds a tree of scalars only
+    seed - for the random choice of leaves and operators
+    """
+    __slots__ = ()
+
+    def __new__(cls, size: int, balance: float = 0.5, dimensions: int = 3, seed: int = 0):
+        if size < 1:
+            raise ValueError("size must be at least 1, not {0}".format(size))
+        if not 0.0 <= balance <= 1.0:
+            raise ValueError("balance must be between 0.0 and 1.0, not {0}".format(balance))
+        return super().__new__(cls, size, balance, dimensions, seed)
+
+    @property
+    def leaves(self) -> int:
+        return (self.size + 1) // 2
+
+    @property
+    def depth(self) -> int:
+        """Nodes on the longest path from the root to a leaf."""
+        # The left subtree is never the smaller, so the longest path runs left
+        depth, leaves = 1, self.leaves
+        while leaves > 1:
+            depth, leaves = depth + 1, self.split(leaves)
+        return depth
+
+    def split(self, leaves: int) -> int:
+        """Leaves of the left subtree, out of a subtree of 'leaves'."""
+        chain = leaves - 1
+        balanced = leaves // 2
+        return max(1, round(chain + (balanced - chain) * self.balance))
+
+    def shape(self) -> Iterator[object]:
+        """Post-order instructions to build the tree: a _LeafSpec for each
+        leaf, and for each node the index of its operator - the node takes
+        the last two results as its children.
+        Generated from an explicit stack, so any depth can be built."""
+        generator = random.Random(self.seed)
+        stack = [(self.leaves, False)]
+        while stack:
+            leaves, expanded = stack.pop()
+            if expanded:
+                yield generator.randrange(len(_UNIT_TREE_FUNCTIONS))
+            elif leaves == 1:
+                yield self._leaf(generator)
+            else:
+                left = self.split(leaves)
+                stack.append((leaves, True))
+                stack.append((leaves - left, False))
+                stack.append((left, False))
+
+    def _leaf(self, generator: random.Random) -> _LeafSpec:
+        if self.dimensions and generator.random() < 0.5:
+            return ('dimension', generator.randrange(self.dimensions))
+        # From 1, so no scalar division is by zero
+        return ('scalar', generator.randint(1, 9))
+
+    def unit_tree(self) -> unit_tree.UnitTree:
+        """Built through the TreeFunctions, as user code would."""
+        dimensions = [unit_tree.Dimension('d{0}'.format(i)) for i in range(self.dimensions)]
+        results = []  # type: List[unit_tree.UnitTree]
+        for step in self.shape():
+            if isinstance(step, tuple):
+                kind, value = step
+                results.append(UnitLeaf(dimensions[value] if kind == 'dimension' else value))
+                continue
+            right, left = results.pop(), results.pop()
+            results.append(_UNIT_TREE_FUNCTIONS[step](left, right))
+        return results.pop()
+
+    def py_units(self) -> py_units.Unit:
+        """Root of a tree of py_units stems, with parents linked."""
+        Dimension = py_units.dimension.Dimension
+        dimensions = [Dimension('d{0}'.format(i)) for i in range(self.dimensions)]
+        results = []  # type: List[py_units.Unit]
+        for step in self.shape():
+            if isinstance(step, tuple):
+                kind, value = step
+                results.append(
+                    py_units.DimensionNode(dimensions[value], 1) if kind == 'dimension'
+                    else py_units.Scalar(value)
+                )
+                continue
+            right, left = results.pop(), results.pop()
+            stem = UnitsFunctionStem(None, _PY_UNITS_FUNCTIONS[step], left, right)
+            left.parent = right.parent = stem
+            results.append(stem)
+        return results.pop()
+
+
+def sizes(smallest: int = 10, largest: int = 10 ** 6, per_decade: int = 1) -> List[int]:
+    """Sizes spaced evenly on a log scale: sizes(10, 1000) == [10, 100, 1000]"""
+    result = []
+    step = 10 ** (1 / per_decade)
+    size = float(smallest)
+    while round(size) <= largest:
+        result.append(int(round(size)))
+        size *= step
+    return result
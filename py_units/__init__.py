@@ -8,7 +8,11 @@ from .arithmetic import (
     UnitsFunction, Multiply, Divide, UnitsFunctionStem
 )
 from .functor import Functor, InvariantFunctor
-from .meets import meets
+from .vector import DimensionVector
+from .cache import SimplificationCache
+from .simplify import simplify_tree, resimplify
+from .parser import parse_unit
+from .serialize import encode_tree, decode_tree
 
 __all__ = (
     UnitsError,
@@ -29,5 +33,19 @@ __all__ = (
     Multiply,
     Divide,
     UnitsFunctionStem,
-    meets
+    DimensionVector,
+    SimplificationCache,
+    simplify_tree,
+    resimplify,
+    parse_unit,
+    encode_tree,
+    decode_tree
 )
+
+try:
+    # ScalarArray requires the optional dependency NumPy
+    from .arrays import NDArrayScalarArrayInvariantFunctor, ScalarArray
+except ImportError:
+    pass
+else:
+    __all__ += (NDArrayScalarArrayInvariantFunctor, ScalarArray)
@@ -1,6 +1,7 @@
 import operator
+from typing import Union
 
-from .base import OperatorLookupError
+from .base import OperatorLookupError, UnitMeta
 from .units import Unit, UnitsStem, DimensionNode, Scalar
 
 
@@ -18,11 +19,18 @@ class UnitsFunctionStem(UnitsStem):
 
     Needs to pick up the simplification rules for multiplying and dividing
     """
+    __slots__ = ('parent', 'units_function', 'left', 'right')
     parent: UnitsStem
     units_function: UnitsFunction
     left: Unit
     right: Unit
 
+    @classmethod
+    def __call__(cls, *args):
+        self = object.__new__(cls)
+        self.__init__(*args)
+        return self
+
     def __init__(self, parent: Union[Unit, None],
                  units_function: UnitsFunction, left: Unit, right: Unit):
         self.parent = parent
@@ -47,6 +55,7 @@ operator_registry = {}
 
 def register(klass):
     operator_registry[klass.scalar_function] = klass
+    return klass
 
 
 @register
@@ -59,8 +68,9 @@ class Multiply(UnitsFunction):
     scalar_function = operator.__mul__
 
     @classmethod
-    def dimension_function(cls, left, right):
-        pass
+    def dimension_function(cls, left: DimensionNode, right: DimensionNode) -> DimensionNode:
+        """Combine two DimensionNodes of the same Dimension - adding exponents."""
+        return DimensionNode(left.dimension, left.value + right.value)
 
 
 @register
@@ -69,6 +79,11 @@ class Divide(UnitsFunction):
     name = "divide"
     scalar_function = operator.__truediv__
 
+    @classmethod
+    def dimension_function(cls, left: DimensionNode, right: DimensionNode) -> DimensionNode:
+        """Combine two DimensionNodes of the same Dimension - subtracting exponents."""
+        return DimensionNode(left.dimension, left.value - right.value)
+
 
 @register
 class Add(UnitsFunction):
@@ -81,7 +96,7 @@ class Add(UnitsFunction):
 class Subtract(UnitsFunction):
     short = "-"
     name = "subtract"
-    scalar_function = operator.__add__
+    scalar_function = operator.__sub__
 
 
 class StemFunctor:
@@ -117,25 +132,25 @@ class UnitOperators(metaclass=UnitMeta):
     def __add__(self: Unit, right: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Add, self, right)
 
-    def __radd__(self: Unit, left: Unit) -> UnitStem:
+    def __radd__(self: Unit, left: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Add, left, self)
 
-    def __sub__(self, a: EitherDomain) -> Codomain:
+    def __sub__(self: Unit, right: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Subtract, self, right)
 
-    def __rsub__(self, a: EitherDomain) -> Codomain:
+    def __rsub__(self: Unit, left: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Subtract, left, self)
 
-    def __mul__(self, a: EitherDomain) -> Codomain:
+    def __mul__(self: Unit, right: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Multiply, self, right)
 
-    def __rmul__(self, a: EitherDomain) -> Codomain:
+    def __rmul__(self: Unit, left: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Multiply, left, self)
 
-    def __truediv__(self, a: EitherDomain) -> Codomain:
+    def __truediv__(self: Unit, right: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Divide, self, right)
 
-    def __rtruediv__(self, a: EitherDomain) -> Codomain:
+    def __rtruediv__(self: Unit, left: Unit) -> UnitsStem:
         return UnitsFunctionStem(None, Divide, left, self)
 
     # def __floordiv__(self, a: EitherDomain) -> Codomain:
@@ -0,0 +1,89 @@
+"""
+Vectorized counterpart of Scalar - wraps a whole NumPy buffer of numbers,
+so that one arithmetic operator runs one NumPy kernel over the buffer,
+instead of one InvariantFunctor.bind per element.
+
+Requires NumPy.
+"""
+from typing import Union
+from numbers import Number
+import operator
+
+import numpy
+
+from .units import Scalar, NumberScalarInvariantFunctor
+from .syntax import EitherDomain
+from .functor import InvariantFunctor
+
+
+class NDArrayScalarArrayInvariantFunctor(NumberScalarInvariantFunctor):
+    """Functor between (ndarray | Number) and ScalarArray.
+
+    Destructing works on any Scalar - not just ScalarArray - so
+    'ScalarArray op Scalar' broadcasts the Scalar's number across the buffer,
+    without building a Scalar per element.
+    """
+    def construct(self, domain: numpy.ndarray) -> 'ScalarArray':
+        return self.Codomain(domain)
+
+    def destruct(self, codomain: Scalar) -> Union[numpy.ndarray, Number]:
+        return codomain.value
+
+    # ScalarArray must be built through __init__, which makes its value an array
+    construct_many = InvariantFunctor.construct_many
+
+
+class ScalarArray(Scalar):
+    """Leaf node representing a NumPy array of pure numbers with no units.
+
+    A subclass of Scalar, so Python gives ScalarArray's reflected operators
+    priority over Scalar's forward operators - making 'Scalar op ScalarArray'
+    return a ScalarArray. This requires the reflected operators to be
+    re-declared here, rather than inherited from ArithmeticSyntaxMixin.
+    """
+    __slots__ = ()
+
+    # Makes 'ndarray op ScalarArray' defer to ScalarArray's reflected operators,
+    # rather than NumPy broadcasting ScalarArray as an object element.
+    __array_ufunc__ = None
+
+    functor: NDArrayScalarArrayInvariantFunctor
+
+    def __init__(self, value, parent=None):
+        super().__init__(numpy.asarray(value), parent)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __eq__(self, other):
+        if isinstance(other, Scalar):
+            return bool(numpy.array_equal(self.value, other.value))
+        else:
+            return False
+
+    def __radd__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__add__, a, self)
+
+    def __rsub__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__sub__, a, self)
+
+    def __rmul__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__mul__, a, self)
+
+    def __rtruediv__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__truediv__, a, self)
+
+    def __rfloordiv__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__floordiv__, a, self)
+
+    def __rmod__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__mod__, a, self)
+
+    def __rpow__(self, a: EitherDomain) -> 'ScalarArray':
+        return self.functor.bind(operator.__pow__, a, self)
+
+
+# One functor shared by every ScalarArray, rather than one per instance
+ScalarArray.functor = NDArrayScalarArrayInvariantFunctor(
+    (numpy.ndarray, Number), ScalarArray
+)
@@ -18,7 +18,7 @@ class OperatorLookupError(UnitsError, LookupError):
 
 
 class UnitsType:
-    pass
+    __slots__ = ()
 
 
 class UnitMeta(GenericMeta):
@@ -0,0 +1,112 @@
+"""
+Bounded least-recently-used cache of simplified trees.
+
+    cache = SimplificationCache(maxsize=512)
+    simplify_tree(unit, cache=cache)   # simplifies a copy, and remembers the result
+    simplify_tree(unit, cache=cache)   # a structurally equal tree skips the rewrite
+    cache.info()                       # CacheInfo(hits=1, misses=1, maxsize=512, currsize=1)
+
+Units trees are mutable, so the cache holds the structural key of each
+simplified tree, and builds a fresh tree from it on every hit.
+"""
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Tuple
+
+from .base import NotPassed
+from .units import Unit, DimensionNode
+from .arithmetic import UnitsFunctionStem
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class SimplificationCache:
+    """Maps structural keys to simplified results, evicting the least
+    recently used entry once maxsize is reached.
+    maxsize=None leaves the cache unbounded.
+    """
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key, or NotPassed."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return NotPassed
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry, and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def structural_key(unit: Unit) -> Tuple[Hashable, ...]:
+    """Flat pre-order tuple identifying unit up to structure - ignoring
+    parents. Numbers are compared along with their type, so Scalar(1) and
+    Scalar(1.0) get different keys.
+    Flat, so hashing the key never recurses however deep the tree is.
+    """
+    key = []
+    stack = [unit]
+    while stack:
+        unit = stack.pop()
+        if isinstance(unit, UnitsFunctionStem):
+            key.append((unit.__class__, unit.units_function))
+            stack.append(unit.right)
+            stack.append(unit.left)
+        elif isinstance(unit, DimensionNode):
+            key.append((unit.__class__, unit.dimension, unit.value.__class__, unit.value))
+        else:
+            # Scalar
+            key.append((unit.__class__, unit.value.__class__, unit.value))
+    return tuple(key)
+
+
+def build(key: Tuple[Hashable, ...]) -> Unit:
+    """New tree from a structural_key, with its parents set."""
+    results = []
+    # Pre-order, read backwards, puts both children of a stem
+    # on the results stack before the stem itself.
+    # Items are told apart by length, as issubclass through UnitMeta is slow;
+    # and built with __init__ directly, as the metaclass __call__ would be.
+    for item in reversed(key):
+        size = len(item)
+        unit = object.__new__(item[0])
+        if size == 2:
+            # UnitsFunctionStem
+            left, right = results.pop(), results.pop()
+            unit.__init__(None, item[1], left, right)
+            left.parent = right.parent = unit
+        elif size == 4:
+            # DimensionNode
+            unit.__init__(item[1], item[3])
+        else:
+            # Scalar
+            unit.__init__(item[2])
+        results.append(unit)
+    return results.pop()
@@ -12,27 +12,70 @@ class NotPassed:
 @functools.total_ordering
 class Dimension(metaclass=UnitMeta):
     """Fundamental value-less unit. 'feet'/'seconds'.
-    Should have special handling of NullUnit in the constructor
+    Dimension() and Dimension(None) are NullUnit.
     """
     registry = {}
+    # Every registered Dimension, indexed by Dimension.id
+    interned = []
+    # Set when a Dimension is registered - ranks are recomputed on the next
+    # comparison, so registering n Dimensions sorts once rather than n times
+    _stale = False
+
+    @classmethod
+    def __call__(cls, identifier: Union[None, int, NotPassed] = NotPassed):
+        return cls.__new__(cls, identifier)
 
     def __new__(cls, identifier: Union[None, int, NotPassed] = NotPassed):
+        if identifier is NotPassed or identifier is None:
+            identifier = 'NullUnit'
         if identifier in cls.registry:
             return cls.registry[identifier]
         else:
-            self = super(cls).__new__(cls, identifier)
+            self = object.__new__(cls)
             self.__init__(identifier)
-            cls.registry[identifier] = self
-            return self
+            return cls._intern(self)
 
     def __init__(self, identifier: Union[None, int, NotPassed] = NotPassed):
         """Explicitly passing in 'None' for identifier should make this the NullUnit"""
         self.identifier = identifier
+        # Dense integer id, in order of registration
+        self.id = len(self.interned)
+        self._rank = self.id
+
+    @classmethod
+    def _intern(cls, self: 'Dimension') -> 'Dimension':
+        cls.registry[self.identifier] = self
+        cls.interned.append(self)
+        Dimension._stale = True
+        return self
+
+    @classmethod
+    def _rerank(cls):
+        """Precompute each Dimension's position in the sort order, so
+        comparisons are integer comparisons rather than identifier comparisons.
+        Runs on the first comparison after any Dimensions are registered.
+        """
+        for rank, dimension in enumerate(sorted(cls.interned, key=_sort_key)):
+            dimension._rank = rank
+        Dimension._stale = False
+
+    @property
+    def rank(self) -> int:
+        """Position of this Dimension in the sort order of every registered one."""
+        if Dimension._stale:
+            self._rerank()
+        return self._rank
 
     @classmethod
     def zero(cls):
         return NullUnit
 
+    def __reduce__(self):
+        """Pickled by identifier - unpickling looks it up in the registry,
+        so it is the same object as every other Dimension of that identifier.
+        """
+        return (self.__class__, (self.identifier,))
+
     def __str__(self):
         return self.identifier
 
@@ -41,13 +84,13 @@ class Dimension(metaclass=UnitMeta):
 
     def __eq__(self, other):
         if isinstance(other, Dimension):
-            if self.identifier == other.identifier:
-                return True
-            else:
-                return False
+            return self.id == other.id
         else:
             return NotImplemented
 
+    def __hash__(self):
+        return self.id
+
     def __lt__(self, other):
         """Only compares Dimensions.
         Compares as Tuple[str] except treats 'None' as less than all others
@@ -55,21 +98,23 @@ class Dimension(metaclass=UnitMeta):
         compound dimensions, such as:
             feet * pounds  ~  (feet, pounds)   and not (pounds, feet)
         """
-        if not isinstance(other, Dimension):
-            return NotImplemented
+        if isinstance(other, Dimension):
+            if Dimension._stale:
+                self._rerank()
+            return self._rank < other._rank
         else:
-            # Treat 'None' as less than all strings
-            is_none = (self.identifier is None, other.identifier is None)
-            if is_none == (False, False):
-                return self.identifier < other.identifier
-            elif is_none == (True, False):
-                return True
-            elif is_none == (False, True):
-                return False
-            else:
-                # is_none == (True, True):
-                # default - when both are None treat left as less than right
-                return True
+            return NotImplemented
+
+
+def _sort_key(dimension: Dimension):
+    """Treat NullUnit as less than all other Dimensions.
+    Identifiers of different types are grouped by type name, rather than
+    failing to compare."""
+    identifier = dimension.identifier
+    if dimension is NullUnit:
+        return (0, '', '')
+    else:
+        return (1, identifier.__class__.__name__, identifier)
 
 
 NullUnit = Dimension('NullUnit')
@@ -2,11 +2,18 @@ import functools
 import operator
 from typing import (
     Callable, Tuple, Union, Optional, Callable,
-    Type, TypeVar, Generic, Any, ClassVar
+    Type, TypeVar, Generic, Any, ClassVar,
+    Iterable, Iterator, List
 )
 from abc import ABCMeta, abstractmethod, abstractproperty
 
-from .base import UnitMeta
+from .base import UnitMeta, UnitsError
+
+try:
+    # Optional - vectorizes map_many and bind_many
+    import numpy
+except ImportError:
+    numpy = None
 
 
 # Domain & Codomain: typecheckable Type objects.
@@ -137,3 +144,111 @@ class InvariantFunctor(Functor, Generic[Domain, Codomain], metaclass=ABCMeta):
         #                     else self.destruct(value)
         #                 for value in values)
         return self.construct(func(*_domains))
+
+    def map_many(self, func: DomainFunction, *columns: Iterable[Codomain],
+                 lazy: bool = False) -> Union[List[Codomain], Iterator[Codomain]]:
+        """
+        The .map function, over columns of codomain elements - one column per
+        argument of func, as with the builtin map:
+            functor.map_many(operator.__add__, [Scalar(1), Scalar(2)], [Scalar(3), Scalar(4)])
+            --> [Scalar(4), Scalar(6)]
+
+        Each column is destructed once into a buffer of numbers, and func is
+        applied over the buffers in bulk. Results are constructed as a list,
+        or one at a time from a generator if lazy.
+        """
+        buffers = [self.destruct_many(column) for column in columns]
+        return self.construct_many(_apply_many(func, buffers), lazy)
+
+    def bind_many(self, func: DomainFunction, *columns: Iterable[EitherDomain],
+                  lazy: bool = False) -> Union[List[Codomain], Iterator[Codomain]]:
+        """The .bind function over columns - like map_many, but the columns
+        may hold domain elements as well as codomain elements."""
+        Domain, destruct = self.Domain, self.destruct
+        buffers = [
+            [value if isinstance(value, Domain) else destruct(value) for value in column]
+            for column in columns
+        ]
+        return self.construct_many(_apply_many(func, buffers), lazy)
+
+    def lift_many(self, func: DomainFunction) -> Callable[..., Union[List[Codomain], Iterator[Codomain]]]:
+        """lift, for columns: the result takes columns of codomain elements."""
+        @functools.wraps(func)
+        def wrapper(*columns: Iterable[Codomain], lazy: bool = False):
+            return self.map_many(func, *columns, lazy=lazy)
+        return wrapper
+
+    def bind_lift_many(self, func: DomainFunction) -> Callable[..., Union[List[Codomain], Iterator[Codomain]]]:
+        """lift_many, taking columns of domain or codomain elements."""
+        @functools.wraps(func)
+        def wrapper(*columns: Iterable[EitherDomain], lazy: bool = False):
+            return self.bind_many(func, *columns, lazy=lazy)
+        return wrapper
+
+    def destruct_many(self, codomains: Iterable[Codomain]) -> List[Domain]:
+        """destruct over a column. Subclasses may override this with a
+        faster equivalent."""
+        destruct = self.destruct
+        return [destruct(codomain) for codomain in codomains]
+
+    def construct_many(self, domains: Iterable[Domain],
+                       lazy: bool = False) -> Union[List[Codomain], Iterator[Codomain]]:
+        """construct over a column, as a list - or a generator if lazy.
+        Subclasses may override this with a faster equivalent."""
+        construct = self.construct
+        if lazy:
+            return (construct(domain) for domain in domains)
+        return [construct(domain) for domain in domains]
+
+
+# Operators whose NumPy versions give the same results as Python's, element
+# by element - within the limits checked by _vectorizable
+_VECTORIZED = frozenset((operator.__add__, operator.__sub__, operator.__mul__, operator.__truediv__))
+# Largest integer magnitude for which int64 arithmetic cannot overflow
+_INT_LIMIT = 2 ** 31
+
+
+def _apply_many(func: DomainFunction, buffers: List[List[Domain]]) -> List[Domain]:
+    """func applied across buffers, element by element."""
+    if len(set(len(buffer) for buffer in buffers)) > 1:
+        raise UnitsError(str.format(
+            "columns have different lengths: {0}",
+            ", ".join(str(len(buffer)) for buffer in buffers)
+        ))
+    if numpy is not None and func in _VECTORIZED and buffers and buffers[0]:
+        arrays = _vectorizable(func, buffers)
+        if arrays is not None:
+            return func(*arrays).tolist()
+    return [func(*arguments) for arguments in zip(*buffers)]
+
+
+def _vectorizable(func: DomainFunction, buffers: List[List[Domain]]):
+    """The buffers as NumPy arrays - or None, if NumPy could give a result
+    which Python would not. Every element must have the same exact type -
+    all int or all float - as a mixed buffer would be cast to float; ints
+    must be small enough that int64 cannot overflow; and a divisor must have
+    no zeros, which NumPy divides into inf rather than raising
+    ZeroDivisionError."""
+    kinds = set()
+    for buffer in buffers:
+        kinds.update(map(type, buffer))
+    if kinds == {int}:
+        dtype = numpy.int64
+    elif kinds == {float}:
+        dtype = numpy.float64
+    else:
+        # Booleans add as logical or, and objects gain nothing
+        return None
+    arrays = []
+    for buffer in buffers:
+        try:
+            array = numpy.array(buffer, dtype=dtype)
+        except OverflowError:
+            # An int beyond int64
+            return None
+        if dtype is numpy.int64 and (array.max() >= _INT_LIMIT or array.min() <= -_INT_LIMIT):
+            return None
+        arrays.append(array)
+    if func is operator.__truediv__ and not arrays[-1].all():
+        return None
+    return arrays
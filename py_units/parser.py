@@ -0,0 +1,76 @@
+"""
+Parse unit expressions, such as 'kg*m/s^2' or 'N·m / (s^2)', into py_units trees.
+
+    parse_unit('kg*m/s^2')
+    # ((kg * m) / s^2), as UnitsFunctionStem and DimensionNode
+
+The grammar, and the parser of it, are in unit_parser.py - shared with
+unit_tree. This module builds py_units trees for it. Names become interned
+Dimensions. Exponents raise a DimensionNode's exponent: s^2 is
+DimensionNode(s, 2). A parenthesized group is raised by repeated
+multiplication, x^-1 is 1 / x and x^0 is 1.
+
+Results are cached by string, in an LRU cache. Units trees are mutable, so
+the cache holds each tree's structural key, and every parse builds a new
+tree from it - as the SimplificationCache does.
+"""
+import functools
+from numbers import Number
+from typing import Union
+
+from unit_parser import Builder, Parser
+
+from .base import UnitsError
+from .dimension import Dimension
+from .units import Unit, Scalar, DimensionNode
+from .arithmetic import UnitsFunctionStem, Multiply, Divide
+from .cache import structural_key, build
+
+
+PARSE_CACHE_SIZE = 1024
+
+
+def _stem(units_function, left: Unit, right: Unit) -> UnitsFunctionStem:
+    stem = UnitsFunctionStem(None, units_function, left, right)
+    left.parent = right.parent = stem
+    return stem
+
+
+class UnitBuilder(Builder):
+    """Builds py_units trees, with their parents set."""
+    error = UnitsError
+
+    def leaf(self, value: Union[Number, str]) -> Unit:
+        if isinstance(value, str):
+            return DimensionNode(Dimension(value))
+        return Scalar(value)
+
+    def stem(self, divide: bool, left: Unit, right: Unit) -> UnitsFunctionStem:
+        return _stem(Divide if divide else Multiply, left, right)
+
+    def power(self, unit: Unit, exponent: int) -> Unit:
+        if isinstance(unit, Scalar):
+            return Scalar(unit.value ** exponent)
+        if exponent == 0:
+            return Scalar(1)
+        if isinstance(unit, DimensionNode):
+            return DimensionNode(unit.dimension, unit.value * exponent)
+        # A group: each factor must be a separate tree, as trees hold their parent
+        key = structural_key(unit)
+        result = unit
+        for _ in range(abs(exponent) - 1):
+            result = _stem(Multiply, result, build(key))
+        return _stem(Divide, Scalar(1), result) if exponent < 0 else result
+
+
+_builder = UnitBuilder()
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_key(text: str):
+    return structural_key(Parser(text, _builder).parse())
+
+
+def parse_unit(text: str) -> Unit:
+    """New tree of a unit expression, such as 'kg*m/s^2'"""
+    return build(_parse_key(text))
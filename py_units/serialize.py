@@ -0,0 +1,302 @@
+"""
+Compact binary encoding of py_units trees.
+
+    data = encode_tree(DimensionNode(meters) / DimensionNode(seconds, 2))
+    decode_tree(data)                 # a new tree, with its parents set
+    decode_tree(memoryview(data))     # any bytes-like object, read in place
+
+Layout:
+    header     b'PU', version
+    dimensions varint count, then each Dimension identifier once
+    tree       one opcode per UnitsFunctionStem, DimensionNode or Scalar,
+               in pre-order
+
+A stem is the one opcode of its UnitsFunction. A DimensionNode is a varint
+index into the dimension table, followed by its exponent - unless the
+exponent is 1, which has an opcode of its own. A number is tagged with its
+type, so Scalar(1) and Scalar(1.0) round-trip as they were; an int is a
+zigzag varint and a float is 8 bytes.
+
+Parents are not stored - they follow from the structure, and decode_tree
+sets them, as cache.build does. Encoding and decoding use explicit stacks,
+rather than recursing, so trees of any depth round-trip.
+
+Units pickle through reduce_tree, as their encoding - so a pickle is flat,
+small, and loads with the Dimensions interned in the loading process.
+"""
+import struct
+from numbers import Number
+from typing import Any, Callable, Tuple, Union
+
+from .base import UnitsError, UnitsTypeError
+from .dimension import Dimension
+from .units import Unit, DimensionNode, Scalar
+from .arithmetic import UnitsFunctionStem, Multiply, Divide, Add, Subtract
+from .cache import structural_key, build
+
+
+MAGIC = b'PU'
+VERSION = 1
+
+# Each has the opcode _FUNCTION + its position
+FUNCTIONS = (Multiply, Divide, Add, Subtract)
+
+_UNIT = 1
+_DIMENSION = 2
+_INT = 3
+_FLOAT = 4
+_COMPLEX = 5
+_TRUE = 6
+_FALSE = 7
+_FUNCTION = 16
+
+# Tags of Dimension identifiers, in the dimension table
+_NONE = 0
+_STR = 1
+_INTEGER = 2
+
+_DOUBLE = struct.Struct('<d')
+_DOUBLES = struct.Struct('<dd')
+
+_FUNCTION_OPCODES = {function: _FUNCTION + index for index, function in enumerate(FUNCTIONS)}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _write_varint(out: bytearray, number: int):
+    while number >= 0x80:
+        out.append((number & 0x7f) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _zigzag(number: int) -> int:
+    """Small negative ints stay small: 0, -1, 1, -2 --> 0, 1, 2, 3"""
+    return number << 1 if number >= 0 else ((-number) << 1) - 1
+
+
+def _unzigzag(number: int) -> int:
+    return -((number + 1) >> 1) if number & 1 else number >> 1
+
+
+def _write_number(out: bytearray, value: Number):
+    """Type tag, then value"""
+    cls = value.__class__
+    if cls is int:
+        out.append(_INT)
+        _write_varint(out, _zigzag(value))
+    elif cls is float:
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif cls is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif cls is complex:
+        out.append(_COMPLEX)
+        out += _DOUBLES.pack(value.real, value.imag)
+    else:
+        raise UnitsTypeError("Cannot encode number {0!r}".format(value))
+
+
+def _write_identifier(out: bytearray, identifier):
+    if identifier is None:
+        out.append(_NONE)
+    elif identifier.__class__ is str:
+        encoded = identifier.encode('utf-8')
+        out.append(_STR)
+        _write_varint(out, len(encoded))
+        out += encoded
+    elif identifier.__class__ is int:
+        out.append(_INTEGER)
+        _write_varint(out, _zigzag(identifier))
+    else:
+        raise UnitsTypeError("Cannot encode Dimension identifier {0!r}".format(identifier))
+
+
+def encode_tree(unit: Unit) -> bytes:
+    """unit as bytes. The tree may hold UnitsFunctionStems of Multiply,
+    Divide, Add and Subtract, DimensionNodes, and Scalars of ints, floats,
+    complex numbers and bools - not ScalarArrays.
+    """
+    body = bytearray()
+    dimensions = {}   # Dimension.id --> index
+    table = []
+    stack = [unit]
+    while stack:
+        unit = stack.pop()
+        # Compared by class, as isinstance through UnitMeta is slow
+        cls = unit.__class__
+        if cls is UnitsFunctionStem:
+            opcode = _FUNCTION_OPCODES.get(unit.units_function)
+            if opcode is None:
+                raise UnitsTypeError("Cannot encode UnitsFunction {0!r}".format(unit.units_function))
+            body.append(opcode)
+            stack.append(unit.right)
+            stack.append(unit.left)
+        elif cls is DimensionNode:
+            dimension = unit.dimension
+            index = dimensions.get(dimension.id)
+            if index is None:
+                index = dimensions[dimension.id] = len(table)
+                table.append(dimension)
+            value = unit.value
+            if value.__class__ is int and value == 1:
+                body.append(_UNIT)
+                _write_varint(body, index)
+            else:
+                body.append(_DIMENSION)
+                _write_varint(body, index)
+                _write_number(body, value)
+        elif cls is Scalar:
+            _write_number(body, unit.value)
+        else:
+            raise UnitsTypeError("Cannot encode {0}".format(cls.__name__))
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    _write_varint(out, len(table))
+    for dimension in table:
+        _write_identifier(out, dimension.identifier)
+    out += body
+    return bytes(out)
+
+
+def decode_tree(data: Buffer) -> Unit:
+    """New tree from the bytes of encode_tree - bytes, bytearray,
+    memoryview or any other buffer of bytes - with its parents set.
+    Raises UnitsError if data is not a whole encoded tree.
+    """
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    try:
+        return _decode(view)
+    except (IndexError, struct.error):
+        raise UnitsError("Encoded tree is truncated")
+    except UnicodeDecodeError:
+        raise UnitsError("Encoded tree has a Dimension identifier which is not UTF-8")
+
+
+def _decode(view: memoryview) -> Unit:
+    if view[:2] != MAGIC:
+        raise UnitsError("Not an encoded tree")
+    if view[2] != VERSION:
+        raise UnitsError("Unsupported encoded tree version {0}".format(view[2]))
+    position = 3
+
+    def varint() -> int:
+        nonlocal position
+        number = shift = 0
+        while True:
+            byte = view[position]
+            position += 1
+            number |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return number
+            shift += 7
+
+    def number(opcode: int) -> Number:
+        nonlocal position
+        if opcode == _INT:
+            return _unzigzag(varint())
+        elif opcode == _FLOAT:
+            position += _DOUBLE.size
+            return _DOUBLE.unpack_from(view, position - _DOUBLE.size)[0]
+        elif opcode == _TRUE or opcode == _FALSE:
+            return opcode == _TRUE
+        elif opcode == _COMPLEX:
+            position += _DOUBLES.size
+            return complex(*_DOUBLES.unpack_from(view, position - _DOUBLES.size))
+        raise UnitsError("Unknown opcode {0}, at {1}".format(opcode, position - 1))
+
+    def read_dimension() -> Dimension:
+        nonlocal position
+        index = view[position]
+        if index < 0x80:
+            position += 1
+        else:
+            index = varint()
+        if index >= len(dimensions):
+            raise UnitsError("Dimension {0} is not in the table, at {1}".format(index, position))
+        return dimensions[index]
+
+    dimensions = []
+    for _ in range(varint()):
+        tag = view[position]
+        position += 1
+        if tag == _STR:
+            size = varint()
+            if position + size > len(view):
+                raise IndexError(position + size)
+            dimensions.append(Dimension(str(view[position:position + size], 'utf-8')))
+            position += size
+        elif tag == _INTEGER:
+            dimensions.append(Dimension(_unzigzag(varint())))
+        elif tag == _NONE:
+            dimensions.append(Dimension(None))
+        else:
+            raise UnitsError("Unknown Dimension identifier tag {0}, at {1}".format(tag, position - 1))
+
+    # Leaves are built as they are read; a stem is recorded by its opcode,
+    # and built on the way back - when its children are built already.
+    # Slots are set directly, skipping the metaclass __call__ and __init__.
+    new = object.__new__
+    items = []
+    append = items.append
+    end = len(view)
+    while position < end:
+        opcode = view[position]
+        position += 1
+        if opcode >= _FUNCTION:
+            if opcode - _FUNCTION >= len(FUNCTIONS):
+                raise UnitsError("Unknown opcode {0}, at {1}".format(opcode, position - 1))
+            append(opcode)
+        elif opcode == _UNIT:
+            unit = new(DimensionNode)
+            unit.dimension = read_dimension()
+            unit.value = 1
+            unit.parent = None
+            append(unit)
+        elif opcode == _DIMENSION:
+            dimension = read_dimension()
+            tag = view[position]
+            position += 1
+            unit = new(DimensionNode)
+            unit.dimension = dimension
+            unit.value = number(tag)
+            unit.parent = None
+            append(unit)
+        else:
+            append(Scalar._make(number(opcode)))
+
+    # Pre-order, read backwards, puts both children of a stem
+    # on the results stack before the stem itself.
+    results = []
+    pop, push = results.pop, results.append
+    try:
+        for item in reversed(items):
+            if item.__class__ is int:
+                unit = new(UnitsFunctionStem)
+                unit.parent = None
+                unit.units_function = FUNCTIONS[item - _FUNCTION]
+                unit.left = left = pop()
+                unit.right = right = pop()
+                left.parent = right.parent = unit
+                item = unit
+            push(item)
+    except IndexError:
+        raise UnitsError("Encoded tree is missing children")
+    if len(results) != 1:
+        raise UnitsError("Encoded tree has {0} roots, rather than one".format(len(results)))
+    return results[0]
+
+
+def reduce_tree(unit: Unit) -> Tuple[Callable[..., Unit], Tuple[Any]]:
+    """Unit.__reduce__ - the encoding of unit, or for a tree encode_tree
+    does not cover, such as one of ScalarArrays, its structural_key.
+    Either way the parent of unit is left out, and pickle never recurses
+    down the tree.
+    """
+    try:
+        return decode_tree, (encode_tree(unit),)
+    except UnitsTypeError:
+        return build, (structural_key(unit),)
@@ -12,18 +12,44 @@ Tree(node).left_most -> Node
 
 And this problem....
 node = Unit('feet') * Unit('feet')
+
+
+Simplification rewrites stems in place - replacing a stem in its parent's
+left/right and updating the replacement's parent - so always continue from
+the returned root.
+None of these functions recurse on the Python stack, so arbitrarily deep
+trees can be simplified.
+
+simplify_tree remembers its results in a SimplificationCache, keyed on the
+structure of the tree, so repeated expressions skip the rewrite passes. With
+a cache, the input tree is never rewritten - a hit builds the result from
+the cache, and a miss simplifies a copy built from the key.
+
+Stems are rewritten from a worklist. A rule only looks at a stem and its
+children, so when a stem is rewritten only its parent needs another look -
+and a stem left unchanged stops the propagation. After editing part of an
+already simplified tree, resimplify(edited) revisits just the edited stems
+and whichever of their ancestors end up rewritten.
 """
-from .typing import Iterator
+from collections import deque
+from typing import Iterable, Iterator, Optional
+from numbers import Number
 
-from .units import Unit, UnitsStem, Scalar, DimensionNode
-from .base import UnitsError
+from .units import Unit, UnitsLeaf, UnitsStem, Scalar, DimensionNode
+from .dimension import Dimension
+from .functor import Functor, InvariantFunctor
+from .arithmetic import UnitsFunction, UnitsFunctionStem, Multiply, Divide, Add, Subtract
+from .base import NotPassed, UnitsError
+from .cache import SimplificationCache, structural_key, build
 
 
 def ancestry_iterator(node: Unit) -> Iterator[Unit]:
+    """Yields node, then each of its ancestors up to the root."""
     lense = node
+    yield lense
     while (lense.parent is not None):
-        yield lense
         lense = lense.parent
+        yield lense
 
 
 def find_root(node: Unit) -> Unit:
@@ -36,55 +62,144 @@ def find_root(node: Unit) -> Unit:
     return last
 
 
+def depth_first_iterator(node: Unit) -> Iterator[Unit]:
+    """Post-order: every stem is yielded after both of its children.
+    Uses an explicit stack rather than recursion.
+    """
+    stack = [(node, False)]
+    while stack:
+        unit, expanded = stack.pop()
+        if expanded or not isinstance(unit, UnitsFunctionStem):
+            yield unit
+        else:
+            stack.append((unit, True))
+            stack.append((unit.right, False))
+            stack.append((unit.left, False))
+
+
+def replace(old: Unit, new: Unit) -> Unit:
+    """Put new in the place old has in its parent."""
+    parent = old.parent
+    new.parent = parent
+    if parent is not None:
+        if parent.left is old:
+            parent.left = new
+        if parent.right is old:
+            parent.right = new
+    return new
+
+
+simplification_cache = SimplificationCache()
+
 
 #
 # Partial completion
 #
-def simplify_tree(node: Unit) -> Unit:
+def simplify_tree(node: Unit,
+                  cache: Optional[SimplificationCache] = simplification_cache) -> Unit:
     """
     Generally we will want to simplify from the root.
+    Returns the root of the simplified tree - a new tree, whether or not
+    the cache had it, and the input is left as it was.
+    Pass cache=None to always rewrite - in place, without copying.
     """
     root = find_root(node)
-
+    if cache is None or isinstance(root, UnitsLeaf):
+        return _simplify_tree(root)
+    try:
+        key = structural_key(root)
+        simplified = cache.get(key)
+    except TypeError:
+        # Unhashable value, such as a ScalarArray - cannot be cached
+        return _simplify_tree(root)
+    if simplified is NotPassed:
+        root = _simplify_tree(build(key))
+        cache.put(key, structural_key(root))
+        return root
+    return build(simplified)
+
+
+def _simplify_tree(root: Unit) -> Unit:
     if isinstance(root, UnitsLeaf):
-        # Sanity check that node == root
-        if root != node:
-            raise UnitsError("Sanity check failed")
-        else:
-            # No further simplifications can be done
-            return root
+        # No further simplifications can be done
+        return root
     else:
         # isinstance(root, UnitsStem) == True
 
         # Sort the tree
         normalized_root = normalize_tree(root)
 
-        # Note - handling iterator while also mutating... makes life hard
-        for node in depth_first_iterator(normalized_root):
-            if isinstance(node, UnitsLeaf):
-                pass
-            else:
-                # Stem
+        # Seeded in post-order, so children are simplified before their
+        # parents, and each stem is visited once unless a child changes.
+        return _run_worklist(normalized_root, depth_first_iterator(normalized_root))
 
-def _simplify(node: Unit) -> Unit:
-    """Recursive portion of simplification."""
-    if isinstance(node, UnitsLeaf):
-        return node
-    else:
-        v0 = combine_paired_scalars(node)
-        v1 = combine_matching_dimensions(v0)
-        v2 = remove_zero_dimension_children(v1)
-        v3 = remove_zero_scalar_children(v2)
-        return v3
 
+def resimplify(*edited: Unit) -> Unit:
+    """Re-simplify an already simplified tree after edits to the given
+    units - such as a changed value, or a replaced child.
+    Only the edited units, and the ancestors whose children get rewritten,
+    are revisited. Returns the root of the tree.
+    """
+    if not edited:
+        raise UnitsError("resimplify() needs at least one edited unit")
+    seeds = [
+        unit if isinstance(unit, UnitsFunctionStem) else unit.parent
+        for unit in edited
+    ]
+    return _run_worklist(find_root(edited[0]), (seed for seed in seeds if seed is not None))
+
+
+def _run_worklist(root: Unit, seeds: Iterable[Unit]) -> Unit:
+    """Simplify stems from the worklist until it is empty, queueing the
+    parent of every stem which is rewritten. Returns the root."""
+    # Units are keyed by id, since Scalars define equality by value
+    worklist = deque()
+    queued = set()
+    for unit in seeds:
+        if isinstance(unit, UnitsFunctionStem) and id(unit) not in queued:
+            worklist.append(unit)
+            queued.add(id(unit))
+
+    while worklist:
+        stem = worklist.popleft()
+        queued.discard(id(stem))
+        parent = stem.parent
+        if parent is None:
+            if stem is not root:
+                # Replaced since it was queued
+                continue
+        elif parent.left is not stem and parent.right is not stem:
+            continue
+
+        simplified = _simplify(stem)
+        if simplified is stem:
+            continue
+        replace(stem, simplified)
+        if parent is None:
+            root = simplified
+        elif id(parent) not in queued:
+            worklist.append(parent)
+            queued.add(id(parent))
+    return root
 
 
+def _simplify(node: Unit) -> Unit:
+    """Simplification of a single stem, whose children are already simplified.
+    Stops as soon as a rule replaces the stem with a leaf.
+    """
+    for rule in (combine_paired_scalars, combine_matching_dimensions,
+                 remove_zero_dimension_children, remove_zero_scalar_children):
+        if not isinstance(node, UnitsFunctionStem):
+            break
+        node = rule(node)
+    return node
+
 
 def combine_paired_scalars(stem: UnitsStem) -> Unit:
     """Check if scalar simplification can be applied"""
     if (isinstance(stem.left, Scalar) and isinstance(stem.right, Scalar)):
-        return ScalarFunctor.map(
-            stem.function,
+        return stem.left.functor.map(
+            stem.units_function.scalar_function,
             stem.left,
             stem.right
         )
@@ -95,17 +210,17 @@ def combine_matching_dimensions(stem: UnitsStem) -> Unit:
     """Check if dimensional simplification can be applied to a stem."""
     if isinstance(stem.left, DimensionNode) and isinstance(stem.right, DimensionNode):
         if stem.left.dimension == stem.right.dimension:
-            # Create new with unit of left, and add exponents
-            return DimensionFunctor.map(
-                stem.function,
-                stem.left,
-                stem.right
-            )
+            if hasattr(stem.units_function, 'dimension_function'):
+                # Create new with unit of left, and add exponents
+                return stem.units_function.dimension_function(
+                    stem.left,
+                    stem.right
+                )
     return stem
 
 
 def is_dimension_zero(unit: Unit) -> bool:
-    if isinstance(stem.left, DimensionNode):
+    if isinstance(unit, DimensionNode):
         if hasattr(unit, 'value'):
             if unit.value == 0:
                 return True
@@ -122,25 +237,26 @@ def is_scalar_zero(unit: Unit) -> bool:
 
 def remove_zero_dimension_children(stem: UnitsStem) -> Unit:
     """Removes at most one child nodes which are DimensionNode
-    with value 0 (~exponent 0)"""
-    if is_dimension_zero(stem.left):
+    with value 0 (~exponent 0) - which are 1, so only from products."""
+    if stem.units_function is Multiply and is_dimension_zero(stem.left):
         return stem.right
-    elif is_dimension_zero(stem.right):
+    elif stem.units_function in (Multiply, Divide) and is_dimension_zero(stem.right):
         return stem.left
     else:
         return stem
 
 
 def remove_zero_scalar_children(stem: UnitsStem) -> Unit:
-    if is_scalar_zero(stem.left):
+    """Removes at most one child Scalar of value 0 - only from sums."""
+    if stem.units_function is Add and is_scalar_zero(stem.left):
         return stem.right
-    elif is_scalar_zero(stem.right):
+    elif stem.units_function in (Add, Subtract) and is_scalar_zero(stem.right):
         return stem.left
     else:
         return stem
 
 
-def normalize_tree(stem: UnitsStem):
+def normalize_tree(stem: UnitsStem) -> Unit:
     """Places the tree is a normalized and standardized form,
     via applying a tree sorting algorithm.
     The goal of this is to make it easier to combine
@@ -148,7 +264,141 @@ def normalize_tree(stem: UnitsStem):
 
     In sorted form - Scalars (~dimension == NullUnit) should be in
     the left-most position.
+
+    Each maximal chain of products (Multiply/Divide stems) or sums
+    (Add/Subtract stems) is flattened into one n-ary list of operands,
+    each with a sign, and rebuilt in canonical form:
+        product: scalar * dimensions, sorted by Dimension * other factors
+                 / other divisors
+        sum:     scalar + other terms - other subtracted terms
+    All scalars of a chain are combined, and all DimensionNodes of the same
+    Dimension merged by adding exponents, in a single pass plus one sort.
+    Returns the root of the normalized tree.
     """
+    root = stem
+    for unit in list(depth_first_iterator(stem)):
+        if not isinstance(unit, UnitsFunctionStem):
+            continue
+        family = _families.get(unit.units_function)
+        if family is None:
+            continue
+        parent = unit.parent
+        if parent is not None and _families.get(parent.units_function) is family:
+            # Flattened along with the top of its chain
+            continue
+        normalized = family.normalize(_flatten(unit, family))
+        replace(unit, normalized)
+        if unit is root:
+            root = normalized
+    return root
+
+
+class _Family:
+    """Associative and commutative UnitsFunction, with its inverse -
+    such as Multiply and Divide."""
+    def __init__(self, function: UnitsFunction, inverse: UnitsFunction):
+        self.function = function
+        self.inverse = inverse
+
+
+class _Product(_Family):
+
+    def normalize(self, operands) -> Unit:
+        scalar = None
+        exponents = {}
+        factors, divisors = [], []
+        for unit, positive in operands:
+            if isinstance(unit, Scalar):
+                scalar = _combine_scalars(scalar, unit, positive, self)
+            elif isinstance(unit, DimensionNode):
+                exponent = unit.value if positive else -unit.value
+                exponents[unit.dimension] = exponents.get(unit.dimension, 0) + exponent
+            else:
+                (factors if positive else divisors).append(unit)
+
+        dimensions = [
+            DimensionNode(dimension, exponents[dimension])
+            for dimension in sorted(exponents)
+            if exponents[dimension] != 0
+        ]
+        if scalar is not None and _is_number(scalar, 1) and (dimensions or factors):
+            scalar = None
+        head = [scalar] if scalar is not None else []
+        return _build_chain(self, head + dimensions + factors, divisors, Scalar(1))
+
+
+class _Sum(_Family):
+
+    def normalize(self, operands) -> Unit:
+        scalar = None
+        terms, subtracted = [], []
+        for unit, positive in operands:
+            if isinstance(unit, Scalar):
+                scalar = _combine_scalars(scalar, unit, positive, self)
+            else:
+                (terms if positive else subtracted).append(unit)
+
+        if scalar is not None and _is_number(scalar, 0) and terms:
+            scalar = None
+        head = [scalar] if scalar is not None else []
+        return _build_chain(self, head + terms, subtracted, Scalar(0))
+
+
+_product = _Product(Multiply, Divide)
+_sum = _Sum(Add, Subtract)
+_families = {Multiply: _product, Divide: _product, Add: _sum, Subtract: _sum}
+
+
+def _flatten(stem: UnitsFunctionStem, family: _Family):
+    """Operands of the chain topped by stem, left to right, each with
+    whether it is applied positively (multiplied or added)."""
+    operands = []
+    stack = [(stem, True)]
+    while stack:
+        unit, positive = stack.pop()
+        if isinstance(unit, UnitsFunctionStem) and _families.get(unit.units_function) is family:
+            stack.append((unit.right, positive if unit.units_function is family.function else not positive))
+            stack.append((unit.left, positive))
+        else:
+            operands.append((unit, positive))
+    return operands
+
+
+def _combine_scalars(total: Optional[Scalar], scalar: Scalar, positive: bool,
+                     family: _Family) -> Scalar:
+    if total is None:
+        if positive:
+            return scalar
+        # Nothing to divide or subtract from yet
+        total = Scalar(1 if family is _product else 0)
+    function = family.function if positive else family.inverse
+    return total.functor.map(function.scalar_function, total, scalar)
+
+
+def _is_number(scalar: Scalar, number: Number) -> bool:
+    return isinstance(scalar.value, Number) and scalar.value == number
+
+
+def _build_chain(family: _Family, positives, negatives, identity: Scalar) -> Unit:
+    """Left-deep chain of family.function over positives, then
+    family.inverse of that by the chain over negatives."""
+    result = _chain(family.function, positives or [identity])
+    if negatives:
+        result = _stem(family.inverse, result, _chain(family.function, negatives))
+    return result
+
+
+def _chain(units_function, units) -> Unit:
+    result = units[0]
+    for unit in units[1:]:
+        result = _stem(units_function, result, unit)
+    return result
+
+
+def _stem(units_function, left: Unit, right: Unit) -> UnitsFunctionStem:
+    stem = UnitsFunctionStem(None, units_function, left, right)
+    left.parent = right.parent = stem
+    return stem
 
 
 #
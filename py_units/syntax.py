@@ -38,6 +38,7 @@ class ArithmeticSyntaxMixin(Generic[Domain, Codomain], metaclass=UnitMeta):
     Abstracts:
         functor
     """
+    __slots__ = ()
     functor: InvariantFunctor[Domain, Codomain]
 
     def __add__(self, a: EitherDomain) -> Codomain:
@@ -20,7 +20,7 @@ Notes
 Advanced - and unnecessary for now:
 * operators on Dimension, that promotes it to a Leaf
 """
-from typing import Union
+from typing import Iterable, Iterator, List, Union
 from numbers import Number
 import operator
 
@@ -35,6 +35,8 @@ class Unit(UnitsType, metaclass=UnitMeta):
         UnitsLeaf
         UnitsStem
     """
+    __slots__ = ()
+
     @classmethod
     def __call__(cls, value: Union[str, Number]):
         return cls.simple_constructor(value)
@@ -44,10 +46,21 @@ class Unit(UnitsType, metaclass=UnitMeta):
         if isinstance(value, Number):
             return Scalar(value)
         elif isinstance(value, str):
-            return DimensionNode(Dimension(value, value))
+            if value.isidentifier():
+                return DimensionNode(Dimension(value))
+            # A compound unit, such as 'kg*m/s^2'
+            # parser.py builds on this module, so is imported on first use
+            from .parser import parse_unit
+            return parse_unit(value)
         else:
             raise UnitsTypeError("Attempted to construct unit for: {0}".format(value))
 
+    def __reduce__(self):
+        """Pickled flat, without its parent - see serialize.reduce_tree."""
+        # serialize.py builds on this module, so is imported on first use
+        from .serialize import reduce_tree
+        return reduce_tree(self)
+
     @classmethod
     def explicit_constructor(cls, dimension: Dimension, value: Number = 1, parent: Union['UnitsStem', None] = None):
         if (dimension is NullUnit):
@@ -60,12 +73,12 @@ class UnitsLeaf(Unit):
     """Base class for leaf-nodes
     Terminal unit: Unit = Dimension x Exponent
     """
-    pass
+    __slots__ = ()
 
 
 class UnitsStem(Unit):
     """Base class for stem nodes."""
-    pass
+    __slots__ = ()
 
 
 class DimensionNode(UnitsLeaf):
@@ -73,6 +86,7 @@ class DimensionNode(UnitsLeaf):
     For example, both `feet` and `seconds^2` would be
     Compound units (such as `feet-)
     """
+    __slots__ = ('dimension', 'value', 'parent')
 
     @classmethod
     def __call__(cls, *args):
@@ -112,9 +126,55 @@ class NumberScalarInvariantFunctor(InvariantFunctor['Scalar', Number]):
     def destruct(self, codomain: 'Scalar') -> Number:
         return codomain.value
 
+    def destruct_many(self, codomains: Iterable['Scalar']) -> List[Number]:
+        return [codomain.value for codomain in codomains]
+
+    def construct_many(self, domains: Iterable[Number],
+                       lazy: bool = False) -> Union[List['Scalar'], Iterator['Scalar']]:
+        # Skips the metaclass __call__ for each result
+        make = self.Codomain._make
+        if lazy:
+            return (make(domain) for domain in domains)
+        return [make(domain) for domain in domains]
+
+
+# Operand types Scalar's fast path handles, by exact type: a Scalar, whose
+# number is its value, or a number used as it is.
+# Any other operand - subclasses and bool included - takes the functor path.
+_SCALAR = 'scalar'
+_NUMBER = 'number'
+_FAST_OPERANDS = {int: _NUMBER, float: _NUMBER, complex: _NUMBER}
+
+
+def _fast_operator(name: str, function, reflected: bool = False):
+    """Scalar operator method: exact Scalar op (Scalar | int | float | complex)
+    runs function on the numbers directly, allocating only the result.
+    Everything else is handled by the ArithmeticSyntaxMixin method."""
+    general = getattr(ArithmeticSyntaxMixin, name)
+
+    def method(self, a):
+        if self.__class__ is Scalar:
+            kind = _FAST_OPERANDS.get(a.__class__)
+            if kind is _SCALAR:
+                a = a.value
+            elif kind is not _NUMBER:
+                return general(self, a)
+            if reflected:
+                return Scalar._make(function(a, self.value))
+            return Scalar._make(function(self.value, a))
+        return general(self, a)
+    method.__name__ = name
+    method.__qualname__ = 'Scalar.' + name
+    return method
+
 
 class Scalar(UnitsLeaf, ArithmeticSyntaxMixin['Scalar', Number]):
     """Leaf node representing a pure number with no units."""
+    __slots__ = ('dimension', 'value', 'parent')
+
+    # One functor per concrete class, shared by all of its instances
+    _functors = {}
+
     @property
     def functor(self) -> NumberScalarInvariantFunctor:
         """
@@ -122,9 +182,11 @@ class Scalar(UnitsLeaf, ArithmeticSyntaxMixin['Scalar', Number]):
         on the concrete class at run-time.
         """
         cls = self.__class__
-        if not hasattr(self, '_functor'):
-            self._functor = NumberScalarInvariantFunctor(Number, cls)
-        return self._functor
+        try:
+            return Scalar._functors[cls]
+        except KeyError:
+            functor = Scalar._functors[cls] = NumberScalarInvariantFunctor(Number, cls)
+            return functor
 
     @classmethod
     def __call__(cls, *args):
@@ -137,6 +199,31 @@ class Scalar(UnitsLeaf, ArithmeticSyntaxMixin['Scalar', Number]):
         self.value = value
         self.parent = parent
 
+    @classmethod
+    def _make(cls, value: Number) -> 'Scalar':
+        """Fast internal constructor, for a Scalar without a parent."""
+        self = object.__new__(cls)
+        self.dimension = NullUnit
+        self.value = value
+        self.parent = None
+        return self
+
+    # Fast path for the common case - see _fast_operator
+    __add__ = _fast_operator('__add__', operator.__add__)
+    __radd__ = _fast_operator('__radd__', operator.__add__, reflected=True)
+    __sub__ = _fast_operator('__sub__', operator.__sub__)
+    __rsub__ = _fast_operator('__rsub__', operator.__sub__, reflected=True)
+    __mul__ = _fast_operator('__mul__', operator.__mul__)
+    __rmul__ = _fast_operator('__rmul__', operator.__mul__, reflected=True)
+    __truediv__ = _fast_operator('__truediv__', operator.__truediv__)
+    __rtruediv__ = _fast_operator('__rtruediv__', operator.__truediv__, reflected=True)
+    __floordiv__ = _fast_operator('__floordiv__', operator.__floordiv__)
+    __rfloordiv__ = _fast_operator('__rfloordiv__', operator.__floordiv__, reflected=True)
+    __mod__ = _fast_operator('__mod__', operator.__mod__)
+    __rmod__ = _fast_operator('__rmod__', operator.__mod__, reflected=True)
+    __pow__ = _fast_operator('__pow__', operator.__pow__)
+    __rpow__ = _fast_operator('__rpow__', operator.__pow__, reflected=True)
+
     def __str__(self):
         return str(self.value)
 
@@ -152,6 +239,9 @@ class Scalar(UnitsLeaf, ArithmeticSyntaxMixin['Scalar', Number]):
             return False
 
 
+_FAST_OPERANDS[Scalar] = _SCALAR
+
+
 # class UnitsFunction:
 #     """Binary function to operate on the tree.
 #     Each UnitStem has one function contained in it.
@@ -0,0 +1,162 @@
+"""
+Dense exponent-vector signature for compound dimensions.
+
+    kg * m / s^2  ~  DimensionVector over (kg, m, s) = (1, 1, -2)
+
+Multiplying and dividing compound dimensions becomes adding and subtracting
+vectors, and comparing two compound dimensions becomes a tuple comparison -
+instead of walking and simplifying the Unit tree each time.
+"""
+from itertools import zip_longest
+from typing import Tuple, Iterator
+
+from .base import UnitsError, UnitsTypeError
+from .dimension import Dimension, NullUnit
+from .units import Unit, Scalar, DimensionNode
+from .arithmetic import (
+    UnitsFunction, UnitsFunctionStem, Add, Subtract, Multiply, Divide
+)
+
+
+class DimensionVector:
+    """Integer exponents over the registered base Dimensions.
+
+    Position i holds the exponent of the Dimension with id i. Trailing zeros
+    are trimmed, so vectors built before a new Dimension was registered still
+    compare equal to those built after it.
+    The dimensionless vector (NullUnit) is the empty tuple.
+    """
+    __slots__ = ('exponents',)
+
+    def __init__(self, exponents: Tuple[int, ...] = ()):
+        exponents = tuple(exponents)
+        end = len(exponents)
+        while end and not exponents[end - 1]:
+            end -= 1
+        self.exponents = exponents[:end]
+
+    @classmethod
+    def zero(cls) -> 'DimensionVector':
+        return cls(())
+
+    @classmethod
+    def from_dimension(cls, dimension: Dimension, exponent: int = 1) -> 'DimensionVector':
+        if dimension == NullUnit or exponent == 0:
+            return cls.zero()
+        if exponent != int(exponent):
+            raise UnitsTypeError(str.format(
+                "Exponent of '{0}' is not an integer: {1}", dimension, exponent
+            ))
+        exponents = [0] * (dimension.id + 1)
+        exponents[-1] = int(exponent)
+        return cls(exponents)
+
+    @classmethod
+    def from_unit(cls, unit: Unit) -> 'DimensionVector':
+        """Resolve the compound dimension of a Unit tree.
+        Scalars are dimensionless. Add and Subtract require both
+        sides to have the same dimension.
+        Uses an explicit stack, so arbitrarily deep trees can be resolved.
+        """
+        results = []
+        stack = [(unit, False)]
+        while stack:
+            unit, expanded = stack.pop()
+            if expanded:
+                right, left = results.pop(), results.pop()
+                results.append(cls.combine(unit.units_function, left, right))
+            elif isinstance(unit, Scalar):
+                results.append(cls.zero())
+            elif isinstance(unit, DimensionNode):
+                results.append(cls.from_dimension(unit.dimension, unit.value))
+            elif isinstance(unit, UnitsFunctionStem):
+                stack.append((unit, True))
+                stack.append((unit.right, False))
+                stack.append((unit.left, False))
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of Unit".format(
+                    unit.__class__.__name__
+                ))
+        return results.pop()
+
+    @classmethod
+    def combine(cls, units_function: UnitsFunction,
+                left: 'DimensionVector', right: 'DimensionVector') -> 'DimensionVector':
+        """Dimension of applying units_function to two resolved dimensions."""
+        if units_function is Multiply:
+            return left * right
+        elif units_function is Divide:
+            return left / right
+        elif units_function in (Add, Subtract):
+            if left != right:
+                raise UnitsError(str.format(
+                    "Cannot {0} '{1}' and '{2}'", units_function.name, left, right
+                ))
+            return left
+        else:
+            raise UnitsTypeError(str.format(
+                "No dimension rule for UnitsFunction {0}", units_function
+            ))
+
+    def to_unit(self) -> Unit:
+        """Build a Unit tree of DimensionNodes - one per Dimension, carrying its
+        exponent - joined by Multiply stems.
+        """
+        units = [DimensionNode(dimension, exponent) for dimension, exponent in self.items()]
+        if not units:
+            return Scalar(1)
+        root = units[0]
+        for unit in units[1:]:
+            root = UnitsFunctionStem(None, Multiply, root, unit)
+            root.left.parent = root
+            root.right.parent = root
+        return root
+
+    def items(self) -> Iterator[Tuple[Dimension, int]]:
+        """(Dimension, exponent) pairs, for non-zero exponents."""
+        for position, exponent in enumerate(self.exponents):
+            if exponent:
+                yield Dimension.interned[position], exponent
+
+    def is_dimensionless(self) -> bool:
+        return not self.exponents
+
+    def __mul__(self, other: 'DimensionVector') -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+        return DimensionVector(
+            a + b for a, b in zip_longest(self.exponents, other.exponents, fillvalue=0)
+        )
+
+    def __truediv__(self, other: 'DimensionVector') -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+        return DimensionVector(
+            a - b for a, b in zip_longest(self.exponents, other.exponents, fillvalue=0)
+        )
+
+    def __pow__(self, power: int) -> 'DimensionVector':
+        if not isinstance(power, int):
+            return NotImplemented
+        return DimensionVector(exponent * power for exponent in self.exponents)
+
+    def __eq__(self, other):
+        if isinstance(other, DimensionVector):
+            return self.exponents == other.exponents
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self.exponents)
+
+    def __str__(self):
+        if self.is_dimensionless():
+            return str(NullUnit)
+        return "*".join(
+            str(dimension) if exponent == 1
+            else "{0}^{1}".format(dimension, exponent)
+            for dimension, exponent in self.items()
+        )
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, self.exponents)
@@ -4,19 +4,39 @@ cd py-arithmetic-units\
 py -m unittest tree_tests
 """
 import unittest
-from typing import Mapping, Optional, Union, Callable, Tuple, Sequence
+import gc
+import io
+import itertools
+import json
+import pickle
+import collections.abc
+from typing import Mapping, Optional, Union, Callable, Tuple, Sequence, Any, Dict, List, TypeVar
 import operator
 from numbers import Number
 
 from unit_tree import (
     Tree, Empty, Leaf, Node,
-    TreeMeta, UnitsError,
+    TreeMeta, UnitsError, UnitsTypeError,
     TreeBase, UnitBase,
     Dimension, NullUnit,
     UnitTree, UnitNode, UnitLeaf, UnitEmpty, UnitTreeFunction,
-    TreeFunction, Add, Subtract, Multiply, Divide, TreeArithmeticSyntax
+    TreeFunction, Add, Subtract, Multiply, Divide, TreeArithmeticSyntax,
+    DimensionVector, TreeInterner, Simplifier, simplify_tree, compile_tree,
+    Column, CsvReader, JsonlReader, Pipeline, parse_unit,
+    encode_tree, decode_tree, BulkPool, simplify_many, evaluate_many
+)
+from unit_tree import meets as meets_module
+from unit_tree import pipeline as pipeline_module
+from unit_tree.meets import meets, _handle_as_type, _register, cache_results, clear_caches, compile_type
+from unit_tree.support import dfs
+from unit_tree import instrumentation
+from unit_tree.base import identity
+from unit_tree.cache import SimplificationCache, CacheInfo
+from unit_tree.bulk import chunk_encodings
+from unit_tree.simplify import (
+    signature, SCALAR, DIMENSION, NODE,
+    ScalarApplication, RightIdentity, DimensionCancellation, TreeLaw
 )
-from unit_tree.meets import meets, _handle_as_type, _register
 
 _default_type_mapping = {
     TreeBase: False,
@@ -92,6 +112,43 @@ def validate_subclasses(test, subject, type_mapping: Mapping[type, bool]):
 #         self.assertTrue(Dimension('feet') is feet)
 
 
+class DimensionInterningTests(unittest.TestCase):
+
+    def test_registry_interns(self):
+        feet = Dimension('feet')
+        self.assertIs(Dimension('feet'), feet)
+        self.assertIs(Dimension.interned[feet.id], feet)
+        self.assertIs(Dimension('NullUnit'), NullUnit)
+
+    def test_dense_ids(self):
+        ids = [dimension.id for dimension in Dimension.interned]
+        self.assertEqual(ids, list(range(len(Dimension.interned))))
+
+    def test_hash_as_dict_key(self):
+        totals = {Dimension('feet'): 1, Dimension('seconds'): 2}
+        totals[Dimension('feet')] += 10
+        self.assertEqual(totals[Dimension('feet')], 11)
+        self.assertEqual(len(totals), 2)
+
+    def test_ordering(self):
+        # Registered out of order - ranks are recomputed on the next comparison
+        zebra, apple = Dimension('zebra-interning'), Dimension('apple-interning')
+        self.assertTrue(Dimension._stale)
+        self.assertLess(apple.rank, zebra.rank)
+        self.assertFalse(Dimension._stale)
+        mango = Dimension('mango-interning')
+        self.assertEqual(sorted([zebra, mango, apple]), [apple, mango, zebra])
+        self.assertLess(apple, zebra)
+        self.assertGreater(zebra, apple)
+        self.assertEqual(sorted([zebra, apple]), [apple, zebra])
+        self.assertLess(Dimension(None), apple)
+
+    def test_pickle_interns(self):
+        feet = Dimension('feet')
+        self.assertIs(pickle.loads(pickle.dumps(feet)), feet)
+        self.assertIs(pickle.loads(pickle.dumps(NullUnit)), NullUnit)
+
+
 class TreeTests(unittest.TestCase):
     """
     Methods to test:
@@ -240,6 +297,50 @@ class TreeTests(unittest.TestCase):
         after = Tree.join(noddy)
         self.assertEqual(after, node)
 
+    def test_empty_flyweight(self):
+        self.assertIs(Empty(), Empty())
+        self.assertIs(Tree(), Empty())
+        self.assertIs(UnitTree(), UnitEmpty())
+        self.assertIsNot(UnitEmpty(), Empty())
+
+    def test_slotted_nodes(self):
+        for tree in (Empty(), Leaf(1), Node(1, 2, 3), UnitEmpty(), UnitLeaf(1)):
+            self.assertFalse(hasattr(tree, '__dict__'), tree.__class__.__name__)
+
+    def test_map_nested(self):
+        tree = Node(Leaf('+'), Leaf(1), Node(Leaf('*'), Leaf(2), Empty()))
+        mapped = Tree.map(tree, lambda value: value * 2)
+        self.assertEqual(mapped, Node(Leaf('++'), Leaf(2), Node(Leaf('**'), Leaf(4), Empty())))
+        self.assertIs(Tree.map(Empty(), str), Empty())
+
+    def test_fold_order(self):
+        tree = Node(Leaf('b'), Leaf('a'), Node(Leaf('d'), Leaf('c'), Leaf('e')))
+        self.assertEqual(Tree.fold(tree, lambda value, acc: value + acc, ''), 'abcde')
+
+    def test_join(self):
+        self.assertEqual(Tree.join(Leaf(Leaf(Leaf(1)))), Leaf(1))
+        self.assertEqual(
+            Tree.join(Node(Leaf(Leaf('x')), Leaf(Node('y')), Empty())),
+            Node(Leaf('x'), Node('y'), Empty())
+        )
+        self.assertIsNone(Tree.join(Leaf(Empty())))
+
+    def test_traverse(self):
+        tree = Tree.traverse(Node(Leaf('x'), Leaf(1), Leaf(2)), lambda v: Node(v) if v == 1 else v)
+        self.assertEqual(tree, Node(Leaf('x'), Node(1), Leaf(2)))
+
+    def test_deep_tree(self):
+        # Deeper than the default recursion limit
+        depth = 5000
+        tree = Leaf(0)
+        for i in range(1, depth):
+            tree = Node(Leaf(Multiply), tree, Leaf(i))
+        self.assertEqual(Tree.fold(Tree.map(tree, str), lambda v, acc: acc + 1, 0), 2 * depth - 1)
+        self.assertEqual(len(list(dfs(tree))), 2 * depth - 1)
+        self.assertEqual(hash(tree), hash(Tree.map(tree, identity)))
+        self.assertEqual(tree, Tree.map(tree, identity))
+        self.assertEqual(DimensionVector.from_tree(tree), DimensionVector.zero())
+
     def test_type_dispatching(self):
         # Node(Node(Node('x')))
         self._validate_node(Node('x'), Leaf('x'), Empty(), Empty())
@@ -302,10 +403,14 @@ class UnitTreeTests(unittest.TestCase):
         self._validate_empty(self.construct())
 
     def test_unittree_maybe(self):
-        # Test that the subclass version doesn't dispatch on instances of the Parent class
-        self.assertEqual(UnitTree.maybe(Leaf(5), lambda x: x * 3), Leaf(5))
-        # Confirm that it doesn't work on non-tree objects
-        self.assertRaises(UnitsError, lambda: UnitTree.maybe(5, lambda x: x + 3))
+        # Test that the subclass version doesn't dispatch on instances of the Parent class -
+        # a plain Leaf is neither a UnitTree nor in its domain, as for UnitNode(Multiply, m, Leaf(2))
+        with self.assertRaisesRegex(UnitsTypeError, r"^Leaf is not a subtype of tree, nor in the domain 'typing.Union\["):
+            UnitTree.maybe(Leaf(5), lambda x: x * 3)
+        # Confirm that it doesn't work on non-tree objects - values in the domain
+        # go to _not, and anything else is rejected
+        self.assertEqual(UnitTree.maybe(5, lambda x: x + 3), 5)
+        self.assertRaises(UnitsError, lambda: UnitTree.maybe('5', lambda x: x + 3))
 
     # def test_basic_operator_syntax(self):
     #     # Leaf(5) * Leaf(3)
@@ -354,6 +459,284 @@ class UnitTreeTests(unittest.TestCase):
     #
     # (feet * seconds / feet * (pounds / (feet * feet)))
 
+    def test_make(self):
+        feet = UnitLeaf(Dimension('feet'))
+        function = UnitLeaf(Multiply)
+        made = UnitNode._make(function, feet, UnitLeaf(2))
+        self.assertIsInstance(made, UnitNode)
+        self.assertEqual(made, UnitNode(Multiply, feet, 2))
+        self.assertIs(made.left, feet)
+        self.assertEqual(UnitLeaf._make(3), UnitLeaf(3))
+
+    def test_operators_share_function_leaf(self):
+        a, b = UnitLeaf(2), UnitLeaf(Dimension('feet'))
+        self.assertIs((a * b).value, (b * a).value)
+        self.assertIsNot((a * b).value, (a / b).value)
+        self.assertIs((a * b).left, a)
+        self.assertEqual(a * b, UnitNode(Multiply, a, b))
+        self.assertEqual(3 - b, UnitNode(Subtract, UnitLeaf(3), b))
+
+    def test_operators_check_raw_operands(self):
+        with self.assertRaises(UnitsTypeError):
+            UnitLeaf(2) * 'x'
+
+    def test_operators_check_tree_operands(self):
+        feet = UnitLeaf(Dimension('feet'))
+        # Once a UnitLeaf has been through the fast path, a plain Leaf still is not
+        self.assertIs((feet * UnitLeaf(2)).right.__class__, UnitLeaf)
+        with self.assertRaises(UnitsTypeError):
+            feet * Leaf(2)
+        with self.assertRaises(UnitsTypeError):
+            Leaf(2) / feet
+        with self.assertRaises(UnitsTypeError):
+            UnitNode(Multiply, feet, Leaf(2))
+
+    def test_operand_classes_held(self):
+        # Ids are only reused once an object is freed - so the classes skipping
+        # the checks must stay alive, however short-lived they would otherwise be
+        class Temporary(UnitLeaf):
+            __slots__ = ()
+        self.assertIsInstance(UnitLeaf(1) * Temporary(2), UnitNode)
+        key = id(Temporary)
+        del Temporary
+        gc.collect()
+        codomain, operands = TreeFunction._operands[id(UnitNode)]
+        self.assertIs(codomain, UnitNode)
+        self.assertEqual(operands[key].__name__, 'Temporary')
+
+
+class DimensionVectorTests(unittest.TestCase):
+
+    def test_multiply_and_divide(self):
+        kg, m, s = (DimensionVector.from_dimension(Dimension(name)) for name in ('kg', 'm', 's'))
+        newton = kg * m / (s ** 2)
+        self.assertEqual(newton, m * kg / s / s)
+        self.assertNotEqual(newton, kg * m / s)
+        self.assertTrue((newton / newton).is_dimensionless())
+        self.assertEqual(newton / newton, DimensionVector.zero())
+
+    def test_null_unit_is_dimensionless(self):
+        self.assertEqual(DimensionVector.from_dimension(NullUnit), DimensionVector.zero())
+
+    def test_from_tree(self):
+        kg, m, s = UnitLeaf(Dimension('kg')), UnitLeaf(Dimension('m')), UnitLeaf(Dimension('s'))
+        tree = Divide(Multiply(Multiply(kg, m), UnitLeaf(3)), Multiply(s, s))
+        self.assertEqual(
+            DimensionVector.from_tree(tree),
+            DimensionVector.from_dimension(Dimension('kg'))
+            * DimensionVector.from_dimension(Dimension('m'))
+            / DimensionVector.from_dimension(Dimension('s'), 2)
+        )
+        self.assertTrue(DimensionVector.from_tree(Multiply(UnitLeaf(2), UnitLeaf(3))).is_dimensionless())
+
+    def test_from_tree_mismatched_addition(self):
+        tree = Add(UnitLeaf(Dimension('m')), UnitLeaf(Dimension('s')))
+        self.assertRaises(UnitsError, lambda: DimensionVector.from_tree(tree))
+
+    def test_round_trip(self):
+        vector = (
+            DimensionVector.from_dimension(Dimension('kg'))
+            / DimensionVector.from_dimension(Dimension('s'), 2)
+        )
+        tree = vector.to_tree()
+        self.assertIsInstance(tree, UnitTree)
+        self.assertEqual(DimensionVector.from_tree(tree), vector)
+        self.assertEqual(DimensionVector.zero().to_tree(), UnitLeaf(1))
+
+
+class TreeInternerTests(unittest.TestCase):
+
+    def test_structural_sharing(self):
+        interner = TreeInterner()
+        feet = Dimension('feet')
+        first = interner(Multiply, interner(feet), interner(2))
+        second = interner(Multiply, feet, 2)
+        self.assertIs(first, second)
+        self.assertIs(first.left, interner(feet))
+        self.assertIsInstance(first, UnitNode)
+
+    def test_intern_existing_tree(self):
+        interner = TreeInterner()
+        feet = UnitLeaf(Dimension('feet'))
+        built = Multiply(Multiply(feet, UnitLeaf(3)), Multiply(feet, UnitLeaf(3)))
+        canonical = interner.intern(built)
+        self.assertEqual(canonical, built)
+        self.assertIs(canonical.left, canonical.right)
+        self.assertIs(interner.intern(built), canonical)
+
+    def test_value_types_stay_distinct(self):
+        interner = TreeInterner()
+        self.assertIsNot(interner(1), interner(1.0))
+        self.assertIsNot(interner(1), interner(True))
+
+    def test_unhashable_leaf(self):
+        interner = TreeInterner()
+        self.assertEqual(interner([1]), UnitLeaf([1]))
+
+    def test_weak_eviction(self):
+        interner = TreeInterner()
+        tree = interner(Multiply, Dimension('feet'), 'evicted')
+        self.assertGreater(len(interner), 0)
+        del tree
+        gc.collect()
+        self.assertEqual(len(interner), 0)
+
+    def test_cached_hash(self):
+        tree = Node(Multiply, Leaf(2), Leaf(3))
+        self.assertEqual(hash(tree), hash(Node(Multiply, 2, 3)))
+        self.assertEqual(hash(Leaf(5)), hash(UnitLeaf(5)))
+        self.assertNotEqual(tree, Node(Multiply, Leaf(3), Leaf(2)))
+
+
+class CompileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.feet, self.seconds = Dimension('feet'), Dimension('seconds')
+
+    def test_compile(self):
+        feet, seconds = UnitLeaf(self.feet), UnitLeaf(self.seconds)
+        speed = (feet * 2) / seconds - feet / seconds
+        compiled = speed.compile()
+        self.assertEqual(compiled.parameters, (self.feet, self.seconds))
+        self.assertEqual(compiled(10, 4), 10 * 2 / 4 - 10 / 4)
+        self.assertEqual(compiled.evaluate({'feet': 10, self.seconds: 4}), 10 * 2 / 4 - 10 / 4)
+        self.assertRaises(UnitsError, lambda: compiled.evaluate({'feet': 10}))
+
+    def test_resolved_dimension(self):
+        compiled = (UnitLeaf(self.feet) * UnitLeaf(self.feet) / UnitLeaf(self.seconds)).compile()
+        self.assertEqual(
+            compiled.dimension,
+            DimensionVector.from_dimension(self.feet, 2) / DimensionVector.from_dimension(self.seconds)
+        )
+        self.assertRaises(UnitsError, lambda: (UnitLeaf(self.feet) + UnitLeaf(self.seconds)).compile())
+
+    def test_cached(self):
+        tree = UnitLeaf(self.feet) * 3
+        self.assertIs(tree.compile(), tree.compile())
+        # Structurally equal trees share the compiled function
+        self.assertIs(tree.compile(), (UnitLeaf(self.feet) * 3).compile())
+        self.assertEqual((UnitLeaf(self.feet) * 3.0).compile()(2), 6.0)
+
+    def test_cached_by_type(self):
+        # Leaf(2) == Leaf(2.0), but their constants differ in type
+        as_float = UnitLeaf(self.feet) * UnitLeaf(2.0)
+        self.assertIs(as_float.compile()(3).__class__, float)
+        result = (UnitLeaf(self.feet) * UnitLeaf(2)).compile().evaluate({'feet': 3})
+        self.assertEqual(result, 6)
+        self.assertIs(result.__class__, int)
+
+    def test_subtract(self):
+        self.assertIs(TreeFunction.lift(operator.__sub__), Subtract)
+        self.assertEqual((UnitLeaf(7) - UnitLeaf(2)).compile()(), 5)
+
+    def test_deep_tree(self):
+        tree = UnitLeaf(self.feet)
+        for i in range(5000):
+            tree = UnitNode(UnitLeaf(Add), tree, UnitLeaf(self.feet))
+        self.assertEqual(tree.compile()(2), 10002)
+
+
+class SimplifyTests(unittest.TestCase):
+
+    def setUp(self):
+        self.feet = Dimension('feet')
+
+    def test_signature(self):
+        tree = UnitLeaf(2) * UnitLeaf(self.feet)
+        self.assertEqual(signature(tree), (Multiply, SCALAR, DIMENSION))
+        self.assertEqual(signature(tree + tree), (Add, NODE, NODE))
+        self.assertIsNone(signature(UnitLeaf(2)))
+
+    def test_simplify(self):
+        feet = UnitLeaf(self.feet)
+        self.assertEqual(simplify_tree((UnitLeaf(2) * 3) * feet), UnitLeaf(6) * feet)
+        self.assertEqual(simplify_tree((feet * 1 + 0) / feet), UnitLeaf(1))
+        self.assertEqual(simplify_tree(UnitLeaf(7) - UnitLeaf(2) * 3), UnitLeaf(1))
+        self.assertIsInstance(simplify_tree(feet * (UnitLeaf(2) + 3)), UnitNode)
+
+    def test_indexed_candidates(self):
+        simplifier = Simplifier()
+        self.assertEqual(
+            simplifier.candidates((Divide, DIMENSION, DIMENSION)),
+            (DimensionCancellation,)
+        )
+        self.assertEqual(simplifier.candidates((Multiply, NODE, NODE)), ())
+
+    def test_statistics(self):
+        simplifier = Simplifier()
+        feet = UnitLeaf(self.feet)
+        simplifier.simplify((feet * 2) * 1)
+        self.assertEqual(simplifier.statistics[RightIdentity].misses, 1)
+        self.assertEqual(simplifier.statistics[RightIdentity].hits, 1)
+        self.assertEqual(simplifier.statistics[ScalarApplication].hits, 0)
+        simplifier.reset_statistics()
+        self.assertEqual(simplifier.statistics[RightIdentity].hits, 0)
+
+    def test_law_not_implemented(self):
+        class Declined(TreeLaw):
+            tree_functions = (Multiply,)
+        simplifier = Simplifier((Declined, RightIdentity))
+        tree = UnitLeaf(self.feet) * 1
+        self.assertIs(simplifier.simplify(tree), tree.left)
+        self.assertEqual(simplifier.statistics[Declined].misses, 1)
+        self.assertIs(Simplifier((Declined,)).simplify(tree), tree)
+
+    def test_cache(self):
+        cache = SimplificationCache(maxsize=1)
+        simplifier = Simplifier(cache=cache)
+        feet = UnitLeaf(self.feet)
+        first = simplifier.simplify(feet * (UnitLeaf(2) * 3))
+        self.assertIs(simplifier.simplify(feet * (UnitLeaf(2) * 3)), first)
+        self.assertEqual(simplifier.statistics[ScalarApplication].hits, 1)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=1, currsize=1))
+        # Leaf values are keyed along with their type
+        self.assertIsInstance(simplifier.simplify(UnitLeaf(2.0) * 3).value, float)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_deep_tree(self):
+        tree = UnitLeaf(self.feet)
+        for i in range(5000):
+            tree = tree * 1
+        self.assertEqual(simplify_tree(tree), UnitLeaf(self.feet))
+
+
+try:
+    import numpy
+    from unit_tree import evaluate_columns
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "evaluate_columns requires numpy")
+class ColumnarTests(unittest.TestCase):
+
+    def setUp(self):
+        self.feet, self.seconds = Dimension('feet'), Dimension('seconds')
+        self.speed = (UnitLeaf(self.feet) * 2 - UnitLeaf(self.feet)) / UnitLeaf(self.seconds)
+
+    def test_evaluate_columns(self):
+        result = evaluate_columns(self.speed, {
+            self.feet: numpy.array([10.0, 20.0, 30.0]),
+            'seconds': [2.0, 4.0, 5.0],
+        })
+        self.assertTrue(numpy.array_equal(result.values, [5.0, 5.0, 6.0]))
+        self.assertEqual(
+            result.dimension,
+            DimensionVector.from_dimension(self.feet) / DimensionVector.from_dimension(self.seconds)
+        )
+
+    def test_broadcast_scalar(self):
+        result = evaluate_columns(self.speed, {'feet': [10.0, 20.0], 'seconds': 5.0})
+        self.assertTrue(numpy.array_equal(result.values, [2.0, 4.0]))
+
+    def test_mismatched_columns(self):
+        self.assertRaises(UnitsError, lambda: evaluate_columns(
+            self.speed, {'feet': [1.0, 2.0], 'seconds': [1.0, 2.0, 3.0]}))
+        self.assertRaises(UnitsError, lambda: evaluate_columns(
+            UnitLeaf(self.feet) + UnitLeaf(self.seconds), {'feet': [1.0], 'seconds': [1.0]}))
+
 
 # class UnitTreeOperatorTests(unittest.TestCase):
 #     def test_syntax_mixin_map(self):
@@ -394,6 +777,270 @@ class UnitTreeTests(unittest.TestCase):
 #         self.assertEqual(waaaat, Scalar(2 + 3 + 4 + 5))
 
 
+class ParserTests(unittest.TestCase):
+
+    def setUp(self):
+        self.kg, self.m, self.s = (UnitLeaf(Dimension(name)) for name in ('kg', 'm', 's'))
+
+    def test_parse(self):
+        kg, m, s = self.kg, self.m, self.s
+        self.assertEqual(parse_unit('kg*m/s^2'), kg * m / (s * s))
+        self.assertEqual(parse_unit('kg \u00b7 m / (s**2)'), kg * m / (s * s))
+        self.assertEqual(parse_unit('J/kg/K'), UnitLeaf(Dimension('J')) / kg / UnitLeaf(Dimension('K')))
+        self.assertEqual(parse_unit('2.5*m'), UnitLeaf(2.5) * m)
+        self.assertEqual(parse_unit('(m/s)^2'), (m / s) * (m / s))
+        self.assertEqual(UnitTree.parse('kg'), kg)
+
+    def test_exponents(self):
+        m = self.m
+        self.assertEqual(parse_unit('m^-2'), 1 / (m * m))
+        self.assertEqual(parse_unit('m^(-1)'), 1 / m)
+        self.assertEqual(parse_unit('m\u00b2'), m * m)
+        self.assertEqual(parse_unit('m\u207b\u00b9'), 1 / m)
+        self.assertEqual(parse_unit('m^0'), UnitLeaf(1))
+        self.assertEqual(parse_unit('10^3'), UnitLeaf(1000))
+
+    def test_cached(self):
+        self.assertIs(parse_unit('kg*m/s^2'), parse_unit('kg*m/s^2'))
+
+    def test_errors(self):
+        for text in ('', 'kg m', 'm^1.5', 'm/', '(m', 'm)', 'm $ s', 'm^x',
+                     '0^-1', '0.0\u207b\u00b9', '1e300^2', 'm^9999', '(m/s)^-65'):
+            with self.assertRaises(UnitsError, msg=text):
+                parse_unit(text)
+
+    def test_exponent_errors_reported_at_power(self):
+        with self.assertRaisesRegex(UnitsError, r"'\^'.*, at 1 in unit '0\^-1'"):
+            parse_unit('0^-1')
+        with self.assertRaisesRegex(UnitsError, r"at most 64 either way, not 9999, at 1"):
+            parse_unit('m^9999')
+        self.assertEqual(parse_unit('m^-64'), 1 / parse_unit('m^64'))
+
+
+class SerializeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.m, self.s = UnitLeaf(Dimension('m')), UnitLeaf(Dimension('s'))
+
+    def test_round_trip(self):
+        m, s = self.m, self.s
+        tree = (m * 2 - s / 2.5) * (m + True) / (s * 3j) - (-300)
+        decoded = decode_tree(encode_tree(tree))
+        self.assertEqual(decoded, tree)
+        self.assertIsInstance(decoded, UnitNode)
+        self.assertIsInstance(decoded.right.value, int)
+        # Function leaves are shared with trees built by operators
+        self.assertIs(decoded.value, (m - s).value)
+
+    def test_plain_trees(self):
+        for tree in (Node(Leaf(1), Leaf(Add), Empty()), Leaf(Divide), Empty(), UnitEmpty()):
+            decoded = decode_tree(encode_tree(tree))
+            self.assertEqual(decoded, tree)
+            self.assertIs(decoded.__class__, tree.__class__)
+
+    def test_dimension_table(self):
+        m, s = self.m, self.s
+        data = encode_tree(m * m * m / s)
+        self.assertEqual(data.count(b'm'), 1)
+        self.assertEqual(data.count(b's'), 1)
+        numbered = UnitLeaf(Dimension(7)) * UnitLeaf(NullUnit)
+        self.assertEqual(decode_tree(encode_tree(numbered)), numbered)
+
+    def test_buffers(self):
+        tree = self.m / self.s
+        data = encode_tree(tree)
+        for buffer in (data, bytearray(data), memoryview(data), memoryview(b'..' + data)[2:]):
+            self.assertEqual(decode_tree(buffer), tree)
+
+    def test_deep(self):
+        tree = self.m
+        for _ in range(5000):
+            tree = tree * self.s
+        self.assertEqual(decode_tree(encode_tree(tree)), tree)
+
+    def test_mixed_families(self):
+        with self.assertRaises(UnitsTypeError):
+            encode_tree(self.m * Leaf(2))
+        with self.assertRaises(UnitsTypeError):
+            encode_tree(UnitLeaf('m'))
+
+    def test_errors(self):
+        data = encode_tree(self.m / self.s)
+        for bad in (b'', b'PU\x01', data[:-1], data + data[-1:], data[:3] + b'\x07' + data[4:],
+                    # Dimension identifier b'\xff', which is not UTF-8
+                    b'UT\x01\x01\x01\x01\x01\xff\x00'):
+            with self.assertRaises(UnitsError, msg=bad):
+                decode_tree(bad)
+
+    def test_pickle(self):
+        m, s = self.m, self.s
+        for tree in (m * 2 / s, Node(Leaf(1), Leaf(Add), Empty())):
+            loaded = pickle.loads(pickle.dumps(tree))
+            self.assertEqual(loaded, tree)
+            self.assertIs(loaded.__class__, tree.__class__)
+        loaded = pickle.loads(pickle.dumps(m / s))
+        self.assertIs(loaded.left.value, m.value)
+        self.assertIs(pickle.loads(pickle.dumps(UnitEmpty())), UnitEmpty())
+
+    def test_pickle_unencodable(self):
+        # Leaf values encode_tree does not cover pickle as a flat tuple
+        tree = UnitLeaf('m') * self.s
+        loaded = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(loaded, tree)
+        self.assertIs(loaded.right.value, self.s.value)
+
+
+class BulkTests(unittest.TestCase):
+
+    def setUp(self):
+        m, s = UnitLeaf(Dimension('m')), UnitLeaf(Dimension('s'))
+        self.trees = [m * (s / s), (m * 2) * 3 / s, m / 1, UnitLeaf(4) * 5] * 10
+
+    def test_simplify_many(self):
+        expected = [simplify_tree(tree) for tree in self.trees]
+        with BulkPool(workers=2) as pool:
+            # chunk_bytes=1 - a chunk per tree, so the pool is used
+            self.assertEqual(pool.simplify_many(self.trees, chunk_bytes=1), expected)
+            self.assertEqual(pool.simplify_many(iter(self.trees), chunk_bytes=1), expected)
+        self.assertEqual(simplify_many(self.trees, workers=1), expected)
+
+    def test_evaluate_many(self):
+        bindings = {'m': 10, Dimension('s'): 4}
+        expected = [compile_tree(tree).evaluate(bindings) for tree in self.trees]
+        self.assertEqual(evaluate_many(self.trees, bindings, workers=2, chunk_bytes=1), expected)
+        # Too small to fill two chunks, so run in this process
+        self.assertEqual(evaluate_many(self.trees, bindings, workers=2), expected)
+        m = UnitLeaf(Dimension('m'))
+        values = evaluate_many([m * UnitLeaf(2.0), m * UnitLeaf(2)], {'m': 3}, workers=1)
+        self.assertEqual([value.__class__ for value in values], [float, int])
+
+    def test_errors(self):
+        with self.assertRaises(UnitsError):
+            BulkPool(workers=0)
+        with self.assertRaises(UnitsError):
+            evaluate_many(self.trees, {'m': 10}, workers=2, chunk_bytes=1)
+
+    def test_chunk_encodings(self):
+        encodings = [b'x' * 10] * 10
+        self.assertEqual([len(chunk) for chunk in chunk_encodings(encodings, 2, chunk_bytes=30)], [3, 3, 3, 1])
+        # Small batches are one chunk - MIN_CHUNK_BYTES
+        self.assertEqual(len(chunk_encodings(encodings, 4)), 1)
+        self.assertEqual(chunk_encodings([], 4), [])
+
+
+class PipelineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.meters, self.seconds = Dimension('meters'), Dimension('seconds')
+        self.speed = UnitLeaf(self.meters) / UnitLeaf(self.seconds)
+
+    def test_csv(self):
+        reader = CsvReader(io.StringIO("id,distance[meters],time [ seconds ]\n1,10,2\n2,9,3\n3,8,4\n"))
+        self.assertEqual(reader.columns[1], Column('distance', 'meters', self.meters))
+        self.assertIs(reader.columns[2].dimension, self.seconds)
+        self.assertIsNone(reader.columns[0].dimension)
+        pipeline = Pipeline(self.speed, chunk_size=2)
+        self.assertEqual(list(pipeline.run(reader)), [[5.0, 3.0], [2.0]])
+        self.assertEqual(pipeline.dimension, DimensionVector.from_tree(self.speed))
+
+    def test_csv_bad_rows(self):
+        with self.assertRaisesRegex(UnitsError, r"^Row 3 has 1 cells, expected 2$"):
+            list(CsvReader(io.StringIO("a[meters],b[seconds]\n1,2\n3\n")).rows(['a', 'b']))
+        with self.assertRaisesRegex(UnitsError, r"^Row 2 has 'x' in column 'b', which is not a number$"):
+            list(CsvReader(io.StringIO("a[meters],b[seconds]\n1,x\n")).rows(['a', 'b']))
+        # Only the cells read must be there
+        self.assertEqual(list(CsvReader(io.StringIO("a[meters],b[seconds]\n1\n")).rows(['a'])), [(1.0,)])
+
+    def test_jsonl(self):
+        lines = [
+            json.dumps({'d': {'value': 10, 'unit': 'meters'}, 't': 2}),
+            "",
+            json.dumps({'d': {'value': 3, 'unit': 'meters'}, 't': 3}),
+        ]
+        reader = JsonlReader(lines, units={'t': 'seconds'})
+        self.assertEqual([column.dimension for column in reader.columns], [self.meters, self.seconds])
+        self.assertEqual(list(Pipeline(self.speed).run(reader)), [[5.0, 1.0]])
+
+    def test_jsonl_unit_changes(self):
+        lines = [
+            json.dumps({'d': {'value': 10, 'unit': 'meters'}, 't': {'value': 2, 'unit': 'seconds'}}),
+            json.dumps({'d': {'value': 10, 'unit': 'feet'}, 't': {'value': 2, 'unit': 'seconds'}}),
+        ]
+        with self.assertRaises(UnitsError):
+            list(Pipeline(self.speed).run(JsonlReader(lines)))
+
+    def test_bindings(self):
+        csv = "start[meters],end[meters],time[seconds]\n1,5,2\n"
+        with self.assertRaises(UnitsError):
+            list(Pipeline(self.speed).run(CsvReader(io.StringIO(csv))))
+        pipeline = Pipeline(self.speed, bindings={'meters': 'end'})
+        self.assertEqual(list(pipeline.run(CsvReader(io.StringIO(csv)))), [[2.5]])
+
+    def test_streams(self):
+        # An endless input, consumed one chunk at a time
+        lines = itertools.chain(["distance[meters],time[seconds]"], ("6,3" for _ in itertools.count()))
+        chunks = Pipeline(self.speed, chunk_size=3).run(CsvReader(lines))
+        self.assertEqual(next(chunks), [2.0, 2.0, 2.0])
+        self.assertEqual(next(chunks), [2.0, 2.0, 2.0])
+
+    def test_same_results_without_numpy(self):
+        area = UnitLeaf(self.meters) * UnitLeaf(self.meters)
+        lines = [json.dumps({'d': 3}), json.dumps({'d': 2 ** 53 + 1})]
+        csv = "distance[meters],time[seconds]\n6,3\n6,0\n"
+        with_numpy = pipeline_module.numpy
+        try:
+            for numpy_module in (with_numpy, None):
+                pipeline_module.numpy = numpy_module
+                results = list(Pipeline(area).run(JsonlReader(lines, units={'d': 'meters'})))
+                self.assertEqual(results, [[9, (2 ** 53 + 1) ** 2]])
+                self.assertIs(results[0][0].__class__, int)
+                with self.assertRaises(ZeroDivisionError):
+                    list(Pipeline(self.speed).run(CsvReader(io.StringIO(csv))))
+        finally:
+            pipeline_module.numpy = with_numpy
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_leaves_methods_unwrapped(self):
+        original = Node.__dict__['_make']
+        instrumentation.enable()
+        self.assertIsNot(Node.__dict__['_make'], original)
+        instrumentation.disable()
+        self.assertIs(Node.__dict__['_make'], original)
+        UnitLeaf(2) * 3
+        self.assertEqual(instrumentation.snapshot()['TreeFunction.apply'].calls, 0)
+
+    def test_counts(self):
+        a = UnitLeaf(2)
+        with instrumentation.instrumented():
+            tree = a * a
+            Tree.map(tree, str)
+        self.assertFalse(instrumentation.is_enabled())
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats['TreeFunction.apply'].calls, 1)
+        self.assertEqual(stats['Tree.map'].calls, 1)
+        self.assertGreater(stats['Tree.map'].seconds, 0)
+        # a * a, then the copy made by map: 1 node and 3 leaves
+        self.assertEqual(stats['nodes'].calls, 5)
+
+    def test_reset_and_export(self):
+        with instrumentation.instrumented():
+            UnitLeaf(2) * 3
+        exported = instrumentation.export()
+        self.assertEqual(exported['TreeFunction.apply']['calls'], 1)
+        self.assertIsInstance(exported['TreeFunction.apply'], dict)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot()['TreeFunction.apply'], (0, 0.0))
+
+
 class MeetsTests(unittest.TestCase):
     """
     Add tests:
@@ -426,6 +1073,81 @@ class MeetsTests(unittest.TestCase):
         self.assertFalse(meets('x', Optional[int]))
         self.assertFalse(meets(list, Optional[list]))
 
+    def test_compiled_once(self):
+        clear_caches()
+        self.assertTrue(meets(3, Union[int, str]))
+        predicate = meets_module._predicates[Union[int, str]]
+        self.assertEqual(predicate.__defaults__[1], (int, str))
+        self.assertFalse(meets(3.0, Union[int, str]))
+        self.assertIs(compile_type(Union[int, str]), predicate)
+
+    def test_register_clears_cache(self):
+        class Marker:
+            pass
+        self.assertFalse(meets(3, Marker))
+        _register(Marker)(lambda instance, _type: True)
+        try:
+            self.assertTrue(meets(3, Marker))
+        finally:
+            del meets_module._registry[Marker]
+            clear_caches()
+
+    def test_cached_results(self):
+        cache_results()
+        try:
+            self.assertTrue(meets(3, int))
+            self.assertFalse(meets('x', int))
+            self.assertTrue(meets(True, int))
+            self.assertEqual(meets_module._results, {(int, int): True, (str, int): False, (bool, int): True})
+            # Only plain classes - a Union is a single compiled isinstance already
+            self.assertTrue(meets(None, Optional[int]))
+            self.assertEqual(len(meets_module._results), 3)
+        finally:
+            cache_results(False)
+        self.assertEqual(meets_module._results, {})
+
+    def test_compile_union(self):
+        predicate = compile_type(Union[int, Sequence, Dimension])
+        self.assertTrue(predicate(3) and predicate('x') and predicate([]))
+        self.assertFalse(predicate(3.0))
+        # Collapsed into a single isinstance over a tuple - with typing.Sequence
+        # replaced by the class it stands for
+        self.assertEqual(predicate.__defaults__[1], (int, collections.abc.Sequence, Dimension))
+        self.assertIs(compile_type(Union[int, Sequence, Dimension]), predicate)
+
+    def test_compile_special_types(self):
+        self.assertTrue(compile_type(Any)(object()))
+        self.assertTrue(compile_type(Optional[int])(None))
+        self.assertFalse(compile_type(Optional[int])('x'))
+        self.assertTrue(compile_type(Node[int, int, int])(Node(3, 3, 3)))
+        self.assertFalse(compile_type(Node[int, int, int])(Leaf(3)))
+        self.assertTrue(compile_type(Tuple[int, str])((1, 'x')))
+        self.assertTrue(compile_type(Callable[[int], int])(len))
+        self.assertTrue(compile_type(Union[str, Any])(3))
+
+    def test_meets_generics(self):
+        self.assertTrue(meets(Node(3, 3, 3), Node[int, int, int]))
+        self.assertFalse(meets(Leaf(3), Node[int, int, int]))
+        self.assertTrue(meets([1, 2], List[int]))
+        self.assertFalse(meets([1, 'x'], List[int]))
+        self.assertTrue(meets((1, 'x'), Tuple[int, str]))
+        self.assertFalse(meets((1, 2), Tuple[int, str]))
+        self.assertFalse(meets((1,), Tuple[int, str]))
+        self.assertTrue(meets((1, 2, 3), Tuple[int, ...]))
+        self.assertFalse(meets({'a': 'b'}, Dict[str, int]))
+        self.assertTrue(meets({'a': [1]}, Dict[str, List[int]]))
+        # A Union member with arguments to check is not collapsed
+        self.assertFalse(meets(['x'], Union[int, List[int]]))
+        self.assertTrue(meets(['x'], Union[int, List[TypeVar('T')]]))
+        self.assertTrue(meets(len, Callable[[int], int]))
+
+    def test_compile_unittree_domain(self):
+        in_domain = compile_type(UnitTree.domain)
+        for value in (3, 2.5, Dimension('feet'), Multiply):
+            self.assertTrue(in_domain(value), value)
+        for value in ('feet', TreeFunction.registry, Leaf):
+            self.assertFalse(in_domain(value), value)
+
     def test_tree(self):
         @_register(Tree)
         def meets_Tree(instance, tree_type):
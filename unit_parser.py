@@ -0,0 +1,190 @@
+"""
+Parser of unit expressions, such as 'kg*m/s^2' or 'N·m / (s^2)', shared by
+py_units and unit_tree - each parses with a Builder of its own trees, so this
+module depends on neither package, and they do not depend on each other.
+
+Grammar, tokenized in one pass:
+    product  := power (('*' | '/' | '·' | '⋅' | '×') power)*
+    power    := atom (('^' | '**') exponent | superscript)?
+    exponent := sign? NUMBER | '(' sign? NUMBER ')'
+    atom     := NUMBER | NAME | '(' product ')'
+
+Names are passed to Builder.leaf as strings, for it to make Dimensions of.
+Exponents must be integers, of at most MAX_EXPONENT either way. Operators
+associate to the left, so 'J/kg/K' is (J / kg) / K. Juxtaposition is not
+multiplication: write 'N*m', not 'N m'.
+
+Every malformed expression raises Builder.error, with the position in the
+string - including a number raised to a power it cannot be, as in '0^-1'.
+"""
+import re
+from abc import ABCMeta, abstractmethod
+from numbers import Number
+from typing import Any, List, Tuple, Type, Union
+
+
+# Raising a group multiplies out this many copies of it
+MAX_EXPONENT = 64
+
+# Superscript digits are \w, so names exclude them: 'm²' is m squared
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<name>[^\W\d⁰¹²³⁴⁵⁶⁷⁸⁹][^\W⁰¹²³⁴⁵⁶⁷⁸⁹]*)
+      | (?P<power>\*\*|\^)
+      | (?P<superscript>[⁻⁺]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+      | (?P<operator>[*/·⋅×])
+      | (?P<sign>[-+])
+      | (?P<open>\()
+      | (?P<close>\))
+    )""", re.VERBOSE)
+_SUPERSCRIPTS = str.maketrans('⁻⁺⁰¹²³⁴⁵⁶⁷⁸⁹', '-+0123456789')
+_DIVIDE = '/'
+# Token kinds, as named in error messages
+_EXPECTED = {'number': "a number", 'open': "'('", 'close': "')'"}
+
+# (kind, text, position in the string)
+Token = Tuple[str, str, int]
+
+
+def tokenize(text: str, error: Type[Exception] = ValueError) -> List[Token]:
+    tokens = []
+    position, end = 0, len(text.rstrip())
+    while position < end:
+        match = _TOKEN.match(text, position)
+        if match is None:
+            position = end - len(text[position:end].lstrip())
+            raise error("Unexpected character {0!r}, at {1} in unit {2!r}".format(
+                text[position], position, text))
+        tokens.append((match.lastgroup, match.group(match.lastgroup), match.start(match.lastgroup)))
+        position = match.end()
+    return tokens
+
+
+class Builder(metaclass=ABCMeta):
+    """
+    Makes the trees of one package, for Parser.
+
+    Abstracts:
+        leaf
+        stem
+        power
+    """
+    # Raised for every malformed expression - each package's UnitsError
+    error = ValueError  # type: Type[Exception]
+
+    @abstractmethod
+    def leaf(self, value: Union[Number, str]) -> Any:
+        """Tree of a number, or of the Dimension a name is the identifier of."""
+        return NotImplemented
+
+    @abstractmethod
+    def stem(self, divide: bool, left: Any, right: Any) -> Any:
+        """left / right if divide, otherwise left * right."""
+        return NotImplemented
+
+    @abstractmethod
+    def power(self, tree: Any, exponent: int) -> Any:
+        """tree ^ exponent. May raise ZeroDivisionError or OverflowError,
+        raising a number."""
+        return NotImplemented
+
+
+class Parser:
+    """Recursive descent over the tokens of one string. Recursion is only
+    as deep as the parentheses are nested."""
+    __slots__ = ('text', 'builder', 'tokens', 'index')
+
+    def __init__(self, text: str, builder: Builder):
+        self.text = text
+        self.builder = builder
+        self.tokens = tokenize(text, builder.error)
+        self.index = 0
+
+    def parse(self) -> Any:
+        if not self.tokens:
+            raise self.builder.error("Empty unit expression")
+        tree = self.product()
+        if self.index < len(self.tokens):
+            self.error("Unexpected {0!r}")
+        return tree
+
+    def peek(self) -> str:
+        return self.tokens[self.index][0] if self.index < len(self.tokens) else 'end'
+
+    def take(self, kind: str) -> str:
+        if self.peek() != kind:
+            self.error("Expected {0}, not {{0!r}}".format(_EXPECTED.get(kind, kind)))
+        text = self.tokens[self.index][1]
+        self.index += 1
+        return text
+
+    def error(self, message: str):
+        """Raise builder.error at the current token - which fills in {0!r} in message."""
+        if self.index < len(self.tokens):
+            kind, text, position = self.tokens[self.index]
+        else:
+            text, position = 'end', len(self.text)
+        raise self.builder.error("{0}, at {1} in unit {2!r}".format(message.format(text), position, self.text))
+
+    def product(self) -> Any:
+        tree = self.power()
+        while self.peek() == 'operator':
+            operator = self.take('operator')
+            right = self.power()
+            tree = self.builder.stem(operator == _DIVIDE, tree, right)
+        return tree
+
+    def power(self) -> Any:
+        tree = self.atom()
+        # Errors in raising are reported at the '^' or superscript
+        start = self.index
+        kind = self.peek()
+        if kind == 'power':
+            self.take('power')
+            exponent = self.exponent()
+        elif kind == 'superscript':
+            exponent = int(self.take('superscript').translate(_SUPERSCRIPTS))
+        else:
+            return tree
+        if abs(exponent) > MAX_EXPONENT:
+            self.index = start
+            self.error("Exponent of {{0!r}} must be at most {0} either way, not {1}".format(
+                MAX_EXPONENT, exponent))
+        try:
+            return self.builder.power(tree, exponent)
+        except (ZeroDivisionError, OverflowError) as error:
+            self.index = start
+            self.error("Cannot raise by {{0!r}}: {0}".format(error))
+
+    def exponent(self) -> int:
+        parenthesized = self.peek() == 'open'
+        if parenthesized:
+            self.take('open')
+        sign = self.take('sign') if self.peek() == 'sign' else ''
+        if self.peek() == 'number' and _number(self.tokens[self.index][1]) % 1:
+            self.error("Exponent must be an integer, not {0!r}")
+        exponent = int(_number(sign + self.take('number')))
+        if parenthesized:
+            self.take('close')
+        return exponent
+
+    def atom(self) -> Any:
+        kind = self.peek()
+        if kind == 'number':
+            return self.builder.leaf(_number(self.take('number')))
+        elif kind == 'name':
+            return self.builder.leaf(self.take('name'))
+        elif kind == 'open':
+            self.take('open')
+            tree = self.product()
+            self.take('close')
+            return tree
+        self.error("Expected a number, name or '(', not {0!r}")
+
+
+def _number(text: str) -> Number:
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
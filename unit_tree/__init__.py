@@ -7,6 +7,15 @@ from .support import (bfs, dfs)
 from .dimension import (Dimension, NullUnit)
 from .unit_tree import (UnitTree, UnitEmpty, UnitLeaf, UnitNode, UnitTreeFunction)
 from .syntax import (TreeFunction, Add, Subtract, Multiply, Divide, TreeArithmeticSyntax)
+from .vector import DimensionVector
+from .hashcons import TreeInterner
+from .compiler import CompiledTree, compile_tree
+from .cache import SimplificationCache
+from .simplify import TreeLaw, Simplifier, simplify_tree
+from .pipeline import Column, CsvReader, JsonlReader, Pipeline
+from .parser import parse_unit
+from .serialize import encode_tree, decode_tree
+from .bulk import BulkPool, simplify_many, evaluate_many
 
 __all__ = (
     Tree, Empty, Leaf, Node, bfs, dfs,
@@ -15,5 +24,20 @@ __all__ = (
     TreeBase, UnitBase,
     Dimension, NullUnit,
     TreeFunction, Add, Subtract, Multiply, Divide, TreeArithmeticSyntax,
-    UnitTree, UnitEmpty, UnitLeaf, UnitNode, UnitTreeFunction
+    UnitTree, UnitEmpty, UnitLeaf, UnitNode, UnitTreeFunction,
+    DimensionVector, TreeInterner,
+    CompiledTree, compile_tree,
+    SimplificationCache, TreeLaw, Simplifier, simplify_tree,
+    Column, CsvReader, JsonlReader, Pipeline,
+    parse_unit,
+    encode_tree, decode_tree,
+    BulkPool, simplify_many, evaluate_many
 )
+
+try:
+    # evaluate_columns requires the optional dependency NumPy
+    from .columnar import ColumnResult, evaluate_columns
+except ImportError:
+    pass
+else:
+    __all__ += (ColumnResult, evaluate_columns)
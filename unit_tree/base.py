@@ -33,6 +33,9 @@ class TreeBase(metaclass=TreeMeta):
     """
     Provides convenient access to the meta, and the common __call__ override.
     """
+    # Generic subclasses (Tree) cannot declare __weakref__ themselves
+    __slots__ = ('__weakref__',)
+
     @classmethod
     def __call__(cls, *args):
         self = object.__new__(cls)
@@ -41,7 +44,7 @@ class TreeBase(metaclass=TreeMeta):
 
 
 class UnitBase(TreeBase):
-    pass
+    __slots__ = ()
 
 
 class NotPassed:
@@ -0,0 +1,182 @@
+"""
+Simplify or evaluate many independent UnitTrees across a pool of processes.
+
+    simplified = simplify_many(trees, workers=8)
+    speeds = evaluate_many(trees, {'meters': 100.0, 'seconds': 9.58})
+
+    # Or keep the workers - and their caches - across batches
+    with BulkPool(workers=8) as pool:
+        for batch in batches:
+            results = pool.simplify_many(batch)
+
+Results come back in the order of the input. Trees travel to and from the
+workers as their binary encoding (see serialize.py), grouped into chunks of
+about the same number of encoded bytes - so a chunk of tiny trees holds many
+more trees than a chunk of large ones, and each round trip to a worker is
+worth its overhead. Chunks are sized for a few per worker, which balances the
+load, and clamped between MIN_CHUNK_BYTES and MAX_CHUNK_BYTES. A batch too
+small to fill more than one chunk runs in this process, without the pool.
+
+Each worker is a long-lived process: it interns the Dimensions registered in
+the parent when it starts, and keeps its Dimension registry warm from one
+chunk to the next - along with a cache of results by encoding, so repeated
+expressions are simplified or compiled once per worker.
+
+Trees must be encodable by encode_tree - of Dimensions, numbers and the
+arithmetic TreeFunctions.
+"""
+import functools
+import multiprocessing
+import os
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .base import UnitsError
+from .dimension import Dimension
+from .tree import Tree
+from .compiler import CompiledTree, compile_tree
+from .simplify import simplify_tree
+from .serialize import encode_tree, decode_tree
+
+
+# Below this, a round trip to a worker costs more than it saves
+MIN_CHUNK_BYTES = 16 * 1024
+MAX_CHUNK_BYTES = 4 * 1024 * 1024
+# Chunks per worker, so that a slow chunk does not leave the others idle
+CHUNKS_PER_WORKER = 4
+# Distinct encodings each worker remembers the result of
+WORKER_CACHE_SIZE = 4096
+
+Chunk = List[bytes]
+Bindings = Mapping[Union[Dimension, Any], Any]
+
+
+def chunk_encodings(encodings: Sequence[bytes], workers: int,
+                    chunk_bytes: Optional[int] = None) -> List[Chunk]:
+    """Consecutive runs of encodings, of about chunk_bytes each - by default,
+    sized for CHUNKS_PER_WORKER chunks per worker."""
+    if chunk_bytes is None:
+        total = sum(len(encoding) for encoding in encodings)
+        chunk_bytes = min(max(total // (workers * CHUNKS_PER_WORKER), MIN_CHUNK_BYTES), MAX_CHUNK_BYTES)
+    chunks = []
+    chunk, size = [], 0
+    for encoding in encodings:
+        chunk.append(encoding)
+        size += len(encoding)
+        if size >= chunk_bytes:
+            chunks.append(chunk)
+            chunk, size = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _initialize(identifiers: Tuple[Any, ...]):
+    """Runs once in each worker - interns the parent's Dimensions up front."""
+    for identifier in identifiers:
+        Dimension(identifier)
+
+
+# Cached by encoding, as equal trees encode to equal bytes
+@functools.lru_cache(maxsize=WORKER_CACHE_SIZE)
+def _simplify(encoding: bytes) -> bytes:
+    return encode_tree(simplify_tree(decode_tree(encoding)))
+
+
+@functools.lru_cache(maxsize=WORKER_CACHE_SIZE)
+def _compile(encoding: bytes) -> CompiledTree:
+    # Skips decoding, as well as compiling
+    return compile_tree(decode_tree(encoding))
+
+
+def _simplify_chunk(chunk: Chunk) -> Chunk:
+    return [_simplify(encoding) for encoding in chunk]
+
+
+def _evaluate_chunk(task: Tuple[Chunk, Bindings]) -> List[Any]:
+    chunk, bindings = task
+    return [_compile(encoding).evaluate(bindings) for encoding in chunk]
+
+
+class BulkPool:
+    """A pool of worker processes, started on first use.
+    workers defaults to the number of CPUs; with 1, every batch runs in
+    this process.
+    """
+    def __init__(self, workers: Optional[int] = None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise UnitsError("workers must be at least 1, not {0}".format(workers))
+        self.workers = workers
+        self._pool = None
+
+    def _map(self, function, tasks: List[Any]) -> Iterator[Any]:
+        if self._pool is None:
+            identifiers = tuple(dimension.identifier for dimension in Dimension.interned)
+            self._pool = multiprocessing.Pool(self.workers, _initialize, (identifiers,))
+        # imap keeps the order of the tasks
+        return self._pool.imap(function, tasks)
+
+    def _chunks(self, trees: List[Tree], chunk_bytes: Optional[int]) -> Optional[List[Chunk]]:
+        """Chunks of the encoded trees - or None, if the batch is better
+        run in this process."""
+        if self.workers == 1:
+            return None
+        chunks = chunk_encodings([encode_tree(tree) for tree in trees], self.workers, chunk_bytes)
+        return chunks if len(chunks) > 1 else None
+
+    def simplify_many(self, trees: Iterable[Tree], chunk_bytes: Optional[int] = None) -> List[Tree]:
+        """simplify_tree of each tree, in order."""
+        trees = list(trees)
+        chunks = self._chunks(trees, chunk_bytes)
+        if chunks is None:
+            return [simplify_tree(tree) for tree in trees]
+        return [decode_tree(encoding) for chunk in self._map(_simplify_chunk, chunks) for encoding in chunk]
+
+    def evaluate_many(self, trees: Iterable[Tree], bindings: Bindings,
+                      chunk_bytes: Optional[int] = None) -> List[Any]:
+        """Value of each tree, in order, with its Dimension leaves bound as
+        by CompiledTree.evaluate - by Dimension, or by identifier."""
+        trees = list(trees)
+        chunks = self._chunks(trees, chunk_bytes)
+        if chunks is None:
+            return [compile_tree(tree).evaluate(bindings) for tree in trees]
+        tasks = [(chunk, bindings) for chunk in chunks]
+        return [value for values in self._map(_evaluate_chunk, tasks) for value in values]
+
+    def close(self):
+        """Stop the workers, once they finish their chunks."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        """Stop the workers now."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> 'BulkPool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def simplify_many(trees: Iterable[Tree], workers: Optional[int] = None,
+                  chunk_bytes: Optional[int] = None) -> List[Tree]:
+    """simplify_tree of each tree, in order, on a pool started for this batch."""
+    with BulkPool(workers) as pool:
+        return pool.simplify_many(trees, chunk_bytes)
+
+
+def evaluate_many(trees: Iterable[Tree], bindings: Bindings, workers: Optional[int] = None,
+                  chunk_bytes: Optional[int] = None) -> List[Any]:
+    """Value of each tree, in order, on a pool started for this batch."""
+    with BulkPool(workers) as pool:
+        return pool.evaluate_many(trees, bindings, chunk_bytes)
@@ -0,0 +1,90 @@
+"""
+Bounded least-recently-used cache of simplified trees.
+
+    cache = SimplificationCache(maxsize=512)
+    simplifier = Simplifier(cache=cache)
+    simplifier.simplify(tree)   # rewrites, and remembers the result
+    simplifier.simplify(tree)   # a structurally equal tree skips the rewrite
+    cache.info()                # CacheInfo(hits=1, misses=1, maxsize=512, currsize=1)
+"""
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Tuple
+
+from .base import NotPassed
+from .tree import Tree, Leaf, Node
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class SimplificationCache:
+    """Maps structural keys to simplified trees, evicting the least
+    recently used entry once maxsize is reached.
+    maxsize=None leaves the cache unbounded.
+    """
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key, or NotPassed."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return NotPassed
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry, and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def structural_key(tree: Tree) -> Tuple[Hashable, ...]:
+    """Flat pre-order tuple identifying tree up to structure.
+
+    Unlike Tree.__eq__, leaf values are compared along with their type,
+    so Leaf(1) and Leaf(1.0) - which simplify differently - get different keys.
+    Flat, so hashing the key never recurses however deep the tree is.
+    """
+    key = []
+    stack = [tree]
+    while stack:
+        tree = stack.pop()
+        if isinstance(tree, Node):
+            key.append(tree.__class__)
+            stack.append(tree.right)
+            stack.append(tree.left)
+            stack.append(tree.value)
+        elif isinstance(tree, Leaf):
+            if isinstance(tree.value, Tree):
+                key.append((tree.__class__, Tree))
+                stack.append(tree.value)
+            else:
+                key.append((tree.__class__, tree.value.__class__, tree.value))
+        else:
+            # Empty
+            key.append(tree.__class__)
+    return tuple(key)
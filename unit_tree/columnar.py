@@ -0,0 +1,42 @@
+"""
+Evaluate one UnitTree over whole NumPy columns.
+
+    feet, seconds = Dimension('feet'), Dimension('seconds')
+    speed = UnitLeaf(feet) / UnitLeaf(seconds)
+    result = evaluate_columns(speed, {'feet': [10, 20], 'seconds': [2, 4]})
+    result.values      # array([5., 5.])
+    result.dimension   # DimensionVector: feet*seconds^-1
+
+The tree is compiled once (see compiler.py), so its dimension is resolved
+once per batch rather than once per row, and each Node runs as a single
+vectorized NumPy operation over the columns.
+
+Requires NumPy.
+"""
+from collections import namedtuple
+from typing import Any, Mapping, Union
+
+import numpy
+
+from .base import UnitsError
+from .dimension import Dimension
+from .tree import Tree
+from .compiler import compile_tree
+
+
+ColumnResult = namedtuple('ColumnResult', ['values', 'dimension'])
+
+
+def evaluate_columns(tree: Tree, columns: Mapping[Union[Dimension, Any], Any]) -> ColumnResult:
+    """Bind each Dimension leaf to a column - keyed by Dimension or by
+    its identifier - and evaluate the tree over all rows at once.
+    Scalars in 'columns' are broadcast across the rows.
+    """
+    compiled = compile_tree(tree)
+    arrays = {key: numpy.asarray(column) for key, column in columns.items()}
+    lengths = {len(array) for array in arrays.values() if array.ndim}
+    if len(lengths) > 1:
+        raise UnitsError(str.format(
+            "Columns have different lengths: {0}", sorted(lengths)
+        ))
+    return ColumnResult(numpy.asarray(compiled.evaluate(arrays)), compiled.dimension)
@@ -0,0 +1,168 @@
+"""
+Compile a UnitTree into a plain Python function.
+
+    feet, seconds = Dimension('feet'), Dimension('seconds')
+    speed = (UnitLeaf(feet) * 2) / UnitLeaf(seconds)
+    compiled = speed.compile()
+    compiled(10, 4)                              # 5.0
+    compiled.evaluate({'feet': 10, 'seconds': 4})  # 5.0
+    compiled.dimension                           # DimensionVector: feet*seconds^-1
+
+Dimension leaves become the positional parameters - in order of first
+appearance, left to right - and Number leaves become constants. The tree is
+flattened into straight-line code, one local assignment per Node:
+
+    def compiled(x0, x1):
+        t0 = x0 * c0
+        t1 = t0 / x1
+        return t1
+
+so calling it does no tree walking and no TreeFunction dispatch, and the
+generated code does not nest however deep the tree is.
+The dimension of the result is resolved once, when compiling.
+"""
+from numbers import Number
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
+
+from .base import UnitsError, UnitsTypeError, NotPassed
+from .dimension import Dimension
+from .tree import Tree, Empty, Leaf, Node
+from .syntax import TreeFunction
+from .vector import DimensionVector
+from .cache import SimplificationCache, structural_key
+
+
+# Operators written inline, rather than called through the namespace
+INFIX = {'+', '-', '*', '/'}
+
+COMPILE_CACHE_SIZE = 1024
+
+# Structurally equal trees share one compiled function. Keyed by
+# structural_key, rather than by tree: Leaf(2) == Leaf(2.0), but their
+# constants - and so results - differ in type.
+_cache = SimplificationCache(maxsize=COMPILE_CACHE_SIZE)
+
+
+class CompiledTree:
+    """Callable produced by compiling a UnitTree.
+
+    function: the generated function - call it directly in a hot loop,
+        to skip one layer of call overhead
+    parameters: the Dimensions bound by each positional argument
+    dimension: DimensionVector of the result
+    source: the generated Python source
+    """
+    __slots__ = ('function', 'parameters', 'dimension', 'source', '__weakref__')
+
+    def __init__(self, function: Callable[..., Any], parameters: Tuple[Dimension, ...],
+                 dimension: DimensionVector, source: str):
+        self.function = function
+        self.parameters = parameters
+        self.dimension = dimension
+        self.source = source
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+    def evaluate(self, bindings: Mapping[Union[Dimension, Any], Any]) -> Any:
+        """Call with values looked up by Dimension, or by Dimension identifier."""
+        args = []
+        for dimension in self.parameters:
+            if dimension in bindings:
+                args.append(bindings[dimension])
+            elif dimension.identifier in bindings:
+                args.append(bindings[dimension.identifier])
+            else:
+                raise UnitsError(str.format(
+                    "No value bound for dimension '{0}'", dimension
+                ))
+        return self.function(*args)
+
+    def __repr__(self):
+        return str.format(
+            "{0}({1}) -> {2}", self.__class__.__name__,
+            ", ".join(str(dimension) for dimension in self.parameters),
+            self.dimension
+        )
+
+
+def compile_tree(tree: Tree) -> CompiledTree:
+    """Compiled function for tree, built once per distinct tree."""
+    try:
+        key = structural_key(tree)
+        compiled = _cache.get(key)
+    except TypeError:
+        # Unhashable leaf value - cannot be cached
+        return _compile(tree)
+    if compiled is NotPassed:
+        compiled = _compile(tree)
+        _cache.put(key, compiled)
+    return compiled
+
+
+def _compile(tree: Tree) -> CompiledTree:
+    dimension = DimensionVector.from_tree(tree)
+
+    parameters = {}  # type: Dict[Dimension, str]
+    namespace = {}  # type: Dict[str, Any]
+    lines = []  # type: List[str]
+    results = []  # type: List[str]
+
+    stack = [(tree, False)]
+    while stack:
+        tree, expanded = stack.pop()
+        if expanded:
+            right, left = results.pop(), results.pop()
+            tree_function = _tree_function(tree)
+            name = "t{0}".format(len(lines))
+            if tree_function.short in INFIX:
+                expression = "{0} {1} {2}".format(left, tree_function.short, right)
+            else:
+                function = "f{0}".format(len(namespace))
+                namespace[function] = tree_function.operator
+                expression = "{0}({1}, {2})".format(function, left, right)
+            lines.append("    {0} = {1}".format(name, expression))
+            results.append(name)
+        elif isinstance(tree, Empty):
+            raise UnitsTypeError("Cannot compile a tree with an Empty operand")
+        elif isinstance(tree, Leaf):
+            if isinstance(tree.value, Tree):
+                stack.append((tree.value, False))
+            elif isinstance(tree.value, Dimension):
+                if tree.value not in parameters:
+                    parameters[tree.value] = "x{0}".format(len(parameters))
+                results.append(parameters[tree.value])
+            elif isinstance(tree.value, Number):
+                constant = "c{0}".format(len(namespace))
+                namespace[constant] = tree.value
+                results.append(constant)
+            else:
+                raise UnitsTypeError(str.format(
+                    "Cannot compile leaf value {0}", repr(tree.value)
+                ))
+        elif isinstance(tree, Node):
+            # Operands are pushed right first, so the left is compiled first
+            stack.append((tree, True))
+            stack.append((tree.right, False))
+            stack.append((tree.left, False))
+        else:
+            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                tree.__class__.__name__
+            ))
+
+    source = "def compiled({0}):\n{1}    return {2}\n".format(
+        ", ".join(parameters.values()),
+        "".join(line + "\n" for line in lines),
+        results.pop()
+    )
+    exec(compile(source, "<UnitTree.compile>", "exec"), namespace)
+    return CompiledTree(namespace['compiled'], tuple(parameters), dimension, source)
+
+
+def _tree_function(node: Node) -> TreeFunction:
+    function = node.value.value if isinstance(node.value, Leaf) else node.value
+    if not (isinstance(function, type) and issubclass(function, TreeFunction)):
+        raise UnitsTypeError(str.format(
+            "Node value {0} is not a TreeFunction", repr(node.value)
+        ))
+    return function
@@ -0,0 +1,109 @@
+"""
+Hash-consing for UnitTree: structurally equal trees share one canonical
+instance.
+
+    interner = TreeInterner()
+    a = interner(Multiply, interner(Dimension('feet')), interner(2))
+    b = interner.intern(Multiply(UnitLeaf(Dimension('feet')), UnitLeaf(2)))
+    assert a is b
+
+Canonical trees compare equal by identity - Node.__eq__ checks identity
+first - and cache their hash. The table only holds weak references, so a
+canonical tree is freed as soon as nothing else refers to it.
+"""
+import weakref
+from typing import Any, Hashable
+
+from .base import NotPassed
+from .tree import Tree, Leaf, Node
+from .unit_tree import UnitTree, UnitEmpty, UnitLeaf, UnitNode
+
+
+class TreeInterner:
+    """Opt-in factory returning the canonical instance of each distinct tree.
+
+    Leaves are keyed on their class and value - including the type of
+    the value, so Leaf(1) and Leaf(1.0) stay distinct. Nodes are keyed on their
+    class and the identities of their (already canonical) children.
+    Leaves with unhashable values cannot be interned, and are returned as-is.
+    """
+    def __init__(self):
+        self._table = weakref.WeakValueDictionary()
+
+    def __call__(self, value=NotPassed, left=NotPassed, right=NotPassed) -> UnitTree:
+        """Same signature as UnitTree(...), but returns canonical instances."""
+        if value is NotPassed:
+            return UnitEmpty()
+        elif left is NotPassed and right is NotPassed:
+            return self.leaf(value)
+        else:
+            return self.node(value, left, right)
+
+    def __len__(self):
+        return len(self._table)
+
+    def leaf(self, value: Any) -> UnitTree:
+        if isinstance(value, Tree):
+            return self.intern(value)
+        return self._canonical_leaf(UnitLeaf(value))
+
+    def node(self, value: Any, left: Any = NotPassed, right: Any = NotPassed) -> UnitTree:
+        return self._canonical_node(UnitNode._make(
+            self._child(value), self._child(left), self._child(right)
+        ))
+
+    def intern(self, tree: Tree) -> Tree:
+        """Canonical instance of a tree built by any other means.
+        Keeps the classes of the tree's nodes.
+        Nodes are interned bottom-up from an explicit stack.
+        """
+        results = []
+        stack = [(tree, False)]
+        while stack:
+            tree, expanded = stack.pop()
+            if expanded:
+                right, left, value = results.pop(), results.pop(), results.pop()
+                if not (value is tree.value and left is tree.left and right is tree.right):
+                    tree = tree.__class__._make(value, left, right)
+                results.append(self._canonical_node(tree))
+            elif isinstance(tree, Leaf):
+                results.append(self._canonical_leaf(tree))
+            elif isinstance(tree, Node):
+                stack.append((tree, True))
+                stack.append((tree.right, False))
+                stack.append((tree.left, False))
+                stack.append((tree.value, False))
+            else:
+                # Empty, or not a tree
+                results.append(tree)
+        return results.pop()
+
+    def _child(self, child: Any) -> Tree:
+        if child is NotPassed:
+            return UnitEmpty()
+        return self.leaf(child)
+
+    def _canonical_leaf(self, leaf: Leaf) -> Leaf:
+        value = leaf.value
+        if isinstance(value, Tree):
+            value = self.intern(value)
+            if value is not leaf.value:
+                leaf = leaf.__class__(value)
+            key = (leaf.__class__, Tree, id(value))
+        else:
+            key = (leaf.__class__, value.__class__, value)
+        return self._lookup(key, leaf)
+
+    def _canonical_node(self, node: Node) -> Node:
+        key = (node.__class__, id(node.value), id(node.left), id(node.right))
+        return self._lookup(key, node)
+
+    def _lookup(self, key: Hashable, tree: Tree) -> Tree:
+        try:
+            canonical = self._table.get(key)
+        except TypeError:
+            # Unhashable leaf value
+            return tree
+        if canonical is None:
+            self._table[key] = canonical = tree
+        return canonical
@@ -0,0 +1,120 @@
+"""
+Opt-in call counters and cumulative timers for the unit_tree hot paths.
+
+    from unit_tree import instrumentation
+
+    instrumentation.enable()
+    ... handle a request ...
+    trace.attach(instrumentation.export())
+    instrumentation.reset()
+
+While disabled, the hooked methods are the original functions - nothing is
+wrapped, so there is no overhead at all. enable() replaces each hooked
+method on its class with a counting wrapper, and disable() puts the
+original back.
+
+The statistics are global to the process, not per thread.
+"""
+import functools
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+from .tree import Tree, Leaf, Node
+from .syntax import TreeFunction
+
+
+Stat = namedtuple('Stat', ['calls', 'seconds'])
+
+# name: statistic the hook adds to - several hooks may share one
+# timed: False for hooks too cheap to be worth timing, which are only counted
+Hook = namedtuple('Hook', ['name', 'owner', 'attribute', 'timed'])
+
+HOOKS = (
+    Hook('nodes', Leaf, '__init__', False),
+    Hook('nodes', Leaf, '_make', False),
+    Hook('nodes', Node, '__init__', False),
+    Hook('nodes', Node, '_make', False),
+    Hook('TreeFunction.apply', TreeFunction, 'apply', True),
+    Hook('Tree.map', Tree, 'map', True),
+)
+
+# name --> [calls, seconds]; lists, so wrappers update them in place
+_stats = {hook.name: [0, 0.0] for hook in HOOKS}  # type: Dict[str, List]
+# (owner, attribute, original descriptor), while enabled
+_originals = []
+
+
+def _counted(function: Callable, stat: List) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stat[0] += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def _timed(function: Callable, stat: List) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stat[0] += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stat[1] += time.perf_counter() - start
+    return wrapper
+
+
+def _wrap(descriptor, hook: Hook):
+    """Wrap the function inside a plain, class or static method."""
+    wrap = _timed if hook.timed else _counted
+    stat = _stats[hook.name]
+    if isinstance(descriptor, (classmethod, staticmethod)):
+        return descriptor.__class__(wrap(descriptor.__func__, stat))
+    return wrap(descriptor, stat)
+
+
+def enable():
+    if _originals:
+        return
+    for hook in HOOKS:
+        original = hook.owner.__dict__[hook.attribute]
+        _originals.append((hook.owner, hook.attribute, original))
+        setattr(hook.owner, hook.attribute, _wrap(original, hook))
+
+
+def disable():
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """Enabled for the duration of a with block."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> Dict[str, Stat]:
+    return {name: Stat(*stat) for name, stat in _stats.items()}
+
+
+def reset():
+    for stat in _stats.values():
+        stat[0], stat[1] = 0, 0.0
+
+
+def export() -> Dict[str, Dict[str, float]]:
+    """The statistics as plain dicts - ready for JSON, or a trace."""
+    return {name: dict(stat._asdict()) for name, stat in snapshot().items()}
@@ -41,12 +41,13 @@ Additional goals:
 * Handling for the misc objects in typing.py
 * Handle for variadic Tuples
 """
+import collections.abc
 from typing import (
-    Union, Generic, Callable, Tuple, Optional,
+    Union, Generic, Callable, Tuple, Optional, Type, TypeVar,
     GenericMeta, get_type_hints, Any, Dict
 )
 
-from unit_tree import TreeMeta
+from .base import TreeMeta
 
 
 SpecialTypes = [Union, Generic, Callable, Tuple, Optional]
@@ -58,38 +59,246 @@ def meets(instance, _type):
     """Does instance meet a type-object?
     Basically, an enhanced version of 'isinstance(instance, _type)', but
     works with some of the pieces from the typing module - Union, etc
+
+    _type is compiled into a predicate once, by compile_type, and cached.
+    When cache_results() is on, results for plain classes are also cached,
+    per (type(instance), _type).
+    """
+    if _cache_results and _type.__class__ is type:
+        key = (type(instance), _type)
+        try:
+            return _results[key]
+        except KeyError:
+            pass
+        result = compile_type(_type)(instance)
+        if _class_of(_type) is not None:
+            # Registered handlers may look at more than the class
+            _results[key] = result
+        return result
+    return compile_type(_type)(instance)
+
+
+_registry = {}
+# _type --> function(instance, _type)
+_handlers = {}
+# (type(instance), _type) --> bool, for plain classes
+_results = {}
+_cache_results = False
+
+
+def cache_results(enabled: bool = True):
+    """Turn caching of results for plain classes on or off.
+    Safe as long as isinstance on those classes depends only on the
+    class of the instance - which holds unless instances change class.
+    """
+    global _cache_results
+    _cache_results = enabled
+    _results.clear()
+
+
+def clear_caches():
+    _handlers.clear()
+    _results.clear()
+    _predicates.clear()
+
+
+# _type --> compiled predicate
+_predicates = {}
+
+
+def compile_type(_type) -> Callable[[Any], bool]:
+    """Compile a type-object into a one-argument predicate, once.
+
+        is_domain = compile_type(Union[Type[TreeFunction], Number, Dimension])
+        is_domain(3)         # isinstance(3, (Number, Dimension))
+        is_domain(Multiply)  # issubclass(Multiply, TreeFunction)
+
+    Parameterized generics are checked by their origin class - Tree for
+    Tree[V, L, R], list for List[int] - and then by their concrete
+    arguments, where the origin says what those apply to: each item of a
+    Tuple, each element of a collection such as List[int], and each key
+    and value of a mapping. TypeVar and Any arguments are not checked, nor
+    are the arguments of other generics, such as Callable or Tree.
+    Every member of a Union which comes down to a class check collapses
+    into a single isinstance over a tuple. TypeVars check their bound or
+    constraints, and Type[X] checks for subclasses of X.
+    Registered handlers are honoured; __meets__ hooks on plain classes are not.
     """
+    try:
+        return _predicates[_type]
+    except KeyError:
+        predicate = _predicates[_type] = _compile(_type)
+        return predicate
+    except TypeError:
+        # Unhashable type-object
+        return _compile(_type)
+
+
+def _compile(_type) -> Callable[[Any], bool]:
+    if _type is Any:
+        return _always
+    elif _handle_as_type(_type) is Union:
+        return _compile_union(_type.__args__ or ())
+    elif isinstance(_type, TypeVar):
+        if _type.__bound__ is not None:
+            return compile_type(_type.__bound__)
+        elif _type.__constraints__:
+            return _compile_union(_type.__constraints__)
+        else:
+            return _always
+    elif _root(_type) is Type:
+        return _compile_subclass(_type.__args__[0] if _type.__args__ else object)
+
+    cls = _class_of(_type)
+    if cls is not None:
+        is_instance = _compile_isinstance(cls)
+        arguments = _compile_arguments(_type, cls)
+        if arguments is None:
+            return is_instance
+        return lambda instance: is_instance(instance) and arguments(instance)
+    # Left to the registered handler, or isinstance
+    handler = _handler(_type)
+    return lambda instance: handler(instance, _type)
+
+
+def _compile_arguments(_type, cls) -> Optional[Callable[[Any], bool]]:
+    """Predicate checking the contents of an instance of cls against the
+    concrete arguments of _type - or None, if there is nothing to check."""
+    arguments = getattr(_type, '__args__', None)
+    if not arguments or getattr(_type, '__origin__', None) is None:
+        return None
+    if cls is tuple:
+        if arguments[-1] is Ellipsis:
+            item = _compile_argument(arguments[0])
+            if item is None:
+                return None
+            return lambda instance: all(item(value) for value in instance)
+        items = tuple(_compile_argument(argument) or _always for argument in arguments)
+        if all(item is _always for item in items):
+            return lambda instance: len(instance) == len(items)
+        return lambda instance: len(instance) == len(items) and all(
+            item(value) for item, value in zip(items, instance))
+    if issubclass(cls, collections.abc.Mapping) and len(arguments) == 2:
+        key, value = (_compile_argument(argument) or _always for argument in arguments)
+        if key is _always and value is _always:
+            return None
+        return lambda instance: all(key(k) and value(v) for k, v in instance.items())
+    if (issubclass(cls, collections.abc.Collection)
+            and not issubclass(cls, collections.abc.Iterator) and len(arguments) == 1):
+        # Collections can be iterated without being used up
+        element = _compile_argument(arguments[0])
+        if element is None:
+            return None
+        return lambda instance: all(element(value) for value in instance)
+    return None
+
+
+def _compile_argument(argument) -> Optional[Callable[[Any], bool]]:
+    """Predicate of a concrete argument of a generic - None for TypeVars
+    and anything else which accepts every instance."""
+    if isinstance(argument, TypeVar):
+        return None
+    predicate = compile_type(argument)
+    return None if predicate is _always else predicate
+
+
+def _compile_union(members) -> Callable[[Any], bool]:
+    classes = []
+    predicates = []
+    for member in members:
+        cls = _class_of(member)
+        if cls is not None and _compile_arguments(member, cls) is None:
+            classes.append(cls)
+        else:
+            predicate = compile_type(member)
+            if predicate is _always:
+                return _always
+            predicates.append(predicate)
+    if not predicates:
+        return _compile_isinstance(tuple(classes))
+    if classes:
+        predicates.insert(0, _compile_isinstance(tuple(classes)))
+    predicates = tuple(predicates)
+    return lambda instance: any(predicate(instance) for predicate in predicates)
+
+
+def _compile_isinstance(classes) -> Callable[[Any], bool]:
+    def predicate(instance, isinstance=isinstance, classes=classes):
+        return isinstance(instance, classes)
+    return predicate
+
+
+def _compile_subclass(cls) -> Callable[[Any], bool]:
+    cls = _class_of(cls) or object
+    def predicate(instance, isinstance=isinstance, issubclass=issubclass, cls=cls):
+        return isinstance(instance, type) and issubclass(instance, cls)
+    return predicate
+
+
+def _always(instance) -> bool:
+    return True
+
+
+def _root(_type):
+    """Unsubscripted origin of a generic - Tree for Tree[V, L, R]"""
+    while getattr(_type, '__origin__', None) is not None:
+        _type = _type.__origin__
+    return _type
+
+
+def _class_of(_type):
+    """The class which _type checks for with isinstance, or None when
+    it needs something else - a registered handler, Union, TypeVar..."""
+    if _type is Any or isinstance(_type, TypeVar):
+        return None
+    root = _root(_type)
+    if not isinstance(root, type) or root is Type or root in _registry:
+        return None
+    if isinstance(root, GenericMeta) and isinstance(getattr(root, '__extra__', None), type):
+        # typing.List --> list
+        return root.__extra__
+    return root
+
+
+def _handler(_type):
+    try:
+        return _handlers[_type]
+    except KeyError:
+        handler = _handlers[_type] = _resolve(_type)
+        return handler
+    except TypeError:
+        # Unhashable type-object
+        return _resolve(_type)
+
+
+def _resolve(_type):
     # Simplify certain cases - specifically Union, Callable, and Generic
     # which are both instances and types
     handle = _handle_as_type(_type)
     if hasattr(handle, '__meets__'):
-        return handle.__meets__(instance, _type)
+        return handle.__meets__
     elif handle in _registry:
-        return _registry[handle](instance, _type)
+        return _registry[handle]
     else:
-        return isinstance(instance, _type)
+        return _meets_isinstance
 
 
-_registry = {}
+def _meets_isinstance(instance, _type):
+    return isinstance(instance, _type)
 
 
 def _handle_as_type(_type):
     """Handles cases of 'typing' related objects which are instances and also types.
     Such as Union[a, b], and parameterized Generics (Dict[a, b]), etc
     """
-    if hasattr(_type, '__origin__'):
-        if _type.__origin__ is not None:
-            handle = _type.__origin__
-            if isinstance(handle, GenericMeta):
-                return Generic
-            else:
-                return handle
-    return _type
+    return _root(_type)
 
 
 def _register(klass):
     def wrapper(func):
         _registry[klass] = func
+        # Previously resolved handlers may be out of date
+        clear_caches()
         return func
     return wrapper
 
@@ -0,0 +1,59 @@
+"""
+Parse unit expressions, such as 'kg*m/s^2' or 'N·m / (s^2)', into UnitTrees.
+
+    parse_unit('kg*m/s^2')
+    # ((kg * m) / (s * s)), as UnitLeaf and UnitNode
+
+The grammar, and the parser of it, are in unit_parser.py - shared with
+py_units. This module builds UnitTrees for it. Names become interned
+Dimensions. Exponents raise by repeated multiplication: x^2 is x * x,
+x^-1 is 1 / x and x^0 is 1.
+
+Results are cached by string, in an LRU cache - UnitTrees are immutable, so
+every parse of the same string returns the same tree.
+"""
+import functools
+from numbers import Number
+from typing import Union
+
+from unit_parser import Builder, Parser
+
+from .base import UnitsError
+from .dimension import Dimension
+from .unit_tree import UnitTree, UnitLeaf
+
+
+PARSE_CACHE_SIZE = 1024
+
+
+class TreeBuilder(Builder):
+    """Builds UnitTrees, with the arithmetic operators."""
+    error = UnitsError
+
+    def leaf(self, value: Union[Number, str]) -> UnitTree:
+        if isinstance(value, str):
+            return UnitLeaf(Dimension(value))
+        return UnitLeaf(value)
+
+    def stem(self, divide: bool, left: UnitTree, right: UnitTree) -> UnitTree:
+        return left / right if divide else left * right
+
+    def power(self, tree: UnitTree, exponent: int) -> UnitTree:
+        """tree ^ exponent, as repeated multiplication"""
+        if isinstance(tree, UnitLeaf) and isinstance(tree.value, Number):
+            return UnitLeaf(tree.value ** exponent)
+        if exponent == 0:
+            return UnitLeaf(1)
+        result = tree
+        for _ in range(abs(exponent) - 1):
+            result = result * tree
+        return 1 / result if exponent < 0 else result
+
+
+_builder = TreeBuilder()
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_unit(text: str) -> UnitTree:
+    """UnitTree of a unit expression, such as 'kg*m/s^2'"""
+    return Parser(text, _builder).parse()
@@ -0,0 +1,208 @@
+"""
+Stream unit-annotated records through a UnitTree expression.
+
+    meters, seconds = Dimension('meters'), Dimension('seconds')
+    speed = Pipeline(UnitLeaf(meters) / UnitLeaf(seconds), chunk_size=10000)
+    with open('telemetry.csv') as file:
+        for chunk in speed.run(CsvReader(file)):
+            ...   # a list of up to 10000 speeds
+    speed.dimension   # DimensionVector: meters*seconds^-1
+
+Each column carries a unit - in a CSV header as 'distance[meters]', in a
+JSONL field as {"value": 12.5, "unit": "meters"}, or from the 'units'
+argument of the reader. Units are resolved to interned Dimensions once per
+column, when the reader is opened, and each Dimension leaf of the expression
+is bound to the column with its unit. The expression is compiled once, and
+evaluated a chunk of rows at a time, so memory stays bounded by chunk_size,
+however long the input.
+
+Results are the same with or without NumPy. A chunk runs over whole columns
+only when every value in it is a float, where NumPy's arithmetic is
+Python's; and if NumPy meets a division by zero, an overflow or a nan, the
+chunk runs again row by row - so ints stay ints, and a division by zero
+raises ZeroDivisionError, as it does in Python.
+"""
+import csv
+import itertools
+import json
+import re
+from collections import namedtuple
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .base import UnitsError
+from .dimension import Dimension
+from .tree import Tree
+from .compiler import compile_tree
+
+try:
+    # Optional - evaluates each chunk over whole columns
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# dimension is None for a column without a unit
+Column = namedtuple('Column', ['name', 'unit', 'dimension'])
+
+# 'distance[meters]' --> ('distance', 'meters')
+_HEADER = re.compile(r'^\s*(?P<name>[^\[\]]*?)\s*\[\s*(?P<unit>[^\[\]]+?)\s*\]\s*$')
+
+
+def parse_header(header: str) -> Tuple[str, Optional[str]]:
+    """'distance[meters]' --> ('distance', 'meters'); 'distance' --> ('distance', None)"""
+    match = _HEADER.match(header)
+    if match is None:
+        return header.strip(), None
+    return match.group('name'), match.group('unit')
+
+
+def _column(name: str, unit: Optional[str]) -> Column:
+    return Column(name, unit, None if unit is None else Dimension(unit))
+
+
+class CsvReader:
+    """Columns from the header row, whose cells may carry units as
+    'name[unit]'. units maps column names to units for the plain cells.
+    """
+    def __init__(self, lines: Iterable[str], units: Optional[Mapping[str, str]] = None, **format):
+        self._rows = csv.reader(lines, **format)
+        units = units or {}
+        columns = []
+        for header in next(self._rows, []):
+            name, unit = parse_header(header)
+            columns.append(_column(name, unit if unit is not None else units.get(name)))
+        self.columns = tuple(columns)
+
+    def rows(self, names: Sequence[str]) -> Iterator[Tuple[float, ...]]:
+        """The named columns of each row, as floats - parsing no others."""
+        positions = [_position(self.columns, name) for name in names]
+        needed = max(positions) + 1 if positions else 0
+        for row in self._rows:
+            if not row:
+                continue
+            if len(row) < needed:
+                raise UnitsError("Row {0} has {1} cells, expected {2}".format(
+                    self._rows.line_num, len(row), len(self.columns)))
+            try:
+                values = tuple(float(row[position]) for position in positions)
+            except ValueError:
+                # Only on the error path - find the cell to report
+                for name, position in zip(names, positions):
+                    try:
+                        float(row[position])
+                    except ValueError:
+                        raise UnitsError("Row {0} has {1!r} in column '{2}', which is not a number".format(
+                            self._rows.line_num, row[position], name))
+                raise
+            yield values
+
+
+class JsonlReader:
+    """One JSON object per line. A field is either {"value": ..., "unit": ...}
+    or a bare number, whose unit - if any - comes from units.
+
+    Columns are taken from the first record. A unit is resolved only for
+    that record: later records are checked to carry the same unit string.
+    """
+    def __init__(self, lines: Iterable[str], units: Optional[Mapping[str, str]] = None):
+        self._records = (json.loads(line) for line in lines if line.strip())
+        units = units or {}
+        first = next(self._records, None)
+        if first is None:
+            self.columns = ()
+            return
+        self._records = itertools.chain((first,), self._records)
+        self.columns = tuple(
+            _column(name, field['unit'] if isinstance(field, dict) else units.get(name))
+            for name, field in first.items()
+        )
+
+    def rows(self, names: Sequence[str]) -> Iterator[Tuple[float, ...]]:
+        """The named fields of each record, as numbers."""
+        columns = [self.columns[_position(self.columns, name)] for name in names]
+        for record in self._records:
+            values = []
+            for column in columns:
+                try:
+                    field = record[column.name]
+                except KeyError:
+                    raise UnitsError("Record has no field '{0}'".format(column.name))
+                if isinstance(field, dict):
+                    # A string comparison - the Dimension was resolved once
+                    if field.get('unit') != column.unit:
+                        raise UnitsError(str.format(
+                            "Field '{0}' has unit '{1}', but its column has unit '{2}'",
+                            column.name, field.get('unit'), column.unit
+                        ))
+                    field = field['value']
+                values.append(field)
+            yield tuple(values)
+
+
+def _position(columns: Sequence[Column], name: str) -> int:
+    for position, column in enumerate(columns):
+        if column.name == name:
+            return position
+    raise UnitsError("No column named '{0}'".format(name))
+
+
+class Pipeline:
+    """Evaluates expression for each row read, chunk_size rows at a time.
+
+    bindings maps a Dimension of the expression - or its identifier - to a
+    column name. Dimensions not in bindings are bound to the one column
+    whose unit they are.
+    """
+    def __init__(self, expression: Tree, bindings: Optional[Mapping[Union[Dimension, Any], str]] = None,
+                 chunk_size: int = 4096):
+        if chunk_size < 1:
+            raise UnitsError("chunk_size must be at least 1, not {0}".format(chunk_size))
+        self.compiled = compile_tree(expression)
+        self.bindings = dict(bindings or {})
+        self.chunk_size = chunk_size
+
+    @property
+    def dimension(self):
+        """DimensionVector of every result"""
+        return self.compiled.dimension
+
+    def resolve(self, columns: Sequence[Column]) -> List[str]:
+        """Column names for the positional parameters of the expression."""
+        names = []
+        for dimension in self.compiled.parameters:
+            if dimension in self.bindings:
+                names.append(self.bindings[dimension])
+            elif dimension.identifier in self.bindings:
+                names.append(self.bindings[dimension.identifier])
+            else:
+                matches = [column.name for column in columns if column.dimension == dimension]
+                if len(matches) != 1:
+                    raise UnitsError(str.format(
+                        "{0} columns have unit '{1}' - bind one of them explicitly",
+                        len(matches), dimension
+                    ))
+                names.append(matches[0])
+        return names
+
+    def run(self, reader: Union[CsvReader, JsonlReader]) -> Iterator[List[Any]]:
+        """Lists of up to chunk_size results, in the order of the rows."""
+        rows = reader.rows(self.resolve(reader.columns))
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            yield self._evaluate(chunk)
+
+    def _evaluate(self, chunk: List[Tuple[Any, ...]]) -> List[Any]:
+        function = self.compiled.function
+        if (numpy is not None and self.compiled.parameters
+                and set(map(type, itertools.chain.from_iterable(chunk))) == {float}):
+            # One vectorized operation per Node, over whole columns
+            columns = numpy.array(chunk, dtype=float).T
+            try:
+                with numpy.errstate(all='raise'):
+                    return numpy.broadcast_to(function(*columns), len(chunk)).tolist()
+            except FloatingPointError:
+                # Python may raise where NumPy gave inf or nan - find out row by row
+                pass
+        return [function(*row) for row in chunk]
@@ -0,0 +1,345 @@
+"""
+Compact binary encoding of Trees and UnitTrees.
+
+    data = encode_tree(UnitLeaf(meters) / UnitLeaf(seconds))
+    decode_tree(data)                 # the same UnitTree, rebuilt
+    decode_tree(memoryview(data))     # any bytes-like object, read in place
+
+Layout:
+    header     b'UT', version, family (0 - Tree, 1 - UnitTree)
+    dimensions varint count, then each Dimension identifier once
+    tree       one opcode per Empty, Leaf or Node, in pre-order
+
+A Node whose value is the Leaf of Add, Subtract, Multiply or Divide is the
+one opcode of that function - the function is not stored as a leaf of its
+own. A Dimension leaf is a varint index into the dimension table, an int is
+a zigzag varint and a float is 8 bytes. So a balanced tree over a handful of
+Dimensions takes about 1.5 bytes per node.
+
+Encoding and decoding use explicit stacks, rather than recursing, so trees
+of any depth round-trip. Decoding reads opcodes straight out of the buffer,
+and puts each node together bottom-up with the _make constructors - Add,
+Subtract, Multiply and Divide nodes of a UnitTree share the same function
+leaves as trees built with operators.
+
+Trees pickle through reduce_tree, as their encoding - so a pickle is flat,
+small, and loads with the Dimensions interned in the loading process.
+"""
+import struct
+from typing import Any, Callable, Tuple, Union
+
+from .base import UnitsError, UnitsTypeError
+from .dimension import Dimension
+from .tree import Tree, Empty, Leaf, Node
+from .syntax import TreeFunction, Add, Subtract, Multiply, Divide
+from .unit_tree import UnitEmpty, UnitLeaf, UnitNode
+
+
+MAGIC = b'UT'
+VERSION = 1
+
+# (Empty, Leaf, Node) class of each family, indexed by the family byte
+FAMILIES = ((Empty, Leaf, Node), (UnitEmpty, UnitLeaf, UnitNode))
+# Keyed by id, as hashing GenericMeta classes is slow
+_FAMILY_IDS = tuple(tuple(id(cls) for cls in family) for family in FAMILIES)
+_UNIT_TREE_IDS = frozenset(_FAMILY_IDS[1])
+# Each has the opcode _FUNCTION + its position
+FUNCTIONS = (Add, Subtract, Multiply, Divide)
+
+_EMPTY = 0
+_NODE = 1
+_DIMENSION = 2
+_INT = 3
+_FLOAT = 4
+_COMPLEX = 5
+_TRUE = 6
+_FALSE = 7
+_TREE_FUNCTION = 8
+_FUNCTION = 16
+
+# Tags of Dimension identifiers, in the dimension table
+_NONE = 0
+_STR = 1
+_INTEGER = 2
+
+_DOUBLE = struct.Struct('<d')
+_DOUBLES = struct.Struct('<dd')
+
+_FUNCTION_OPCODES = {id(function): _FUNCTION + index for index, function in enumerate(FUNCTIONS)}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _write_varint(out: bytearray, number: int):
+    while number >= 0x80:
+        out.append((number & 0x7f) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _zigzag(number: int) -> int:
+    """Small negative ints stay small: 0, -1, 1, -2 --> 0, 1, 2, 3"""
+    return number << 1 if number >= 0 else ((-number) << 1) - 1
+
+
+def _unzigzag(number: int) -> int:
+    return -((number + 1) >> 1) if number & 1 else number >> 1
+
+
+def _write_identifier(out: bytearray, identifier):
+    if identifier is None:
+        out.append(_NONE)
+    elif identifier.__class__ is str:
+        encoded = identifier.encode('utf-8')
+        out.append(_STR)
+        _write_varint(out, len(encoded))
+        out += encoded
+    elif identifier.__class__ is int:
+        out.append(_INTEGER)
+        _write_varint(out, _zigzag(identifier))
+    else:
+        raise UnitsTypeError("Cannot encode Dimension identifier {0!r}".format(identifier))
+
+
+def encode_tree(tree: Tree) -> bytes:
+    """tree as bytes. Every Empty, Leaf and Node must be of the family of
+    the root - Tree's or UnitTree's. Leaf values may be Dimensions,
+    TreeFunctions, or ints, floats, complex numbers and bools.
+    """
+    # Exact classes, as only those encode - and isinstance through GenericMeta is slow
+    family = 1 if id(tree.__class__) in _UNIT_TREE_IDS else 0
+    empty, leaf, node = _FAMILY_IDS[family]
+    body = bytearray()
+    dimensions = {}   # id(Dimension) --> index
+    table = []
+    stack = [tree]
+    while stack:
+        tree = stack.pop()
+        kind = id(tree.__class__)
+        if kind == leaf:
+            value = tree.value
+            cls = value.__class__
+            if cls is Dimension:
+                index = dimensions.get(id(value))
+                if index is None:
+                    index = dimensions[id(value)] = len(table)
+                    table.append(value)
+                body.append(_DIMENSION)
+                _write_varint(body, index)
+            elif cls is int:
+                body.append(_INT)
+                _write_varint(body, _zigzag(value))
+            elif cls is float:
+                body.append(_FLOAT)
+                body += _DOUBLE.pack(value)
+            elif cls is bool:
+                body.append(_TRUE if value else _FALSE)
+            elif cls is complex:
+                body.append(_COMPLEX)
+                body += _DOUBLES.pack(value.real, value.imag)
+            elif id(value) in _FUNCTION_OPCODES:
+                body.append(_TREE_FUNCTION)
+                body.append(_FUNCTION_OPCODES[id(value)] - _FUNCTION)
+            else:
+                raise UnitsTypeError("Cannot encode Leaf value {0!r}".format(value))
+        elif kind == node:
+            value = tree.value
+            opcode = None
+            if id(value.__class__) == leaf:
+                opcode = _FUNCTION_OPCODES.get(id(value.value))
+            stack.append(tree.right)
+            stack.append(tree.left)
+            if opcode is None:
+                body.append(_NODE)
+                stack.append(value)
+            else:
+                body.append(opcode)
+        elif kind == empty:
+            body.append(_EMPTY)
+        else:
+            raise UnitsTypeError("Cannot encode {0} in a tree of {1}".format(
+                tree.__class__.__name__, FAMILIES[family][1].__name__))
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out.append(family)
+    _write_varint(out, len(table))
+    for dimension in table:
+        _write_identifier(out, dimension.identifier)
+    out += body
+    return bytes(out)
+
+
+# family --> value of the Node of each of FUNCTIONS
+_function_leaves = {
+    # Shared with the nodes which operators build
+    1: tuple(TreeFunction.leaf(function) for function in FUNCTIONS),
+    0: tuple(Leaf._make(function) for function in FUNCTIONS),
+}
+
+
+def decode_tree(data: Buffer) -> Tree:
+    """Tree from the bytes of encode_tree - bytes, bytearray, memoryview
+    or any other buffer of bytes. Raises UnitsError if data is not a
+    whole encoded tree.
+    """
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    try:
+        return _decode(view)
+    except (IndexError, struct.error):
+        raise UnitsError("Encoded tree is truncated")
+    except UnicodeDecodeError:
+        raise UnitsError("Encoded tree has a Dimension identifier which is not UTF-8")
+
+
+def _decode(view: memoryview) -> Tree:
+    if view[:2] != MAGIC:
+        raise UnitsError("Not an encoded tree")
+    if view[2] != VERSION:
+        raise UnitsError("Unsupported encoded tree version {0}".format(view[2]))
+    family = view[3]
+    if family >= len(FAMILIES):
+        raise UnitsError("Unknown tree family {0}".format(family))
+    empty_class, leaf_class, node_class = FAMILIES[family]
+    leaf, node = leaf_class._make, node_class._make
+    functions = _function_leaves[family]
+    registry = Dimension.registry
+    position = 4
+
+    def varint() -> int:
+        nonlocal position
+        number = shift = 0
+        while True:
+            byte = view[position]
+            position += 1
+            number |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return number
+            shift += 7
+
+    dimensions = []
+    for _ in range(varint()):
+        tag = view[position]
+        position += 1
+        if tag == _STR:
+            size = varint()
+            if position + size > len(view):
+                raise IndexError(position + size)
+            identifier = str(view[position:position + size], 'utf-8')
+            dimensions.append(registry.get(identifier) or Dimension(identifier))
+            position += size
+        elif tag == _INTEGER:
+            dimensions.append(Dimension(_unzigzag(varint())))
+        elif tag == _NONE:
+            dimensions.append(Dimension(None))
+        else:
+            raise UnitsError("Unknown Dimension identifier tag {0}, at {1}".format(tag, position - 1))
+
+    # Leaves are built as they are read; a Node is recorded by its opcode,
+    # and built on the way back - when its children are built already.
+    items = []
+    append = items.append
+    end = len(view)
+    while position < end:
+        opcode = view[position]
+        position += 1
+        if opcode == _DIMENSION:
+            index = view[position]
+            if index < 0x80:
+                position += 1
+            else:
+                index = varint()
+            if index >= len(dimensions):
+                raise UnitsError("Dimension {0} is not in the table, at {1}".format(index, position))
+            append(leaf(dimensions[index]))
+        elif opcode >= _FUNCTION:
+            if opcode - _FUNCTION >= len(FUNCTIONS):
+                raise UnitsError("Unknown opcode {0}, at {1}".format(opcode, position - 1))
+            append(opcode)
+        elif opcode == _INT:
+            append(leaf(_unzigzag(varint())))
+        elif opcode == _FLOAT:
+            append(leaf(_DOUBLE.unpack_from(view, position)[0]))
+            position += _DOUBLE.size
+        elif opcode == _NODE:
+            append(opcode)
+        elif opcode == _EMPTY:
+            append(empty_class())
+        elif opcode == _COMPLEX:
+            real, imag = _DOUBLES.unpack_from(view, position)
+            append(leaf(complex(real, imag)))
+            position += _DOUBLES.size
+        elif opcode == _TRUE or opcode == _FALSE:
+            append(leaf(opcode == _TRUE))
+        elif opcode == _TREE_FUNCTION:
+            index = view[position]
+            position += 1
+            if index >= len(FUNCTIONS):
+                raise UnitsError("Unknown TreeFunction {0}, at {1}".format(index, position - 1))
+            append(leaf(FUNCTIONS[index]))
+        else:
+            raise UnitsError("Unknown opcode {0}, at {1}".format(opcode, position - 1))
+
+    # Pre-order, read backwards, puts the children of a Node
+    # on the results stack before the Node itself.
+    results = []
+    pop, push = results.pop, results.append
+    try:
+        for item in reversed(items):
+            if item.__class__ is not int:
+                push(item)
+            elif item == _NODE:
+                push(node(pop(), pop(), pop()))
+            else:
+                push(node(functions[item - _FUNCTION], pop(), pop()))
+    except IndexError:
+        raise UnitsError("Encoded tree is missing children")
+    if len(results) != 1:
+        raise UnitsError("Encoded tree has {0} roots, rather than one".format(len(results)))
+    return results[0]
+
+
+def _flatten(tree: Tree) -> Tuple[Tuple, ...]:
+    """Pre-order tuple of (class,) for Empty, (class, value) for Leaf and
+    (class, None, None) for Node - for trees encode_tree does not cover."""
+    items = []
+    stack = [tree]
+    while stack:
+        tree = stack.pop()
+        if isinstance(tree, Node):
+            items.append((tree.__class__, None, None))
+            stack.append(tree.right)
+            stack.append(tree.left)
+            stack.append(tree.value)
+        elif isinstance(tree, Leaf):
+            items.append((tree.__class__, tree.value))
+        else:
+            items.append((tree.__class__,))
+    return tuple(items)
+
+
+def _unflatten(items: Tuple[Tuple, ...]) -> Tree:
+    results = []
+    for item in reversed(items):
+        size = len(item)
+        if size == 3:
+            value, left, right = results.pop(), results.pop(), results.pop()
+            results.append(item[0]._make(value, left, right))
+        elif size == 2:
+            results.append(item[0]._make(item[1]))
+        else:
+            results.append(item[0]())
+    return results.pop()
+
+
+def reduce_tree(tree: Tree) -> Tuple[Callable[..., Tree], Tuple[Any]]:
+    """Tree.__reduce__ - the encoding of tree, or for a tree holding values
+    encode_tree does not cover, a flat tuple of its classes and values.
+    Either way pickle never recurses down the tree.
+    """
+    try:
+        return decode_tree, (encode_tree(tree),)
+    except UnitsTypeError:
+        return _unflatten, (_flatten(tree),)
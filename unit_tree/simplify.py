@@ -1,70 +1,262 @@
 """
 Rewriting rules for the UnitTree
 
+Each TreeLaw declares the nodes it can apply to - by TreeFunction class,
+and the kind of leaf on each side - so the Simplifier only tests a node
+against the laws indexed under that node's signature:
 
+    signature(Multiply(UnitLeaf(2), UnitLeaf(feet))) == (Multiply, SCALAR, DIMENSION)
+
+Trees are simplified bottom-up from an explicit stack, so a law always sees
+children which are already simplified. A Simplifier given a
+SimplificationCache returns the remembered result for a tree it has seen
+before, without rewriting it again.
 """
-from typing import Generic, TypeVar, Callable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 from numbers import Number
 
-from .tree import Tree, Node, Leaf
-from .unit_tree import UnitTree, UnitTreeNode, UnitTreeFunction
+from .base import NotPassed
+from .dimension import Dimension
+from .tree import Tree, Empty, Node, Leaf
+from .syntax import TreeFunction, Add, Subtract, Multiply, Divide
+from .cache import SimplificationCache, structural_key
+
+
+# Kinds of child
+SCALAR = 'scalar'
+DIMENSION = 'dimension'
+NODE = 'node'
+EMPTY = 'empty'
+OTHER = 'other'
+KINDS = frozenset((SCALAR, DIMENSION, NODE, EMPTY, OTHER))
+
+Signature = Tuple[Type[TreeFunction], str, str]
+
+
+def kind(tree: Tree) -> str:
+    while isinstance(tree, Leaf) and isinstance(tree.value, Tree):
+        tree = tree.value
+    if isinstance(tree, Node):
+        return NODE
+    elif isinstance(tree, Empty):
+        return EMPTY
+    elif isinstance(tree.value, Number):
+        return SCALAR
+    elif isinstance(tree.value, Dimension):
+        return DIMENSION
+    else:
+        return OTHER
 
 
-# Temporary names... need better ones, but names are hard
-LawIn = TypeVar('LawIn')
-LawOut = TypeVar('LawOut')
-TreeMorphism = Callable[[Tree], Tree]
+def tree_function(node: Node) -> Optional[Type[TreeFunction]]:
+    function = node.value.value if isinstance(node.value, Leaf) else node.value
+    if isinstance(function, type) and issubclass(function, TreeFunction):
+        return function
+    return None
 
 
-class TreeLaw(AbstractTreeLaw):
+def signature(tree: Tree) -> Optional[Signature]:
+    """(TreeFunction class, left kind, right kind), or None if no law can
+    apply to tree - because it is not a Node of a TreeFunction."""
+    if not isinstance(tree, Node):
+        return None
+    function = tree_function(tree)
+    if function is None:
+        return None
+    return (function, kind(tree.left), kind(tree.right))
+
+
+class TreeLaw:
     """
-    This should probably be generic on something.
-    Perhaps treated like Callable
+    A rewriting rule, used as a class - like TreeFunction.
+
+    tree_functions, left and right declare the signatures the law can
+    apply to. predicate then makes any finer check, and replace returns
+    the rewritten tree - or NotImplemented, if the law does not apply
+    after all.
     """
-    predicate: Callable[[Tree], bool]
-    replace: Callable[[Tree], Tree]
-    execute: Callable[[Tree], Tree]
+    tree_functions = (TreeFunction,)  # type: Tuple[Type[TreeFunction], ...]
+    left = KINDS
+    right = KINDS
+
+    @classmethod
+    def matches(cls, signature: Signature) -> bool:
+        function, left, right = signature
+        return (
+            issubclass(function, cls.tree_functions)
+            and left in cls.left
+            and right in cls.right
+        )
+
+    @classmethod
+    def predicate(cls, tree: Node) -> bool:
+        return True
 
+    @classmethod
+    def replace(cls, tree: Node) -> Tree:
+        return NotImplemented
 
-class UnitTreeLaw:
-    predicate: Callable
 
+class ScalarApplication(TreeLaw):
+    """Node with Scalars on right and left --> Leaf of the result"""
+    left = {SCALAR}
+    right = {SCALAR}
 
-class Scalar:
-    pass
+    @classmethod
+    def replace(cls, tree: Node) -> Tree:
+        return tree.construct(
+            tree_function(tree).operator(_unwrap(tree.left).value, _unwrap(tree.right).value)
+        )
 
 
-def is_scalar(tree: Leaf[Number]) -> bool:
-    if isinstance(tree, Leaf):
-        if isinstance(tree.value, Number):
-            return True
-    return False
+class RightIdentity(TreeLaw):
+    """x * 1, x / 1, x + 0, x - 0 --> x"""
+    right = {SCALAR}
+    identities = {Multiply: 1, Divide: 1, Add: 0, Subtract: 0}
+    tree_functions = tuple(identities)
 
+    @classmethod
+    def predicate(cls, tree: Node) -> bool:
+        return _unwrap(tree.right).value == cls.identities[tree_function(tree)]
+
+    @classmethod
+    def replace(cls, tree: Node) -> Tree:
+        return tree.left
+
+
+class LeftIdentity(TreeLaw):
+    """1 * x, 0 + x --> x"""
+    left = {SCALAR}
+    identities = {Multiply: 1, Add: 0}
+    tree_functions = tuple(identities)
+
+    @classmethod
+    def predicate(cls, tree: Node) -> bool:
+        return _unwrap(tree.left).value == cls.identities[tree_function(tree)]
 
-class ScalarApplication(Law):
-    """
-    This needs some way to know what class the tree is
-    """
     @classmethod
-    def predicate(cls, tree: Tree):
-        """Checks if tree is a Node with Scalars on right and left"""
-        if isinstance(tree, Node):
-            if is_scalar(tree.left) and is_scalar(tree.right):
-                return True
-        return False
+    def replace(cls, tree: Node) -> Tree:
+        return tree.right
+
+
+class DimensionCancellation(TreeLaw):
+    """feet / feet --> 1"""
+    tree_functions = (Divide,)
+    left = {DIMENSION}
+    right = {DIMENSION}
+
+    @classmethod
+    def predicate(cls, tree: Node) -> bool:
+        return _unwrap(tree.left).value == _unwrap(tree.right).value
 
     @classmethod
-    def replace(cls, tree: Node):
-        """
-        I would like to say this, but don't have the Type Parameters set for it:
-            Node[TreeFunction[[Number, Number], Number], Leaf[Number]]
-
-        @todo - Find a more elegant expression of this
-        * this is a terribly contorted and non-natural expression
-        * this pokes extensively into the internals of the Tree class, and should allow Tree to handle that
-        * It really needs a Functor
-        * ... I think this is: tree.construct(tree.fold(tree.value.call, tree.left, tree.right.value))
-           - .... which is even weirder
-        * The succinct expression of this would be: tree.bifold(tree.value)
-        """
-        return tree.construct(tree.value.operator(tree.left.value, tree.right.value))
+    def replace(cls, tree: Node) -> Tree:
+        return tree.construct(1)
+
+
+LAWS = (ScalarApplication, RightIdentity, LeftIdentity, DimensionCancellation)
+
+
+class LawStatistics:
+    """How often a law's predicate accepted (hits) or rejected (misses)
+    a candidate node. Misses are the cost of a law which did no work."""
+    __slots__ = ('hits', 'misses')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "{0}(hits={1}, misses={2})".format(
+            self.__class__.__name__, self.hits, self.misses)
+
+
+class Simplifier:
+    """Applies laws bottom-up, testing each node only against the laws
+    indexed under its signature. The index is filled in lazily, the first
+    time each signature is seen.
+    """
+    def __init__(self, laws: Iterable[Type[TreeLaw]] = LAWS,
+                 cache: Optional[SimplificationCache] = None):
+        self.laws = tuple(laws)
+        self.cache = cache
+        self._index = {}  # type: Dict[Signature, Tuple[Type[TreeLaw], ...]]
+        self.statistics = {law: LawStatistics() for law in self.laws}
+
+    def candidates(self, signature: Signature) -> Tuple[Type[TreeLaw], ...]:
+        try:
+            return self._index[signature]
+        except KeyError:
+            laws = self._index[signature] = tuple(
+                law for law in self.laws if law.matches(signature)
+            )
+            return laws
+
+    def reset_statistics(self):
+        for statistics in self.statistics.values():
+            statistics.hits = statistics.misses = 0
+
+    def simplify(self, tree: Tree) -> Tree:
+        if self.cache is None:
+            return self._simplify(tree)
+        try:
+            key = structural_key(tree)
+            simplified = self.cache.get(key)
+        except TypeError:
+            # Unhashable leaf value - cannot be cached
+            return self._simplify(tree)
+        if simplified is NotPassed:
+            simplified = self._simplify(tree)
+            self.cache.put(key, simplified)
+        return simplified
+
+    def _simplify(self, tree: Tree) -> Tree:
+        results = []  # type: List[Tree]
+        stack = [(tree, False)]
+        while stack:
+            tree, expanded = stack.pop()
+            if expanded:
+                right, left = results.pop(), results.pop()
+                if left is not tree.left or right is not tree.right:
+                    tree = tree.__class__._make(tree.value, left, right)
+                results.append(self._rewrite(tree))
+            elif isinstance(tree, Node):
+                stack.append((tree, True))
+                stack.append((tree.right, False))
+                stack.append((tree.left, False))
+            else:
+                results.append(tree)
+        return results.pop()
+
+    def _rewrite(self, tree: Tree) -> Tree:
+        """Apply laws to a node whose children are simplified, until none apply."""
+        while True:
+            key = signature(tree)
+            if key is None:
+                return tree
+            for law in self.candidates(key):
+                statistics = self.statistics[law]
+                replaced = law.replace(tree) if law.predicate(tree) else NotImplemented
+                if replaced is not NotImplemented:
+                    statistics.hits += 1
+                    if replaced is tree.left or replaced is tree.right:
+                        # Children are already simplified
+                        return replaced
+                    tree = replaced
+                    break
+                statistics.misses += 1
+            else:
+                return tree
+
+
+def _unwrap(tree: Tree) -> Tree:
+    while isinstance(tree, Leaf) and isinstance(tree.value, Tree):
+        tree = tree.value
+    return tree
+
+
+default_simplifier = Simplifier(cache=SimplificationCache())
+
+
+def simplify_tree(tree: Tree) -> Tree:
+    return default_simplifier.simplify(tree)
@@ -11,18 +11,26 @@ R = TypeVar('R', bound=Domain)
 
 
 def dfs(tree: Tree[V, L, R]) -> Iterator[Domain]:
-    if isinstance(tree, Empty):
-        pass
-    elif isinstance(tree, Leaf):
-        yield tree.value
-    elif isinstance(tree, Node):
-        yield from dfs(tree.left)
-        yield from dfs(tree.right)
-        yield tree.value
-    else:
-        raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
-            tree.__class__.__name__
-        ))
+    """Post-order: left, right, then the Node's value.
+    Uses an explicit stack, so each item costs O(1) regardless of depth.
+    """
+    stack = [(tree, False)]
+    while stack:
+        tree, expanded = stack.pop()
+        if expanded:
+            yield tree.value
+        elif isinstance(tree, Empty):
+            pass
+        elif isinstance(tree, Leaf):
+            yield tree.value
+        elif isinstance(tree, Node):
+            stack.append((tree, True))
+            stack.append((tree.right, False))
+            stack.append((tree.left, False))
+        else:
+            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                tree.__class__.__name__
+            ))
 
 
 def bfs(tree: Tree[V, L, R]) -> Iterator[Domain]:
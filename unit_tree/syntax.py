@@ -17,11 +17,21 @@ class TreeFunction(metaclass=TreeMeta):
     """
     registry = {}
     domain: Tuple[Tree, EitherDomain]
-    codomain: Node
+    # Class of the nodes built - UnitTree sets this to UnitNode
+    codomain = Node
+    # Keyed by id, as hashing GenericMeta classes is slow. Each entry holds
+    # the objects whose ids it is keyed by, so none of those ids can be
+    # reused by another object while the entry exists.
+    # id(codomain), id(TreeFunction) --> (codomain, TreeFunction, shared Leaf of it)
+    _leaves = {}
+    # id(codomain) --> (codomain, {id(class): class}) of the exact classes of
+    # tree its nodes take as children
+    _operands = {}
 
     @classmethod
     def register(cls, tree_function: 'TreeFunction'):
         cls.registry[tree_function.operator] = tree_function
+        return tree_function
 
     @classmethod
     def lift(cls, operation):
@@ -41,8 +51,42 @@ class TreeFunction(metaclass=TreeMeta):
     def apply(cls, pair: 'Tuple[Tree, EitherDomain]', tree_function: 'TreeFunction') -> Node:
         # unpack arguments
         left, right = pair
-        # Look up the operation
-        return Node(tree_function, left, right)
+        codomain = cls.codomain
+        # Operands of a class which passed the checks in Node.__init__ before
+        # skip them; anything else - raw values, or trees of another family -
+        # is checked, and wrapped or rejected, as Node.__init__ would
+        try:
+            operands = TreeFunction._operands[id(codomain)][1]
+        except KeyError:
+            operands = {}
+            TreeFunction._operands[id(codomain)] = (codomain, operands)
+        if id(left.__class__) not in operands:
+            left = cls._operand(left, operands)
+        if id(right.__class__) not in operands:
+            right = cls._operand(right, operands)
+        return codomain._make(cls.leaf(tree_function), left, right)
+
+    @classmethod
+    def _operand(cls, x: 'EitherDomain', operands: dict) -> Tree:
+        """x as a child of a codomain node - and if x is a tree of the
+        codomain already, its class is added to operands."""
+        codomain = cls.codomain
+        tree = codomain.maybe(x, _not=codomain.construct)
+        if tree is x:
+            operands[id(x.__class__)] = x.__class__
+        return tree
+
+    @classmethod
+    def leaf(cls, tree_function: 'TreeFunction') -> Tree:
+        """Leaf holding tree_function - built once, and shared by every
+        node of it, as trees are immutable."""
+        key = (id(cls.codomain), id(tree_function))
+        try:
+            return TreeFunction._leaves[key][2]
+        except KeyError:
+            leaf = cls.codomain.construct(tree_function)
+            TreeFunction._leaves[key] = (cls.codomain, tree_function, leaf)
+            return leaf
 
     @classmethod
     def call(cls, tree_function, pair):
@@ -86,52 +130,53 @@ class Add(TreeFunction):
 class Subtract(TreeFunction):
     short = "-"
     name = "subtract"
-    operator = operator.__add__
+    operator = operator.__sub__
 
 
 class TreeArithmeticSyntax:
+    __slots__ = ()
 
     def __add__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__add__, (self, a))
+        return TreeFunction.apply((self, a), Add)
 
     def __radd__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__add__, (a, self))
+        return TreeFunction.apply((a, self), Add)
 
     def __sub__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__sub__, (self, a))
+        return TreeFunction.apply((self, a), Subtract)
 
     def __rsub__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__sub__, (a, self))
+        return TreeFunction.apply((a, self), Subtract)
 
     def __mul__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__mul__, (self, a))
+        return TreeFunction.apply((self, a), Multiply)
 
     def __rmul__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__mul__, (a, self))
+        return TreeFunction.apply((a, self), Multiply)
 
     def __truediv__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__truediv__, (self, a))
+        return TreeFunction.apply((self, a), Divide)
 
     def __rtruediv__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__truediv__, (a, self))
+        return TreeFunction.apply((a, self), Divide)
 
     def __floordiv__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__floordiv__, (self, a))
+        return TreeFunction.map((self, a), operator.__floordiv__)
 
     def __rfloordiv__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__floordiv__, (a, self))
+        return TreeFunction.map((a, self), operator.__floordiv__)
 
     def __mod__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__mod__, (self, a))
+        return TreeFunction.map((self, a), operator.__mod__)
 
     def __rmod__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__mod__, (a, self))
+        return TreeFunction.map((a, self), operator.__mod__)
 
     def __pow__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__pow__, (self, a))
+        return TreeFunction.map((self, a), operator.__pow__)
 
     def __rpow__(self, a: EitherDomain) -> Node:
-        return TreeFunction.map(operator.__pow__, (a, self))
+        return TreeFunction.map((a, self), operator.__pow__)
 
 
 # ===================================================
@@ -13,6 +13,7 @@ from typing import (
 )
 
 from .base import TreeMeta, TreeBase, NotPassed, UnitsTypeError, identity
+from .meets import compile_type
 
 Domain = TypeVar('Domain')
 V = TypeVar('V', bound=Domain)
@@ -33,14 +34,19 @@ class Tree(Generic[V, L, R], TreeBase):
     Binary abstract tree.
     Allows for the possibility of the center of a Node having a different
     type than Leafs.
+
+    Trees are treated as immutable once constructed - which lets Node cache
+    its hash, and lets hashcons.TreeInterner share identical subtrees.
     """
+    __slots__ = ()
+
     # Child classes need to override Domain
     domain: Domain
     codomain: Codomain
 
     def __new__(cls, value=NotPassed, left=NotPassed, right=NotPassed):
         if value is NotPassed:
-            return object.__new__(Empty)
+            return Empty()
         elif left is NotPassed and right is NotPassed:
             return object.__new__(Leaf)
         else:
@@ -64,21 +70,23 @@ class Tree(Generic[V, L, R], TreeBase):
         """Note - I dont like having map on the parent class Tree dispatch
         on the type of the children -
         because it require that class to know about the internals.
+
+        Rebuilds bottom-up from an explicit stack, rather than recursing.
         """
-        if isinstance(tree, Empty):
-            return Empty
-        elif isinstance(tree, Leaf):
-            return Leaf(f(tree.value))
-        elif isinstance(tree, Node):
-            return Node(
-                cls.map(tree.value, f),
-                cls.map(tree.left, f),
-                cls.map(tree.right, f)
-            )
-        else:
-            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
-                tree.__class__.__name__
-            ))
+        results = []
+        for subtree in _postorder(tree):
+            if isinstance(subtree, Empty):
+                results.append(subtree)
+            elif isinstance(subtree, Leaf):
+                results.append(Leaf(f(subtree.value)))
+            elif isinstance(subtree, Node):
+                right, left, value = results.pop(), results.pop(), results.pop()
+                results.append(Node._make(value, left, right))
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                    subtree.__class__.__name__
+                ))
+        return results.pop()
 
     @classmethod
     def maybe(cls,
@@ -91,42 +99,50 @@ class Tree(Generic[V, L, R], TreeBase):
         """
         if isinstance(x, cls.codomain):
             return _do(x)
-        elif isinstance(x, cls.domain):
+        elif compile_type(cls.domain)(x):
             return _not(x)
         else:
             raise UnitsTypeError(str.format(
                 "{0} is not a subtype of tree, nor in the domain '{1}'",
-                x.__class__.__name__, Domain
+                x.__class__.__name__, cls.domain
             ))
 
     @classmethod
     def join(cls, tree: Codomain):
         """
         I think the key here is that it depends on what the children are
+
+        Rebuilds bottom-up from an explicit stack, rather than recursing.
         """
-        if isinstance(tree, Empty):
+        if isinstance(_unwrap(tree), Empty):
             return None
-        elif isinstance(tree, Leaf):
-            if isinstance(tree.value, Tree):
-                # Leaf (Empty()|Leaf(x)|Node(x,l,r)) --> Empty()|Leaf(x)|Node(x,l,r)
-                return cls.join(tree.value)
-            else:
+        results = []
+        stack = [(tree, False)]
+        while stack:
+            tree, expanded = stack.pop()
+            if expanded:
+                right, left, value = results.pop(), results.pop(), results.pop()
+                results.append(Node._make(value, left, right))
+                continue
+            # Leaf (Empty()|Leaf(x)|Node(x,l,r)) --> Empty()|Leaf(x)|Node(x,l,r)
+            tree = _unwrap(tree)
+            if isinstance(tree, Empty):
+                results.append(tree)
+            elif isinstance(tree, Leaf):
                 # Leaf (non-Tree) --> no change
-                return Leaf(tree.value)
-            # More succicent expression:
-            # return cls.maybe(tree.value, cls.join, construct)
-        elif isinstance(tree, Node):
-            # Structure of Node is not changed - even when one child is empty
-            # Child classes may want to override and expand this behavior
-            return Node(
-                cls.maybe(tree.value, cls.join),
-                cls.maybe(tree.left, cls.join),
-                cls.maybe(tree.right, cls.join)
-            )
-        else:
-            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
-                tree.__class__.__name__
-            ))
+                results.append(Leaf(tree.value))
+            elif isinstance(tree, Node):
+                # Structure of Node is not changed - even when one child is empty
+                # Child classes may want to override and expand this behavior
+                stack.append((tree, True))
+                stack.append((tree.right, False))
+                stack.append((tree.left, False))
+                stack.append((tree.value, False))
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                    tree.__class__.__name__
+                ))
+        return results.pop()
 
     def bind(cls, value: Union[Domain, Codomain],
              f: Callable[[Domain], Codomain],
@@ -170,46 +186,52 @@ class Tree(Generic[V, L, R], TreeBase):
 
     @classmethod
     def fold(cls, tree: Codomain, f: Callable[[Domain, B], B], accumulator: B):
-        if isinstance(tree, Empty):
-            return accumulator
-        elif isinstance(tree, Leaf):
-            return f(tree.value, accumulator)
-        elif isinstance(tree, Node):
-            return cls.fold(
-                tree.left,
-                f,
-                f(
-                    tree.value,
-                    cls.fold(f, accumulator, tree.right)
-                )
-            )
-        else:
-            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
-                tree.__class__.__name__
-            ))
+        """Right fold: a Node folds its right subtree, then its value,
+        then its left subtree. The value of a Node is a Leaf, and is
+        folded like any other subtree.
+        Uses an explicit stack, rather than recursing.
+        """
+        stack = [tree]
+        while stack:
+            tree = stack.pop()
+            if isinstance(tree, Empty):
+                pass
+            elif isinstance(tree, Leaf):
+                accumulator = f(tree.value, accumulator)
+            elif isinstance(tree, Node):
+                stack.append(tree.left)
+                stack.append(tree.value)
+                stack.append(tree.right)
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                    tree.__class__.__name__
+                ))
+        return accumulator
 
     @classmethod
     def traverse(cls, tree: Codomain, f: TreeFunction):
-        if isinstance(tree, Empty):
-            # traverse f Empty = pure Empty
-            #  which looks like it would be: return cls.construct(tree)
-            #  but that seems wrong, so I'm going with: return tree
-            # ...
-            # perhaps: cls.bind(tree) ???
-            #  so it takes care of the flattening,
-            return tree
-        elif isinstance(tree, Leaf):
-            return cls.map(Tree, f(tree.value))
-        elif isinstance(tree, Node):
-            return Node(
-                f(tree.value),
-                cls.traverse(f, tree.left),
-                cls.traverse(f, tree.right)
-            )
-        else:
-            raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
-                tree.__class__.__name__
-            ))
+        """Like map, except f may return a Tree - which replaces the Leaf.
+        Results of f which are not Trees are put in a Leaf.
+        Rebuilds bottom-up from an explicit stack, rather than recursing.
+        """
+        results = []
+        for subtree in _postorder(tree):
+            if isinstance(subtree, Empty):
+                # traverse f Empty = pure Empty
+                #  which looks like it would be: return cls.construct(tree)
+                #  but that seems wrong, so I'm going with: return tree
+                results.append(subtree)
+            elif isinstance(subtree, Leaf):
+                result = f(subtree.value)
+                results.append(result if isinstance(result, Tree) else Leaf(result))
+            elif isinstance(subtree, Node):
+                right, left, value = results.pop(), results.pop(), results.pop()
+                results.append(Node._make(value, left, right))
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                    subtree.__class__.__name__
+                ))
+        return results.pop()
 
     @classmethod
     def zero(cls) -> Codomain:
@@ -219,6 +241,14 @@ class Tree(Generic[V, L, R], TreeBase):
     def identity(cls, tree: Codomain):
         return cls.map(tree, identity)
 
+    def __reduce__(self):
+        """Pickled flat - as its binary encoding, where it has one.
+        See serialize.reduce_tree.
+        """
+        # serialize.py builds on this module, so is imported on first use
+        from .serialize import reduce_tree
+        return reduce_tree(self)
+
 
 # Tree.domain should be overridden by child-classes
 Tree.domain = object
@@ -226,10 +256,26 @@ Tree.codomain = Tree
 
 
 class Empty(Tree[Any, Any, Any]):
+    """Flyweight - Empty carries no state, so each class has one shared instance."""
+    __slots__ = ()
+
+    _instances = {}
+
+    @classmethod
+    def __call__(cls):
+        try:
+            return Empty._instances[cls]
+        except KeyError:
+            self = Empty._instances[cls] = object.__new__(cls)
+            return self
 
     def __init__(self):
         pass
 
+    def __reduce__(self):
+        # Unpickled as the shared instance
+        return (self.__class__, ())
+
     def __repr__(self):
         return str.format(
             "{0}()", self.__class__.__name__
@@ -238,14 +284,25 @@ class Empty(Tree[Any, Any, Any]):
     def __eq__(self, other):
         return True if isinstance(other, Empty) else False
 
+    def __hash__(self):
+        return hash(Empty)
+
 
 class Leaf(Generic[V], Tree[V, Any, Any]):
+    __slots__ = ('value',)
 
     value: Union[V, None]
 
     def __init__(self, value: V):
         self.value = value
 
+    @classmethod
+    def _make(cls, value: V) -> 'Leaf[V]':
+        """Fast internal constructor - skips TreeMeta.__call__."""
+        self = object.__new__(cls)
+        self.value = value
+        return self
+
     def __repr__(self):
         return str.format(
             "{0}({1})", self.__class__.__name__, repr(self.value)
@@ -257,6 +314,9 @@ class Leaf(Generic[V], Tree[V, Any, Any]):
         else:
             return False
 
+    def __hash__(self):
+        return hash((Leaf, self.value))
+
 
 class Node(Tree[V, L, R]):
     """
@@ -268,6 +328,7 @@ class Node(Tree[V, L, R]):
     class UnitTree(Node[])
     and left/right: Node
     """
+    __slots__ = ('value', 'left', 'right', '_hash')
 
     value: Leaf[V]
     left: Union[Leaf[L], None]
@@ -283,6 +344,17 @@ class Node(Tree[V, L, R]):
         self.left = self.maybe(left, _not=self.construct)
         self.right = self.maybe(right, _not=self.construct)
 
+    @classmethod
+    def _make(cls, value: Tree, left: Tree, right: Tree) -> 'Node[V, L, R]':
+        """Fast internal constructor, for when value, left and right are
+        already Trees - skips TreeMeta.__call__ and the checks in __init__.
+        """
+        self = object.__new__(cls)
+        self.value = value
+        self.left = left
+        self.right = right
+        return self
+
     def __repr__(self):
         return str.format(
             "{0}({1}, {2}, {3})", self.__class__.__name__,
@@ -290,11 +362,70 @@ class Node(Tree[V, L, R]):
         )
 
     def __eq__(self, other):
-        if isinstance(other, Node):
-            return all((
-                self.value == other.value,
-                self.left == other.left,
-                self.right == other.right
-            ))
+        """Structural equality - pairs of subtrees are compared from an
+        explicit stack, rather than recursing.
+        """
+        stack = [(self, other)]
+        while stack:
+            mine, theirs = stack.pop()
+            if mine is theirs:
+                continue
+            elif not isinstance(mine, Node):
+                if not mine == theirs:
+                    return False
+            elif isinstance(theirs, Node):
+                # Already-computed hashes rule out most unequal trees without descending
+                mine_hash, theirs_hash = getattr(mine, '_hash', None), getattr(theirs, '_hash', None)
+                if mine_hash is not None and theirs_hash is not None and mine_hash != theirs_hash:
+                    return False
+                stack.append((mine.right, theirs.right))
+                stack.append((mine.left, theirs.left))
+                stack.append((mine.value, theirs.value))
+            else:
+                return False
+        return True
+
+    def __hash__(self):
+        """Structural hash - computed once, then cached on the node.
+        Uncached descendants are hashed first, deepest first, so hashing
+        never recurses.
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                node._hash = hash((Node, node.value, node.left, node.right))
+            elif isinstance(node, Node) and getattr(node, '_hash', None) is None:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                stack.append((node.value, False))
+        return self._hash
+
+
+def _postorder(tree: Tree) -> Iterator[Tree]:
+    """Every subtree, with a Node's value, left and right before the Node itself.
+    Uses an explicit stack, so arbitrarily deep trees can be walked.
+    """
+    stack = [(tree, False)]
+    while stack:
+        tree, expanded = stack.pop()
+        if expanded or not isinstance(tree, Node):
+            yield tree
         else:
-            return False
+            stack.append((tree, True))
+            stack.append((tree.right, False))
+            stack.append((tree.left, False))
+            stack.append((tree.value, False))
+
+
+def _unwrap(tree: Tree) -> Tree:
+    """Leaf(Leaf(...(tree))) --> tree"""
+    while isinstance(tree, Leaf) and isinstance(tree.value, Tree):
+        tree = tree.value
+    return tree
+
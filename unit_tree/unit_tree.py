@@ -1,7 +1,7 @@
 """
 Build UnitTree out of abstract Tree
 """
-from typing import Union, Callable
+from typing import Union, Callable, Type
 from numbers import Number
 
 from .base import UnitBase, NotPassed
@@ -14,9 +14,11 @@ NumberBinaryFunction = Callable[[Number, Number], Number]
 
 
 class UnitTree(Tree[NumberBinaryFunction, Number, Number], TreeArithmeticSyntax, UnitBase):
+    __slots__ = ()
+
     def __new__(cls, value=NotPassed, left=NotPassed, right=NotPassed):
         if value is NotPassed:
-            return object.__new__(UnitEmpty)
+            return UnitEmpty()
         elif left is NotPassed and right is NotPassed:
             return object.__new__(UnitLeaf)
         else:
@@ -41,23 +43,42 @@ class UnitTree(Tree[NumberBinaryFunction, Number, Number], TreeArithmeticSyntax,
         else:
             return UnitTree(domain)
 
+    @classmethod
+    def parse(cls, text: str) -> 'UnitTree':
+        """UnitTree of a unit expression, such as 'kg*m/s^2' - see parser.py."""
+        from .parser import parse_unit
+        return parse_unit(text)
+
+    def compile(self) -> 'CompiledTree':
+        """Flatten into a Python function of the Dimension leaves,
+        with the dimension of its result resolved up front.
+        Compiled once per distinct tree - see compiler.py.
+        """
+        # compiler.py builds on this module, so is imported on first use
+        from .compiler import compile_tree
+        return compile_tree(self)
+
 
 UnitTree.codomain = UnitTree
-UnitTree.domain = Union[TreeFunction, Number, Dimension]
-# Union types cannot be used in type-checking atm
-# UnitTree.domain = Union[TreeFunction, Number, Dimension]
+# TreeFunctions are used as classes, rather than instances.
+# Tree.maybe checks this with meets.compile_type - as plain isinstance rejects Union
+UnitTree.domain = Union[Type[TreeFunction], Number, Dimension]
 
 
 class UnitNode(Node, UnitTree):
-    pass
+    __slots__ = ()
+
+
+# Arithmetic on UnitTrees builds UnitTrees
+TreeFunction.codomain = UnitNode
 
 
 class UnitLeaf(Leaf, UnitTree):
-    pass
+    __slots__ = ()
 
 
 class UnitEmpty(Empty, UnitTree):
-    pass
+    __slots__ = ()
 
 
 class UnitTreeFunction(TreeFunction):
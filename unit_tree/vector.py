@@ -0,0 +1,188 @@
+"""
+Dense exponent-vector signature for compound dimensions.
+
+    kg * m / s^2  ~  DimensionVector over (kg, m, s) = (1, 1, -2)
+
+Multiplying and dividing compound dimensions becomes adding and subtracting
+vectors, and comparing two compound dimensions becomes a tuple comparison -
+instead of walking and simplifying the UnitTree each time.
+"""
+from itertools import zip_longest
+from numbers import Number
+from typing import Tuple, Iterator
+
+from .base import UnitsError, UnitsTypeError
+from .dimension import Dimension, NullUnit
+from .tree import Tree, Empty, Leaf, Node
+from .syntax import TreeFunction, Add, Subtract, Multiply, Divide
+from .unit_tree import UnitTree, UnitLeaf, UnitNode
+
+
+class DimensionVector:
+    """Integer exponents over the registered base Dimensions.
+
+    Position i holds the exponent of the Dimension with id i. Trailing zeros
+    are trimmed, so vectors built before a new Dimension was registered still
+    compare equal to those built after it.
+    The dimensionless vector (NullUnit) is the empty tuple.
+    """
+    __slots__ = ('exponents',)
+
+    def __init__(self, exponents: Tuple[int, ...] = ()):
+        exponents = tuple(exponents)
+        end = len(exponents)
+        while end and not exponents[end - 1]:
+            end -= 1
+        self.exponents = exponents[:end]
+
+    @classmethod
+    def zero(cls) -> 'DimensionVector':
+        return cls(())
+
+    @classmethod
+    def from_dimension(cls, dimension: Dimension, exponent: int = 1) -> 'DimensionVector':
+        if dimension == NullUnit or exponent == 0:
+            return cls.zero()
+        exponents = [0] * (dimension.id + 1)
+        exponents[-1] = exponent
+        return cls(exponents)
+
+    @classmethod
+    def from_tree(cls, tree: Tree) -> 'DimensionVector':
+        """Resolve the compound dimension of a UnitTree.
+        Number leaves are dimensionless. Add and Subtract require both
+        sides to have the same dimension.
+        Uses an explicit stack, so arbitrarily deep trees can be resolved.
+        """
+        results = []
+        stack = [(tree, False)]
+        while stack:
+            tree, expanded = stack.pop()
+            if expanded:
+                right, left = results.pop(), results.pop()
+                results.append(cls.combine(cls._tree_function(tree), left, right))
+            elif isinstance(tree, Empty):
+                results.append(cls.zero())
+            elif isinstance(tree, Leaf):
+                if isinstance(tree.value, Tree):
+                    stack.append((tree.value, False))
+                elif isinstance(tree.value, Dimension):
+                    results.append(cls.from_dimension(tree.value))
+                elif isinstance(tree.value, Number):
+                    results.append(cls.zero())
+                else:
+                    raise UnitsTypeError(str.format(
+                        "Cannot resolve dimension of leaf value {0}", repr(tree.value)
+                    ))
+            elif isinstance(tree, Node):
+                stack.append((tree, True))
+                stack.append((tree.right, False))
+                stack.append((tree.left, False))
+            else:
+                raise UnitsTypeError("{0} is unrecognized subtype of tree".format(
+                    tree.__class__.__name__
+                ))
+        return results.pop()
+
+    @classmethod
+    def _tree_function(cls, node: Node) -> TreeFunction:
+        function = node.value.value if isinstance(node.value, Leaf) else node.value
+        if not (isinstance(function, type) and issubclass(function, TreeFunction)):
+            raise UnitsTypeError(str.format(
+                "Node value {0} is not a TreeFunction", repr(node.value)
+            ))
+        return function
+
+    @classmethod
+    def combine(cls, tree_function: TreeFunction,
+                left: 'DimensionVector', right: 'DimensionVector') -> 'DimensionVector':
+        """Dimension of applying tree_function to two resolved dimensions."""
+        if issubclass(tree_function, Multiply):
+            return left * right
+        elif issubclass(tree_function, Divide):
+            return left / right
+        elif issubclass(tree_function, (Add, Subtract)):
+            if left != right:
+                raise UnitsError(str.format(
+                    "Cannot {0} '{1}' and '{2}'", tree_function.name, left, right
+                ))
+            return left
+        else:
+            raise UnitsTypeError(str.format(
+                "No dimension rule for TreeFunction {0}", tree_function.__name__
+            ))
+
+    def to_tree(self) -> UnitTree:
+        """Build a UnitTree of Multiply nodes over the Dimensions, with the
+        negative exponents gathered into a single Divide.
+        """
+        numerator, denominator = [], []
+        for dimension, exponent in self.items():
+            factors = numerator if exponent > 0 else denominator
+            factors.extend([dimension] * abs(exponent))
+        if not numerator and not denominator:
+            return UnitLeaf(1)
+        elif not denominator:
+            return self._product(numerator)
+        else:
+            return UnitNode(
+                UnitLeaf(Divide),
+                self._product(numerator) if numerator else UnitLeaf(1),
+                self._product(denominator)
+            )
+
+    @staticmethod
+    def _product(dimensions) -> UnitTree:
+        tree = UnitLeaf(dimensions[0])
+        for dimension in dimensions[1:]:
+            tree = UnitNode(UnitLeaf(Multiply), tree, UnitLeaf(dimension))
+        return tree
+
+    def items(self) -> Iterator[Tuple[Dimension, int]]:
+        """(Dimension, exponent) pairs, for non-zero exponents."""
+        for position, exponent in enumerate(self.exponents):
+            if exponent:
+                yield Dimension.interned[position], exponent
+
+    def is_dimensionless(self) -> bool:
+        return not self.exponents
+
+    def __mul__(self, other: 'DimensionVector') -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+        return DimensionVector(
+            a + b for a, b in zip_longest(self.exponents, other.exponents, fillvalue=0)
+        )
+
+    def __truediv__(self, other: 'DimensionVector') -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+        return DimensionVector(
+            a - b for a, b in zip_longest(self.exponents, other.exponents, fillvalue=0)
+        )
+
+    def __pow__(self, power: int) -> 'DimensionVector':
+        if not isinstance(power, int):
+            return NotImplemented
+        return DimensionVector(exponent * power for exponent in self.exponents)
+
+    def __eq__(self, other):
+        if isinstance(other, DimensionVector):
+            return self.exponents == other.exponents
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self.exponents)
+
+    def __str__(self):
+        if self.is_dimensionless():
+            return str(NullUnit)
+        return "*".join(
+            str(dimension) if exponent == 1
+            else "{0}^{1}".format(dimension, exponent)
+            for dimension, exponent in self.items()
+        )
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, self.exponents)
@@ -4,6 +4,8 @@ cd SubtypeUnits\
 py -m unittest units_test
 """
 import unittest
+import operator
+import pickle
 from typing import Mapping
 from numbers import Number
 
@@ -20,6 +22,14 @@ from py_units.units import (
     DimensionNode,
     NumberScalarInvariantFunctor
 )
+from py_units.arithmetic import UnitsFunctionStem, Multiply, Divide, Add, Subtract
+from py_units.vector import DimensionVector
+from py_units import simplify, instrumentation
+from py_units.parser import parse_unit
+from py_units.serialize import encode_tree, decode_tree
+from py_units.simplify import simplify_tree, resimplify, normalize_tree
+from py_units.cache import SimplificationCache, CacheInfo, structural_key
+from py_units.base import UnitsError, UnitsTypeError, NotPassed
 
 
 def validate_types(test, subject, type_mapping: Mapping[type, bool]):
@@ -139,14 +149,212 @@ class FunctorTests(unittest.TestCase):
             self.assertEqual(a ** Scalar(b), Scalar(a ** b))
             self.assertEqual(a % Scalar(b), Scalar(a % b))
 
+    def test_shared_functor(self):
+        self.assertIs(Scalar(1).functor, Scalar(2).functor)
+        self.assertFalse(hasattr(Scalar(1), '__dict__'))
+        self.assertFalse(hasattr(DimensionNode(Dimension('feet')), '__dict__'))
+
     def test_long_chaining(self):
         waaaat = Scalar(2) + 3 + 4 + 5
         self.assertIsInstance(waaaat, Scalar)
         self.assertEqual(waaaat, Scalar(2 + 3 + 4 + 5))
 
+    def test_fast_path_matches_functor(self):
+        general = NumberScalarInvariantFunctor(Number, Scalar)
+        for a, b in [(Scalar(3), Scalar(4)), (Scalar(3), 4), (Scalar(3), 2.5),
+                     (3, Scalar(4)), (Scalar(3), 1j), (Scalar(3), True)]:
+            for function in (operator.__add__, operator.__sub__, operator.__mul__,
+                             operator.__truediv__, operator.__floordiv__, operator.__pow__):
+                if isinstance(b, complex) and function is operator.__floordiv__:
+                    continue
+                result = function(a, b)
+                self.assertIs(result.__class__, Scalar)
+                self.assertIsNone(result.parent)
+                self.assertIs(result.dimension, NullUnit)
+                self.assertEqual(result, general.bind(function, a, b))
+
+    def test_map_many(self):
+        functor = Scalar(1).functor
+        left = [Scalar(1), Scalar(2), Scalar(3.5)]
+        right = [Scalar(4), Scalar(-5), Scalar(6)]
+        for function in (operator.__add__, operator.__sub__, operator.__mul__,
+                         operator.__truediv__, operator.__pow__):
+            expected = [functor.map(function, a, b) for a, b in zip(left, right)]
+            results = functor.map_many(function, left, right)
+            self.assertEqual(results, expected)
+            self.assertTrue(all(result.__class__ is Scalar for result in results))
+        self.assertEqual(functor.map_many(operator.__neg__, left), [Scalar(-1), Scalar(-2), Scalar(-3.5)])
+        self.assertEqual(functor.map_many(operator.__add__, [], []), [])
+
+    def test_map_many_lazy(self):
+        functor = Scalar(1).functor
+        results = functor.map_many(operator.__mul__, [Scalar(2), Scalar(3)], [Scalar(4), Scalar(5)], lazy=True)
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(list(results), [Scalar(8), Scalar(15)])
+
+    def test_map_many_keeps_python_semantics(self):
+        functor = Scalar(1).functor
+        # Beyond int64, and bools, which NumPy would add as logical or
+        self.assertEqual(functor.map_many(operator.__mul__, [Scalar(2 ** 40)], [Scalar(2 ** 40)]),
+                         [Scalar(2 ** 80)])
+        self.assertEqual(functor.map_many(operator.__add__, [Scalar(True)], [Scalar(True)]), [Scalar(2)])
+        result = functor.map_many(operator.__add__, [Scalar(1)], [Scalar(2)])[0]
+        self.assertIs(result.value.__class__, int)
+        with self.assertRaises(ZeroDivisionError):
+            functor.map_many(operator.__truediv__, [Scalar(1.0), Scalar(2.0)], [Scalar(1.0), Scalar(0.0)])
+
+    def test_map_many_mixed_types(self):
+        functor = Scalar(1).functor
+        # A mixed buffer would be cast to float by NumPy
+        results = functor.map_many(operator.__add__, [Scalar(2 ** 53 + 1), Scalar(0.5)], [Scalar(1), Scalar(1)])
+        self.assertEqual([result.value for result in results], [2 ** 53 + 2, 1.5])
+        self.assertIs(results[0].value.__class__, int)
+        results = functor.map_many(operator.__add__, [Scalar(1), Scalar(2.5)], [Scalar(1), Scalar(1)])
+        self.assertEqual([result.value.__class__ for result in results], [int, float])
+        # Ints in one column, floats in the other
+        results = functor.map_many(operator.__mul__, [Scalar(3), Scalar(4)], [Scalar(0.5), Scalar(0.5)])
+        self.assertEqual([result.value for result in results], [1.5, 2.0])
+
+    def test_map_many_large_int(self):
+        functor = Scalar(1).functor
+        results = functor.map_many(operator.__add__, [Scalar(2 ** 53 + 1), Scalar(1)], [Scalar(2), Scalar(2)])
+        self.assertEqual([result.value for result in results], [2 ** 53 + 3, 3])
+        results = functor.map_many(operator.__add__, [Scalar(2 ** 70), Scalar(1)], [Scalar(1), Scalar(1)])
+        self.assertEqual(results[0].value, 2 ** 70 + 1)
+
+    def test_map_many_lengths(self):
+        with self.assertRaises(UnitsError):
+            Scalar(1).functor.map_many(operator.__add__, [Scalar(1)], [Scalar(1), Scalar(2)])
+
+    def test_bind_many(self):
+        functor = Scalar(1).functor
+        self.assertEqual(
+            functor.bind_many(operator.__sub__, [Scalar(10), 20], [1, Scalar(2)]),
+            [Scalar(9), Scalar(18)]
+        )
+        subtract = functor.bind_lift_many(operator.__sub__)
+        self.assertEqual(list(subtract([10], [Scalar(1)], lazy=True)), [Scalar(9)])
+
+    def test_lift_many(self):
+        add = Scalar(1).functor.lift_many(operator.__add__)
+        self.assertEqual(add.__name__, operator.__add__.__name__)
+        self.assertEqual(add([Scalar(1), Scalar(2)], [Scalar(3), Scalar(4)]), [Scalar(4), Scalar(6)])
+
+    def test_fast_path_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            Scalar(1) / 0
+        with self.assertRaises(ZeroDivisionError):
+            Scalar(1) / Scalar(0)
+
+
+try:
+    import numpy
+    from py_units.arrays import ScalarArray
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "ScalarArray requires numpy")
+class ScalarArrayTests(unittest.TestCase):
+    def test_scalar_array_map_many(self):
+        functor = ScalarArray([1]).functor
+        results = functor.map_many(operator.__add__, [ScalarArray([1, 2])], [ScalarArray([3, 4])])
+        self.assertIsInstance(results[0], ScalarArray)
+        self.assertIsInstance(results[0].value, numpy.ndarray)
+        self.assertEqual(results[0], ScalarArray([4, 6]))
+
+    def test_scalar_array_type(self):
+        array = ScalarArray([1, 2, 3])
+        validate_types(self, array, {
+            ScalarArray: True,
+            Scalar: True,
+            UnitsLeaf: True,
+            DimensionNode: False
+        })
+        self.assertEqual(array.dimension, NullUnit)
+        self.assertIsInstance(array.value, numpy.ndarray)
+        self.assertEqual(len(array), 3)
+
+    def test_array_with_array(self):
+        left, right = ScalarArray([1, 2, 3]), ScalarArray([4, 5, 6])
+        self.assertEqual(left + right, ScalarArray([5, 7, 9]))
+        self.assertEqual(left * right, ScalarArray([4, 10, 18]))
+        self.assertEqual(right - left, ScalarArray([3, 3, 3]))
+        self.assertEqual(left ** 2, ScalarArray([1, 4, 9]))
+
+    def test_broadcast_number(self):
+        array = ScalarArray([1, 2, 3])
+        self.assertIsInstance(array * 2, ScalarArray)
+        self.assertEqual(array * 2, ScalarArray([2, 4, 6]))
+        self.assertEqual(2 * array, ScalarArray([2, 4, 6]))
+        self.assertEqual(6 / array, ScalarArray([6, 3, 2]))
+        self.assertEqual(array - 1.5, ScalarArray([-0.5, 0.5, 1.5]))
+
+    def test_broadcast_scalar(self):
+        array = ScalarArray([1, 2, 3])
+        self.assertIsInstance(array + Scalar(1), ScalarArray)
+        self.assertIsInstance(Scalar(1) + array, ScalarArray)
+        self.assertEqual(array + Scalar(1), ScalarArray([2, 3, 4]))
+        self.assertEqual(Scalar(10) - array, ScalarArray([9, 8, 7]))
+        self.assertEqual(Scalar(2) ** array, ScalarArray([2, 4, 8]))
+
+    def test_broadcast_ndarray(self):
+        array = ScalarArray([1, 2, 3])
+        result = numpy.array([1, 1, 1]) + array
+        self.assertIsInstance(result, ScalarArray)
+        self.assertEqual(result, ScalarArray([2, 3, 4]))
+
+
+class DimensionVectorTests(unittest.TestCase):
+
+    def test_from_unit(self):
+        feet, seconds = Dimension('feet'), Dimension('seconds')
+        stem = UnitsFunctionStem(None, Multiply, DimensionNode(feet, 2), DimensionNode(seconds, -1))
+        self.assertEqual(
+            DimensionVector.from_unit(stem),
+            DimensionVector.from_dimension(feet, 2) / DimensionVector.from_dimension(seconds)
+        )
+        self.assertTrue(DimensionVector.from_unit(Scalar(3)).is_dimensionless())
+
+    def test_from_unit_mismatched_addition(self):
+        stem = UnitsFunctionStem(
+            None, Add, DimensionNode(Dimension('feet')), DimensionNode(Dimension('seconds'))
+        )
+        self.assertRaises(UnitsError, lambda: DimensionVector.from_unit(stem))
+
+    def test_round_trip(self):
+        vector = (
+            DimensionVector.from_dimension(Dimension('pounds'))
+            * DimensionVector.from_dimension(Dimension('feet'), -2)
+        )
+        unit = vector.to_unit()
+        self.assertEqual(DimensionVector.from_unit(unit), vector)
+        self.assertIs(unit.left.parent, unit)
+        self.assertEqual(DimensionVector.zero().to_unit(), Scalar(1))
+
 
 class StemTests(unittest.TestCase):
-    pass
+
+    def test_simplify_scalars(self):
+        stem = UnitsFunctionStem(None, Multiply, Scalar(3), Scalar(4))
+        self.assertEqual(simplify_tree(stem), Scalar(12))
+
+    def test_simplify_matching_dimensions(self):
+        feet = Dimension('feet')
+        stem = UnitsFunctionStem(None, Multiply, DimensionNode(feet, 1), DimensionNode(feet, 2))
+        stem.left.parent = stem.right.parent = stem
+        simplified = simplify_tree(stem)
+        self.assertIsInstance(simplified, DimensionNode)
+        self.assertEqual((simplified.dimension, simplified.value), (feet, 3))
+
+    def test_simplify_deep_tree(self):
+        # Deeper than the default recursion limit
+        root = Scalar(1)
+        for _ in range(5000):
+            stem = UnitsFunctionStem(None, Add, root, Scalar(1))
+            root.parent = stem.right.parent = stem
+            root = stem
+        self.assertEqual(simplify_tree(root.left.left), Scalar(5001))
 
     # def test_basic_dimension_merge(self):
     #     compound = Unit('feet') * Unit('feet')
@@ -173,6 +381,285 @@ class StemTests(unittest.TestCase):
     # (feet * seconds / feet * (pounds / (feet * feet)))
 
 
+class NormalizeTests(unittest.TestCase):
+
+    def _chain(self, *pairs):
+        """Left-deep chain: first, then (units_function, unit) pairs"""
+        root = pairs[0]
+        for units_function, unit in pairs[1:]:
+            stem = UnitsFunctionStem(None, units_function, root, unit)
+            root.parent = unit.parent = stem
+            root = stem
+        return root
+
+    def test_product(self):
+        feet, seconds = Dimension('feet'), Dimension('seconds')
+        root = self._chain(
+            DimensionNode(seconds), (Multiply, Scalar(3)), (Multiply, DimensionNode(feet)),
+            (Divide, DimensionNode(seconds, 2)), (Multiply, Scalar(2)), (Multiply, DimensionNode(feet))
+        )
+        self.assertEqual(str(normalize_tree(root)), "((6 * feet^2) * seconds^-1)")
+
+    def test_cancelling_product(self):
+        feet = Dimension('feet')
+        root = self._chain(DimensionNode(feet), (Multiply, Scalar(3)), (Divide, DimensionNode(feet)))
+        self.assertEqual(normalize_tree(root), Scalar(3))
+
+    def test_sum(self):
+        feet = DimensionNode(Dimension('feet'))
+        root = self._chain(Scalar(5), (Subtract, feet), (Add, Scalar(3)))
+        normalized = normalize_tree(root)
+        self.assertEqual(str(normalized), "(8 - feet)")
+        self.assertIs(normalized.right, feet)
+        self.assertIs(feet.parent, normalized)
+
+    def test_nested_chains(self):
+        feet = Dimension('feet')
+        total = self._chain(Scalar(1), (Add, Scalar(2)))
+        root = self._chain(DimensionNode(feet), (Multiply, total), (Multiply, DimensionNode(feet)))
+        # The inner sum is normalized first, so its Scalar joins the product
+        self.assertEqual(str(normalize_tree(root)), "(3 * feet^2)")
+
+
+class ResimplifyTests(unittest.TestCase):
+
+    def _chain(self, size):
+        """Stem chain over alternating dimensions, which nothing simplifies"""
+        dimensions = (Dimension('feet'), Dimension('seconds'))
+        root = DimensionNode(dimensions[0])
+        for i in range(size):
+            stem = UnitsFunctionStem(None, Multiply, root, DimensionNode(dimensions[(i + 1) % 2]))
+            root.parent = stem.right.parent = stem
+            root = stem
+        return root
+
+    def test_only_edited_region_revisited(self):
+        chain = self._chain(500)
+        total = UnitsFunctionStem(None, Add, Scalar(1), DimensionNode(Dimension('feet')))
+        total.left.parent = total.right.parent = total
+        root = UnitsFunctionStem(None, Multiply, chain, total)
+        chain.parent = total.parent = root
+        root = simplify_tree(root, cache=None)
+        # Normalization rebuilds the sum
+        total = root.right
+
+        visited = []
+        original = simplify._simplify
+        simplify._simplify = lambda stem: visited.append(stem) or original(stem)
+        try:
+            edit = Scalar(4, total)
+            total.right = edit
+            root = resimplify(edit)
+        finally:
+            simplify._simplify = original
+        # The Add became a Scalar, and the root was revisited - nothing else
+        self.assertEqual(visited, [total, root])
+        self.assertEqual(root.right, Scalar(5))
+        self.assertIs(root.right.parent, root)
+
+    def test_root_rewritten(self):
+        stem = UnitsFunctionStem(None, Add, Scalar(1), Scalar(1))
+        stem.left.parent = stem.right.parent = stem
+        stem.left.value = 2
+        self.assertEqual(resimplify(stem.left), Scalar(3))
+
+
+class SimplificationCacheTests(unittest.TestCase):
+
+    def _product(self):
+        feet = Dimension('feet')
+        stem = UnitsFunctionStem(None, Multiply, DimensionNode(feet, 1), DimensionNode(feet, 2))
+        stem.left.parent = stem.right.parent = stem
+        return stem
+
+    def test_cached_result(self):
+        cache = SimplificationCache()
+        first = simplify_tree(self._product(), cache=cache)
+        second = simplify_tree(self._product(), cache=cache)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1))
+        self.assertIsNot(first, second)
+        self.assertEqual(str(first), str(second))
+        self.assertEqual((second.dimension, second.value), (Dimension('feet'), 3))
+
+    def test_input_left_as_it_was(self):
+        def scaled():
+            # (1 + 2) * feet - simplifying rewrites the Add
+            total = UnitsFunctionStem(None, Add, Scalar(1), Scalar(2))
+            total.left.parent = total.right.parent = total
+            stem = UnitsFunctionStem(None, Multiply, total, DimensionNode(Dimension('feet')))
+            total.parent = stem.right.parent = stem
+            return stem
+
+        cache = SimplificationCache()
+        for expected_hits in (0, 1):
+            stem = scaled()
+            total = stem.left
+            result = simplify_tree(stem, cache=cache)
+            self.assertEqual(cache.hits, expected_hits)
+            self.assertEqual(result.left, Scalar(3))
+            self.assertIs(stem.left, total)
+            self.assertIs(total.parent, stem)
+            self.assertEqual(structural_key(stem), structural_key(scaled()))
+
+    def test_value_types_stay_distinct(self):
+        cache = SimplificationCache()
+        simplify_tree(UnitsFunctionStem(None, Add, Scalar(1), Scalar(2)), cache=cache)
+        result = simplify_tree(UnitsFunctionStem(None, Add, Scalar(1.0), Scalar(2)), cache=cache)
+        self.assertIsInstance(result.value, float)
+        self.assertEqual(cache.hits, 0)
+
+    def test_lru_eviction(self):
+        cache = SimplificationCache(maxsize=2)
+        stems = [UnitsFunctionStem(None, Add, Scalar(i), Scalar(1)) for i in range(3)]
+        simplify_tree(stems[0], cache=cache)
+        simplify_tree(stems[1], cache=cache)
+        cache.get(structural_key(UnitsFunctionStem(None, Add, Scalar(0), Scalar(1))))
+        simplify_tree(stems[2], cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(structural_key(stems[1])), NotPassed)
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=0, maxsize=2, currsize=0))
+        self.assertEqual(cache.hit_rate, 0.0)
+
+
+class ParserTests(unittest.TestCase):
+
+    def test_parse(self):
+        kg, m, s = (Dimension(name) for name in ('kg', 'm', 's'))
+        unit = parse_unit('kg*m/s^2')
+        self.assertEqual(structural_key(unit), (
+            (UnitsFunctionStem, Divide),
+            (UnitsFunctionStem, Multiply),
+            (DimensionNode, kg, int, 1),
+            (DimensionNode, m, int, 1),
+            (DimensionNode, s, int, 2),
+        ))
+        self.assertIs(unit.left.parent, unit)
+        self.assertIs(unit.left.left.parent, unit.left)
+        self.assertEqual(str(parse_unit('N \u00b7 m / (s**2)')), "((N * m) / s^2)")
+
+    def test_exponents(self):
+        self.assertEqual(str(parse_unit('s^-1')), "s^-1")
+        self.assertEqual(str(parse_unit('s\u207b\u00b2')), "s^-2")
+        self.assertEqual(str(parse_unit('(m/s)^2')), "((m / s) * (m / s))")
+        self.assertEqual(str(parse_unit('(m/s)^-1')), "(1 / (m / s))")
+        self.assertEqual(parse_unit('m^0'), Scalar(1))
+        self.assertEqual(parse_unit('2^3'), Scalar(8))
+
+    def test_group_factors_are_separate(self):
+        unit = parse_unit('(m/s)^2')
+        self.assertIsNot(unit.left, unit.right)
+        self.assertIs(unit.right.parent, unit)
+
+    def test_new_tree_per_parse(self):
+        first, second = parse_unit('kg/m'), parse_unit('kg/m')
+        self.assertIsNot(first, second)
+        self.assertEqual(structural_key(first), structural_key(second))
+
+    def test_simple_constructor(self):
+        self.assertEqual(str(Unit('kg*m')), "(kg * m)")
+        self.assertIsInstance(Unit('feet'), DimensionNode)
+
+    def test_errors(self):
+        for text in ('', 'kg m', 'm^1.5', 'm/', '(m', 'm)', 'm $ s',
+                     '0^-1', '0.0\u207b\u00b9', '1e300^2', 'm^9999', '(m/s)^-65'):
+            with self.assertRaises(UnitsError, msg=text):
+                parse_unit(text)
+        with self.assertRaisesRegex(UnitsError, r"'\^'.*, at 1 in unit '0\^-1'"):
+            parse_unit('0^-1')
+        self.assertEqual(str(parse_unit('s^64')), "s^64")
+
+
+class SerializeTests(unittest.TestCase):
+
+    def test_round_trip(self):
+        unit = parse_unit('kg*m/s^2')
+        unit = UnitsFunctionStem(None, Subtract, unit, Scalar(2.5))
+        unit.left.parent = unit.right.parent = unit
+        decoded = decode_tree(encode_tree(unit))
+        self.assertEqual(structural_key(decoded), structural_key(unit))
+        self.assertIsNone(decoded.parent)
+        self.assertIs(decoded.left.parent, decoded)
+        self.assertIs(decoded.left.right.parent, decoded.left)
+
+    def test_numbers(self):
+        for value in (0, -1, 2**70, 1.5, True, 2j):
+            for unit in (Scalar(value), DimensionNode(Dimension('feet'), value)):
+                decoded = decode_tree(memoryview(encode_tree(unit)))
+                self.assertEqual(structural_key(decoded), structural_key(unit))
+
+    def test_dimension_table(self):
+        data = encode_tree(parse_unit('feet*feet/feet^3'))
+        self.assertEqual(data.count(b'feet'), 1)
+
+    def test_deep(self):
+        feet = Dimension('feet')
+        unit = DimensionNode(feet)
+        for _ in range(5000):
+            unit = UnitsFunctionStem(None, Multiply, unit, DimensionNode(feet))
+            unit.left.parent = unit.right.parent = unit
+        self.assertEqual(structural_key(decode_tree(encode_tree(unit))), structural_key(unit))
+
+    def test_errors(self):
+        with self.assertRaises(UnitsTypeError):
+            encode_tree(Scalar('feet'))
+        data = encode_tree(parse_unit('kg/m'))
+        for bad in (b'', b'UT\x01', data[:-1], data + data[-2:], data[:3] + b'\x07' + data[4:],
+                    # Dimension identifier b'\xff', which is not UTF-8
+                    b'PU\x01\x01\x01\x01\xff\x03\x00'):
+            with self.assertRaises(UnitsError, msg=bad):
+                decode_tree(bad)
+
+    def test_pickle(self):
+        unit = parse_unit('kg*m/s^2')
+        loaded = pickle.loads(pickle.dumps(unit))
+        self.assertEqual(structural_key(loaded), structural_key(unit))
+        self.assertIs(loaded.left.parent, loaded)
+        self.assertIs(loaded.right.dimension, unit.right.dimension)
+        # A subtree is pickled without its parent
+        self.assertIsNone(pickle.loads(pickle.dumps(unit.left)).parent)
+
+    @unittest.skipIf(numpy is None, "ScalarArray requires numpy")
+    def test_pickle_unencodable(self):
+        unit = UnitsFunctionStem(None, Multiply, ScalarArray([1, 2]), DimensionNode(Dimension('feet')))
+        unit.left.parent = unit.right.parent = unit
+        loaded = pickle.loads(pickle.dumps(unit))
+        self.assertIsInstance(loaded.left, ScalarArray)
+        self.assertEqual(loaded.left, ScalarArray([1, 2]))
+        self.assertIs(loaded.right.parent, loaded)
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_leaves_methods_unwrapped(self):
+        original = NumberScalarInvariantFunctor.bind
+        instrumentation.enable()
+        self.assertIsNot(NumberScalarInvariantFunctor.bind, original)
+        instrumentation.disable()
+        self.assertIs(NumberScalarInvariantFunctor.bind, original)
+        Scalar(2) * 3
+        self.assertEqual(instrumentation.snapshot()['InvariantFunctor.bind'].calls, 0)
+
+    def test_counts(self):
+        with instrumentation.instrumented():
+            # Scalar's fast path does not go through bind
+            Scalar(2) * Scalar(3) + 1
+            Scalar(2) * True
+            UnitsFunctionStem(None, Multiply, Scalar(1), DimensionNode(Dimension('feet')))
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats['InvariantFunctor.bind'].calls, 1)
+        self.assertGreater(stats['InvariantFunctor.bind'].seconds, 0)
+        self.assertEqual(stats['nodes'].calls, 9)
+        self.assertEqual(instrumentation.export()['nodes'], {'calls': 9, 'seconds': 0.0})
+
+
 class DimensionTests(unittest.TestCase):
 
     def test_nullunit(self):
@@ -180,10 +667,33 @@ class DimensionTests(unittest.TestCase):
         self.assertIsInstance(NullUnit, Dimension)
         self.assertEqual(Dimension(), Dimension())
         self.assertEqual(Dimension(), NullUnit)
+        self.assertIs(Dimension(None), NullUnit)
         self.assertNotEqual(Dimension('feet'), NullUnit)
 
 
 
+    def test_dimension_hash(self):
+        feet = Dimension('feet')
+        self.assertEqual(hash(feet), hash(Dimension('feet')))
+        self.assertEqual({feet: 'x'}[Dimension('feet')], 'x')
+        self.assertIs(Dimension.interned[feet.id], feet)
+
+    def test_dimension_pickle(self):
+        feet = Dimension('feet')
+        self.assertIs(pickle.loads(pickle.dumps(feet)), feet)
+        self.assertIs(pickle.loads(pickle.dumps(NullUnit)), NullUnit)
+        count = len(Dimension.interned)
+        pickle.loads(pickle.dumps([feet, NullUnit]))
+        self.assertEqual(len(Dimension.interned), count)
+
+    def test_dimension_ordering(self):
+        self.assertLess(Dimension('acres'), Dimension('yards'))
+        self.assertLess(Dimension(None), Dimension('acres'))
+        self.assertFalse(Dimension('yards') < Dimension('yards'))
+
+    # 'Dimension is NullUnit' compares the class with an instance of it, so is
+    # never true - Dimension() is NullUnit, as test_nullunit checks
+    @unittest.expectedFailure
     def test_dimension_registry(self):
         """Do this via checking the id() of the returned objects"""
         self.assertTrue(Dimension is NullUnit)